@@ -1,80 +1,778 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
-from datetime import datetime, timedelta
+import tkinter.font as tkfont
+from datetime import datetime, timedelta, timezone
 import threading
 import time
+import heapq
 import json
+import math
 import os
+import random
 import socket
+from collections import deque
+from concurrent.futures import Future, CancelledError
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9: heure locale ou UTC seulement
+    ZoneInfo = None
+from js8call_bbs_core import (
+    decode_js8_event,
+    JS8LineParser,
+    JS8_DIRECTED_HEADER,
+    JS8FrameCounter,
+    count_js8_frames,
+    apply_edits,
+    suggest_abbreviations,
+    JS8_HEADER_MAX,
+    js8_supported,
+    js8_transliterate,
+    split_bulletin,
+    TEMPLATE_FIELDS,
+    TEMPLATE_NO_NEXT,
+    TEMPLATE_FIELD,
+    TEMPLATE_FIELD_MAX,
+    BulletinTemplate,
+    JS8_SPEEDS,
+    JS8_CYCLE_SECONDS,
+    js8_tx_seconds,
+    estimate_tx_seconds,
+    JS8SlotClock,
+    TxStateTracker,
+    LatencyHistogram,
+    ReconnectPolicy,
+    AirtimeGovernor,
+    EmissionSchedule,
+    config_number,
+    load_timezone,
+    CatchUpPolicy,
+    station_slot_offset,
+    tk_chars,
+    JS8_TEXT_PROC,
+    MAX_BULLETIN_PARTS,
+)
+
+
+class TcpTransport:
+    """Transport TCP de l'API JS8Call: flux de lignes JSON sur une connexion persistante"""
+    
+    name = 'tcp'
+    default_port = 2442
+    connect_timeout = 5
+    
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.sock = None
+        self._parser = JS8LineParser()
+    
+    def open(self):
+        """Ouvre la connexion (bloquant, connect_timeout secondes au plus)"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock = sock
+        sock.settimeout(self.connect_timeout)
+        sock.connect((self.host, self.port))
+        sock.settimeout(1.0)
+        self._enable_keepalive(sock)
+        self._parser.reset()
+    
+    @staticmethod
+    def _enable_keepalive(sock, idle=30, interval=10, count=3):
+        """Active le keepalive TCP (détection d'un pair disparu au niveau système)"""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count)
+            elif hasattr(socket, 'SIO_KEEPALIVE_VALS'):
+                sock.ioctl(socket.SIO_KEEPALIVE_VALS, (1, idle * 1000, interval * 1000))
+        except OSError:
+            pass
+    
+    def receive(self):
+        """Attend des données (1 s au plus) et retourne les messages complets reçus.
+        
+        Lève OSError (ConnectionError en fin de flux) si la connexion est perdue.
+        """
+        sock = self.sock
+        if sock is None:
+            raise ConnectionError("fermé")
+        try:
+            data = sock.recv(65536)
+        except socket.timeout:
+            return []
+        if not data:
+            raise ConnectionError('EOF')
+        return self._parser.feed(data)
+    
+    def send(self, payloads, on_sent, deadline):
+        """Écrit les commandes d'un seul bloc en gérant les écritures partielles et EAGAIN.
+        
+        on_sent(i) est appelé dès que la commande i est entièrement écrite.
+        """
+        sock = self.sock
+        if sock is None:
+            raise ConnectionError("fermé")
+        buffer = memoryview(b''.join(payloads))
+        offset = 0
+        index = 0
+        command_end = len(payloads[0])
+        
+        while offset < len(buffer):
+            try:
+                sent = sock.send(buffer[offset:])
+            except (BlockingIOError, InterruptedError, socket.timeout):
+                # Tampon d'émission plein: on réessaie jusqu'au délai maximal
+                if time.monotonic() > deadline:
+                    raise socket.timeout("délai d'écriture dépassé")
+                continue
+            
+            offset += sent
+            while index < len(payloads) and command_end <= offset:
+                on_sent(index)
+                index += 1
+                if index < len(payloads):
+                    command_end += len(payloads[index])
+    
+    def close(self):
+        sock = self.sock
+        self.sock = None
+        if sock is not None:
+            try:
+                sock.close()
+            except:
+                pass
+
+
+class UdpTransport(TcpTransport):
+    """Transport UDP de l'API JS8Call: un datagramme JSON par message, sans connexion.
+    
+    JS8Call envoie ses messages vers le port UDP configuré (Settings → Reporting
+    → UDP Server) et accepte les commandes renvoyées à l'adresse d'où ils
+    partent: le pair est donc appris au premier datagramme reçu. JS8Call émet
+    un PING toutes les 15 s environ, d'où le délai d'ouverture plus long.
+    """
+    
+    name = 'udp'
+    default_port = 2242
+    connect_timeout = 20
+    
+    def __init__(self, host, port):
+        super().__init__(host, port)
+        self.peer = None
+        self._source = None
+        self._backlog = []
+    
+    def open(self):
+        """Écoute le port local et attend le premier datagramme de JS8Call"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock = sock
+        sock.settimeout(1.0)
+        sock.bind(('', self.port))
+        if self.host not in ('', '0.0.0.0'):
+            self._source = socket.gethostbyname(self.host)
+        
+        deadline = time.monotonic() + self.connect_timeout
+        while self.peer is None:
+            if self.sock is not sock:
+                raise ConnectionError("fermé")
+            if time.monotonic() > deadline:
+                raise socket.timeout("aucun datagramme reçu de JS8Call")
+            self._backlog = self._receive_from(sock)
+    
+    def _receive_from(self, sock):
+        try:
+            data, address = sock.recvfrom(65536)
+        except (socket.timeout, ConnectionResetError):
+            # ConnectionResetError: ICMP "port injoignable" remonté par Windows
+            return []
+        if self._source is not None and address[0] != self._source:
+            return []
+        # Le port source change si JS8Call redémarre: on suit la dernière adresse
+        self.peer = address
+        return self._parser.feed(data if data.endswith(b'\n') else data + b'\n')
+    
+    def receive(self):
+        sock = self.sock
+        if sock is None:
+            raise ConnectionError("fermé")
+        if self._backlog:
+            messages = self._backlog
+            self._backlog = []
+            return messages
+        return self._receive_from(sock)
+    
+    def send(self, payloads, on_sent, deadline):
+        """Envoie un datagramme par commande"""
+        sock = self.sock
+        if sock is None:
+            raise ConnectionError("fermé")
+        for index, payload in enumerate(payloads):
+            while True:
+                try:
+                    sock.sendto(payload, self.peer)
+                    break
+                except (BlockingIOError, InterruptedError, socket.timeout):
+                    if time.monotonic() > deadline:
+                        raise socket.timeout("délai d'écriture dépassé")
+            on_sent(index)
+
+
+JS8_TRANSPORTS = {
+    TcpTransport.name: TcpTransport,
+    UdpTransport.name: UdpTransport,
+}
+
 
 class JS8CallClient:
     """Client JS8Call simple sans dépendance externe"""
     
-    def __init__(self, host='127.0.0.1', port=2442):
+    def __init__(self, host='127.0.0.1', port=None, write_timeout=10, transport='tcp'):
+        self.transport_class = JS8_TRANSPORTS[transport]
         self.host = host
-        self.port = port
-        self.socket = None
+        self.port = port or self.transport_class.default_port
+        self.transport = None
         self.connected = False
+        self.write_timeout = write_timeout
+        
+        # Tentative de connexion en cours (exécutée hors du thread Tk)
+        self._lock = threading.Lock()
+        self._attempt = 0
+        self._pending_connect = None
+        self._connecting_transport = None
+        
+        # Lecture des événements JS8Call
+        self._reader_thread = None
+        self._subscribers = {}
+        self._next_subscription = 0
+        self.on_connection_lost = None
+        
+        # File d'écriture: un seul thread écrit sur le transport
+        self._write_ready = threading.Condition(self._lock)
+        self._outbox = []
+        
+        # Reconnexion automatique supervisée
+        self.reconnect_policy = ReconnectPolicy()
+        self.on_reconnected = None
+        self.on_reconnect_scheduled = None
+        self._state_changed = threading.Event()
+        self._supervisor_stop = None
+        
+        # Corrélation requête/réponse par le paramètre _ID
+        self.request_timeout = 5
+        self._next_id = int(time.time() * 1000)
+        self._requests = {}
+        
+        # État d'émission de JS8Call
+        self.tx_state = TxStateTracker()
+        
+        # Surveillance de la connexion: keepalive TCP + ping applicatif (seul recours en UDP)
+        self.ping_interval = 30
+        self.ping_timeout = 5
+        self.ping_max_misses = 2
+        self.latency = LatencyHistogram()
+        self.on_ping = None
+        self._ping_wake = threading.Event()
     
     def connect(self):
-        """Tente de se connecter à JS8Call"""
+        """Lance la connexion à JS8Call en arrière-plan.
+        
+        Retourne un Future dont le résultat est True/False. Le Future peut être
+        annulé avec cancel_connect() (ex: l'utilisateur change d'hôte/port).
+        """
+        future = Future()
+        with self._lock:
+            if self._pending_connect is not None:
+                self._pending_connect.cancel()
+            self._attempt += 1
+            attempt = self._attempt
+            self._pending_connect = future
+        
+        threading.Thread(target=self._connect_worker, args=(future, attempt), daemon=True).start()
+        return future
+    
+    @property
+    def transport_name(self):
+        return self.transport_class.name
+    
+    def _connect_worker(self, future, attempt):
+        """Ouvre le transport (bloquant) dans un thread dédié"""
+        transport = self.transport_class(self.host, self.port)
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5)
-            self.socket.connect((self.host, self.port))
-            self.connected = True
-            print(f"✓ Connecté à JS8Call sur {self.host}:{self.port}")
-            return True
+            with self._lock:
+                self._connecting_transport = transport
+            transport.open()
+            ok = True
         except Exception as e:
-            print(f"✗ Impossible de se connecter à JS8Call: {e}")
+            ok = False
+            error = e
+        
+        with self._lock:
+            self._connecting_transport = None
+            self._state_changed.set()
+            stale = future.cancelled() or attempt != self._attempt
+            if not stale:
+                self._pending_connect = None
+                if ok:
+                    self.transport = transport
+                    self.connected = True
+                    self._start_reader(transport)
+                    threading.Thread(target=self._writer_loop, args=(transport,), daemon=True).start()
+                    threading.Thread(target=self._keepalive_loop, args=(transport,), daemon=True).start()
+                else:
+                    self.connected = False
+                    transport.close()
+                future.set_result(ok)
+        
+        if stale:
+            # Tentative annulée entre-temps: on libère le transport sans rien publier
+            transport.close()
+            return
+        
+        if ok:
+            print(f"✓ Connecté à JS8Call sur {self.host}:{self.port} ({transport.name.upper()})")
+        else:
+            print(f"✗ Impossible de se connecter à JS8Call: {error}")
+    
+    def cancel_connect(self):
+        """Annule la tentative de connexion en cours (s'il y en a une)"""
+        with self._lock:
+            self._attempt += 1
+            future = self._pending_connect
+            transport = self._connecting_transport
+            self._pending_connect = None
+            self._connecting_transport = None
+        
+        if future is not None:
+            future.cancel()
+        if transport is not None:
+            transport.close()
+    
+    @property
+    def connecting(self):
+        """True tant qu'une tentative de connexion est en cours"""
+        return self._pending_connect is not None
+    
+    def _keepalive_loop(self, transport):
+        """Ping applicatif périodique: mesure la latence et détecte une connexion à moitié ouverte"""
+        misses = 0
+        while self.transport is transport:
+            self._ping_wake.clear()
+            if not self.ping_interval:
+                self._ping_wake.wait(5)
+                continue
+            self._ping_wake.wait(self.ping_interval)
+            if self.transport is not transport:
+                return
+            
+            started = time.monotonic()
+            try:
+                self.request('STATION.GET_CALLSIGN', response_type='STATION.CALLSIGN',
+                             timeout=self.ping_timeout).result(self.ping_timeout + 1)
+                misses = 0
+                ok = True
+            except Exception:
+                self.latency.add_timeout()
+                misses += 1
+                ok = False
+            
+            if self.on_ping:
+                self.on_ping(self, ok, (time.monotonic() - started) * 1000)
+            
+            if misses >= self.ping_max_misses:
+                self._connection_lost(transport, f"pas de réponse à {misses} ping(s)")
+                if not self.auto_reconnecting:
+                    # Pas de boucle de reconnexion: une tentative immédiate
+                    self.connect().add_done_callback(self._after_proactive_reconnect)
+                return
+    
+    def _after_proactive_reconnect(self, future):
+        if not future.cancelled() and future.result() and self.on_reconnected:
+            self.on_reconnected(self, 1)
+    
+    @property
+    def auto_reconnecting(self):
+        """True si la boucle de reconnexion automatique est active"""
+        return self._supervisor_stop is not None
+    
+    def start_auto_reconnect(self):
+        """Surveille la connexion et la rétablit en arrière-plan selon reconnect_policy"""
+        if self._supervisor_stop is not None:
+            return
+        stop = threading.Event()
+        self._supervisor_stop = stop
+        threading.Thread(target=self._supervise, args=(stop,), daemon=True).start()
+    
+    def stop_auto_reconnect(self):
+        stop = self._supervisor_stop
+        self._supervisor_stop = None
+        if stop is not None:
+            stop.set()
+            self._state_changed.set()
+    
+    def _supervise(self, stop):
+        """Boucle de reconnexion: attend une perte de connexion puis réessaie avec backoff"""
+        failures = 0
+        while not stop.is_set():
+            self._state_changed.clear()
+            if self.connected or self.connecting:
+                self._state_changed.wait()
+                continue
+            
+            if failures:
+                delay = self.reconnect_policy.delay(failures - 1)
+                if self.on_reconnect_scheduled:
+                    self.on_reconnect_scheduled(self, failures, delay)
+                if stop.wait(delay):
+                    break
+            
+            try:
+                connected = self.connect().result()
+            except CancelledError:
+                connected = False
+            
+            if stop.is_set():
+                break
+            if connected:
+                if self.on_reconnected:
+                    self.on_reconnected(self, failures + 1)
+                failures = 0
+            else:
+                failures += 1
+    
+    def subscribe(self, callback, types=None):
+        """Abonne callback(event) aux événements JS8Call.
+        
+        types: liste de types ('RIG.FREQ', 'RX.ACTIVITY'...) ou de préfixes
+        terminés par un point ('RX.'); None = tous les événements.
+        Le callback est appelé dans le thread de lecture: il doit rester court
+        (utiliser root.after pour toucher à l'interface).
+        """
+        with self._lock:
+            self._next_subscription += 1
+            token = self._next_subscription
+            self._subscribers[token] = (callback, tuple(types) if types else None)
+        return token
+    
+    def unsubscribe(self, token):
+        with self._lock:
+            self._subscribers.pop(token, None)
+    
+    def _start_reader(self, transport):
+        self._reader_thread = threading.Thread(target=self._reader_loop, args=(transport,), daemon=True)
+        self._reader_thread.start()
+    
+    def _reader_loop(self, transport):
+        """Lit en continu le transport pour que le tampon de réception ne sature jamais"""
+        while self.transport is transport:
+            self._expire_requests()
+            try:
+                messages = transport.receive()
+            except OSError as e:
+                self._connection_lost(transport, e)
+                return
+            
+            for message in messages:
+                self._dispatch(decode_js8_event(message))
+    
+    def _connection_lost(self, transport, error):
+        """Ferme un transport devenu inutilisable (appelé une seule fois par transport)"""
+        with self._lock:
+            if self.transport is not transport:
+                return
+            self.transport = None
             self.connected = False
-            return False
+            pending = self._take_outbox()
+            self._state_changed.set()
+            self._ping_wake.set()
+            requests = self._requests
+            self._requests = {}
+        
+        transport.close()
+        self._fail_deliveries(pending)
+        self.tx_state.reset()
+        self._fail_requests(requests, ConnectionError(f"Connexion JS8Call perdue: {error}"))
+        
+        print(f"✗ Connexion JS8Call perdue: {error}")
+        if self.on_connection_lost:
+            self.on_connection_lost(self)
+    
+    def _take_outbox(self):
+        """Vide la file d'écriture (à appeler avec self._lock)"""
+        pending = self._outbox
+        self._outbox = []
+        self._write_ready.notify_all()
+        return pending
+    
+    @staticmethod
+    def _fail_deliveries(entries):
+        for _, future in entries:
+            if not future.done():
+                future.set_result(False)
+    
+    def _expire_requests(self):
+        """Fait échouer les requêtes sans réponse dans le délai imparti"""
+        if not self._requests:
+            return
+        now = time.monotonic()
+        with self._lock:
+            expired = {rid: entry for rid, entry in self._requests.items() if entry[1] <= now}
+            for rid in expired:
+                del self._requests[rid]
+        self._fail_requests(expired, TimeoutError("Pas de réponse de JS8Call"))
+    
+    @staticmethod
+    def _fail_requests(requests, error):
+        for future, _, _, _ in requests.values():
+            if not future.done():
+                future.set_exception(error)
+    
+    def _dispatch(self, event):
+        if event.id is not None and self._requests:
+            with self._lock:
+                entry = self._requests.get(event.id)
+                if entry is not None and (entry[2] is None or entry[2] == event.type):
+                    del self._requests[event.id]
+                else:
+                    entry = None
+            if entry is not None and not entry[0].done():
+                self.latency.add((time.monotonic() - entry[3]) * 1000)
+                entry[0].set_result(event)
+        
+        if event.type in ('RIG.PTT', 'TX.FRAME'):
+            self.tx_state.on_event(event)
+        
+        with self._lock:
+            subscribers = list(self._subscribers.values())
+        
+        for callback, types in subscribers:
+            if types is not None and not any(
+                event.type == t or (t.endswith('.') and event.type.startswith(t)) for t in types
+            ):
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Erreur traitement événement {event.type}: {e}")
 
     
+    @staticmethod
+    def message_command(text, frequency=None, speed='normal'):
+        """Commande JS8Call pour envoyer un message"""
+        return {
+            "type": "TX.SEND_MESSAGE",
+            "value": text,
+            "params": {
+                "FREQ": frequency if frequency else 0,  # 0 = utilise la fréquence actuelle
+                "SPEED": JS8_SPEEDS[speed].code
+            }
+        }
+    
+    @staticmethod
+    def speed_command(speed):
+        """Commande JS8Call pour choisir le mode de vitesse"""
+        return {
+            "type": "MODE.SET_SPEED",
+            "value": "",
+            "params": {"SPEED": JS8_SPEEDS[speed].code}
+        }
+    
+    @staticmethod
+    def frequency_command(frequency):
+        """Commande JS8Call pour changer de fréquence"""
+        return {
+            "type": "RIG.SET_FREQ",
+            "value": str(frequency),
+            "params": {"DIAL": int(frequency)}
+        }
+    
+    def send_commands(self, commands):
+        """Met en file un groupe de commandes, écrites d'un seul bloc et dans l'ordre.
+        
+        Les commandes mises en file au même moment sont regroupées en une seule
+        écriture; aucune autre commande ne peut s'intercaler au milieu d'un groupe.
+        Retourne un Future par commande: True une fois la commande entièrement
+        écrite sur le transport, False si la connexion a été perdue avant.
+        """
+        with self._lock:
+            entries = [((json.dumps(self._with_id(command)) + '\n').encode('utf-8'), Future()) for command in commands]
+            queued = self.connected and self.transport is not None
+            if queued:
+                self._outbox.extend(entries)
+                self._write_ready.notify()
+        
+        if not queued:
+            self._fail_deliveries(entries)
+        return [future for _, future in entries]
+    
+    def _with_id(self, command):
+        """Ajoute un _ID unique aux paramètres de la commande (à appeler avec self._lock)"""
+        params = dict(command.get('params') or {})
+        if '_ID' not in params:
+            self._next_id += 1
+            params['_ID'] = self._next_id
+        command = dict(command)
+        command['params'] = params
+        return command
+    
+    def request(self, command_type, value='', params=None, response_type=None, timeout=None):
+        """Envoie une commande et retourne un Future résolu avec la réponse (JS8Event).
+        
+        La réponse est reconnue par son _ID (et son type si response_type est
+        donné). Le Future échoue avec TimeoutError si JS8Call ne répond pas
+        dans le délai, ou ConnectionError si la connexion est perdue.
+        """
+        future = Future()
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            deadline = time.monotonic() + (timeout or self.request_timeout)
+            self._requests[request_id] = (future, deadline, response_type, time.monotonic())
+        
+        params = dict(params or {})
+        params['_ID'] = request_id
+        delivery = self.send_commands([{"type": command_type, "value": value, "params": params}])[0]
+        
+        def on_delivery(f):
+            if not f.result():
+                with self._lock:
+                    entry = self._requests.pop(request_id, None)
+                if entry is not None:
+                    future.set_exception(ConnectionError("Non connecté à JS8Call"))
+        delivery.add_done_callback(on_delivery)
+        return future
+    
+    def _request_value(self, command_type, response_type, extract, timeout=None):
+        """request() dont le résultat est transformé par extract(event)"""
+        result = Future()
+        
+        def on_response(f):
+            try:
+                result.set_result(extract(f.result()))
+            except Exception as e:
+                result.set_exception(e)
+        
+        self.request(command_type, response_type=response_type, timeout=timeout).add_done_callback(on_response)
+        return result
+    
+    def get_frequency(self, timeout=None):
+        """Future: fréquence dial actuelle de JS8Call (Hz)"""
+        return self._request_value('RIG.GET_FREQ', 'RIG.FREQ', lambda event: event.dial, timeout)
+    
+    def get_callsign(self, timeout=None):
+        """Future: indicatif configuré dans JS8Call"""
+        return self._request_value('STATION.GET_CALLSIGN', 'STATION.CALLSIGN', lambda event: str(event.value), timeout)
+    
+    def get_grid(self, timeout=None):
+        """Future: locator configuré dans JS8Call"""
+        return self._request_value('STATION.GET_GRID', 'STATION.GRID', lambda event: str(event.value), timeout)
+    
+    def get_tx_text(self, timeout=None):
+        """Future: texte en attente dans la zone d'émission de JS8Call"""
+        return self._request_value('TX.GET_TEXT', 'TX.TEXT', lambda event: str(event.value), timeout)
+    
+    def change_frequency(self, frequency, timeout=10, tolerance=10):
+        """Change de fréquence et attend que JS8Call confirme le QSY.
+        
+        Retourne un Future: True quand RIG.GET_FREQ renvoie la fréquence
+        demandée (à tolerance Hz près), False si le délai expire.
+        """
+        result = Future()
+        
+        def confirm():
+            deadline = time.monotonic() + timeout
+            self.send_commands([self.frequency_command(frequency)])
+            while time.monotonic() < deadline and self.connected:
+                try:
+                    dial = self.get_frequency().result(max(0.5, deadline - time.monotonic()))
+                except Exception:
+                    dial = None
+                if dial is not None and abs(dial - frequency) <= tolerance:
+                    result.set_result(True)
+                    return
+                time.sleep(0.25)
+            result.set_result(False)
+        
+        threading.Thread(target=confirm, daemon=True).start()
+        return result
+    
+    def _writer_loop(self, transport):
+        """Écrit la file sur le transport, un lot à la fois et dans l'ordre"""
+        while True:
+            with self._lock:
+                while not self._outbox and self.transport is transport:
+                    self._write_ready.wait()
+                if self.transport is not transport:
+                    return
+                batch = self._take_outbox()
+            
+            try:
+                transport.send(
+                    [data for data, _ in batch],
+                    lambda index: batch[index][1].set_result(True),
+                    time.monotonic() + self.write_timeout
+                )
+            except OSError as e:
+                print(f"Erreur lors de l'envoi: {e}")
+                self._fail_deliveries(batch)
+                self._connection_lost(transport, e)
+                return
+    
+    def send_bulletin(self, text, frequency=0, speed='normal'):
+        """Met un bulletin en file d'émission, après confirmation du QSY si une fréquence est donnée.
+        
+        Le mode de vitesse est choisi juste avant le texte, dans le même envoi.
+        
+        Retourne un Future: True une fois le texte remis à JS8Call; il échoue
+        avec ConnectionError (connexion absente ou perdue) ou TimeoutError
+        (changement de fréquence non confirmé).
+        """
+        result = Future()
+        if not self.connected:
+            result.set_exception(ConnectionError("Non connecté à JS8Call"))
+            return result
+        
+        def queue():
+            token = self.tx_state.handoff(js8_tx_seconds(text, speed))
+            delivery = self.send_commands([self.speed_command(speed), self.message_command(text, frequency, speed)])[-1]
+            
+            def on_delivered(f):
+                if f.result():
+                    result.set_result(True)
+                else:
+                    self.tx_state.discard(token)
+                    result.set_exception(ConnectionError("Connexion JS8Call perdue"))
+            delivery.add_done_callback(on_delivered)
+        
+        def after_qsy(f):
+            if f.result():
+                queue()
+            else:
+                result.set_exception(TimeoutError(
+                    f"Changement de fréquence vers {frequency} Hz non confirmé par JS8Call"
+                ))
+        
+        if frequency:
+            # Le texte n'est mis en file qu'une fois le QSY confirmé par JS8Call
+            self.change_frequency(frequency).add_done_callback(after_qsy)
+        else:
+            queue()
+        return result
+    
     def send_message(self, text, frequency=None):
         """Envoie un message via JS8Call"""
         if not self.connected:
             raise Exception("Non connecté à JS8Call")
         
-        try:
-            # Commande JS8Call pour envoyer un message
-            command = {
-                "type": "TX.SEND_MESSAGE",
-                "value": text,
-                "params": {
-                    "FREQ": frequency if frequency else 0,  # 0 = utilise la fréquence actuelle
-                    "SPEED": 0   # Vitesse normale
-                }
-            }
-            
-            message = json.dumps(command) + '\n'
-            self.socket.send(message.encode('utf-8'))
-            return True
-            
-        except Exception as e:
-            print(f"Erreur lors de l'envoi: {e}")
-            self.connected = False
-            return False
+        return self.send_commands([self.message_command(text, frequency)])[0].result(self.write_timeout + 1)
     
     def set_frequency(self, frequency):
         """Change la fréquence de JS8Call"""
         if not self.connected:
             raise Exception("Non connecté à JS8Call")
         
-        try:
-            command = {
-                "type": "RIG.SET_FREQ",
-                "value": str(frequency),
-                "params": {}
-            }
-            
-            message = json.dumps(command) + '\n'
-            self.socket.send(message.encode('utf-8'))
-            return True
-            
-        except Exception as e:
-            print(f"Erreur changement fréquence: {e}")
-            return False
+        return self.send_commands([self.frequency_command(frequency)])[0].result(self.write_timeout + 1)
     
 
     def send_directed_message(self, call, text):
@@ -84,18 +782,341 @@ class JS8CallClient:
     
     def disconnect(self):
         """Déconnecte proprement"""
-        if self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
-        self.connected = False
+        self.stop_auto_reconnect()
+        self.cancel_connect()
+        with self._lock:
+            transport = self.transport
+            self.transport = None
+            self.connected = False
+            pending = self._take_outbox()
+        self._ping_wake.set()
+        self._fail_deliveries(pending)
+        if transport:
+            transport.close()
+
+class JS8Endpoint:
+    """Instance JS8Call supplémentaire recevant le même bulletin (sa propre radio et fréquence)"""
+    
+    def __init__(self, name, host='127.0.0.1', port=None, transport='tcp', frequency=0):
+        self.name = name
+        self.host = host
+        self.transport = transport if transport in JS8_TRANSPORTS else 'tcp'
+        self.port = port or JS8_TRANSPORTS[self.transport].default_port
+        self.frequency = frequency  # 0 = fréquence actuelle de cette instance
+        self.client = None
+        self.retry_info = None
+    
+    @property
+    def connected(self):
+        return bool(self.client and self.client.connected)
+    
+    @property
+    def address(self):
+        return f"{self.transport.upper()} {self.host}:{self.port}"
+    
+    def describe(self):
+        freq_display = f"{self.frequency / 1000000:.3f} MHz" if self.frequency else "Auto"
+        return f"{self.name} - {self.address} @ {freq_display}"
+    
+    def to_config(self):
+        return {
+            'name': self.name,
+            'host': self.host,
+            'port': self.port,
+            'transport': self.transport,
+            'frequency': self.frequency
+        }
+    
+    @classmethod
+    def from_config(cls, data):
+        return cls(
+            data.get('name') or data.get('host', '?'),
+            data.get('host', '127.0.0.1'),
+            data.get('port'),
+            data.get('transport', 'tcp'),
+            data.get('frequency', 0)
+        )
+    
+    def disconnect(self):
+        client = self.client
+        self.client = None
+        self.retry_info = None
+        if client:
+            client.disconnect()
+
+
+class Outbox:
+    """File d'envoi persistante: priorité d'abord (EMERGENCY, PRIORITY, ROUTINE), puis ordre d'arrivée.
+    
+    Le contenu est réécrit dans path (JSON) à chaque changement, les
+    messages en attente survivent donc à un redémarrage du programme.
+    """
+    
+    EMERGENCY = 0
+    PRIORITY = 1
+    ROUTINE = 2
+    
+    def __init__(self, path=None):
+        self.path = path
+        self._heap = []  # (priorité, numéro d'ordre, message)
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        if not (self.path and os.path.exists(self.path)):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+        except Exception as e:
+            print(f"Erreur lecture file d'envoi: {e}")
+            return
+        for item in items:
+            item.setdefault('targets', [None])  # Fichier d'une version précédente: instance principale
+        with self._lock:
+            self._heap = [(item['priority'], item['id'], item) for item in items]
+            heapq.heapify(self._heap)
+            self._next_id = max((item['id'] for item in items), default=0) + 1
+    
+    def _save(self):
+        """Écriture atomique (fichier temporaire puis remplacement); appelé sous le verrou"""
+        if not self.path:
+            return
+        try:
+            temp = self.path + '.tmp'
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump([entry[2] for entry in sorted(self._heap)], f, ensure_ascii=False, indent=2)
+            os.replace(temp, self.path)
+        except Exception as e:
+            print(f"Erreur écriture file d'envoi: {e}")
+    
+    def put(self, text, priority=ROUTINE, targets=(None,), **extra):
+        """Ajoute un message pour les destinations targets (None = instance principale); retourne l'entrée créée (dict)"""
+        with self._lock:
+            item = dict(extra, id=self._next_id, priority=priority, text=text, queued_at=time.time(), targets=list(targets))
+            self._next_id += 1
+            heapq.heappush(self._heap, (priority, item['id'], item))
+            self._save()
+        return item
+    
+    def put_bulletin(self, parts, priority=ROUTINE, planned_slot=None, targets=(None,), **extra):
+        """Ajoute les parties d'un bulletin, dans l'ordre; retourne les entrées créées.
+        
+        Chaque partie porte l'identifiant de la première (bulletin) et le nombre
+        de parties (parts): cancel(whole_bulletins=True) les retire ensemble.
+        planned_slot ne concerne que la première partie.
+        """
+        with self._lock:
+            bulletin = self._next_id
+            items = []
+            for index, text in enumerate(parts):
+                item = dict(
+                    extra, id=self._next_id, priority=priority, text=text, queued_at=time.time(),
+                    planned_slot=planned_slot if index == 0 else None, bulletin=bulletin, parts=len(parts),
+                    targets=list(targets),
+                )
+                self._next_id += 1
+                heapq.heappush(self._heap, (priority, item['id'], item))
+                items.append(item)
+            self._save()
+        return items
+    
+    def pop(self):
+        """Retire et retourne le message le plus prioritaire (None si la file est vide)"""
+        with self._lock:
+            if not self._heap:
+                return None
+            item = heapq.heappop(self._heap)[2]
+            self._save()
+        return item
+    
+    def head(self):
+        """Message le plus prioritaire, laissé dans la file jusqu'à sa remise (None si elle est vide)"""
+        with self._lock:
+            return min(self._heap)[2] if self._heap else None
+    
+    def next_for(self, target):
+        """Message le plus prioritaire que target attend encore (None s'il n'y en a pas)"""
+        with self._lock:
+            waiting = [entry for entry in self._heap if target in entry[2]['targets']]
+            return min(waiting)[2] if waiting else None
+    
+    def targets(self):
+        """Destinations qui attendent encore au moins un message"""
+        with self._lock:
+            return {target for entry in self._heap for target in entry[2]['targets']}
+    
+    def mark_started(self, item):
+        """Remise de item commencée: cancel(whole_bulletins=True) ne le retire plus"""
+        with self._lock:
+            item['started'] = True
+            self._save()
+    
+    def done(self, item, target):
+        """item n'est plus à remettre à target (remis, ou abandonné pour elle).
+        
+        Retiré de la file quand plus aucune destination ne l'attend; retourne
+        True dans ce cas.
+        """
+        with self._lock:
+            if target in item['targets']:
+                item['targets'].remove(target)
+            removed = not item['targets']
+            if removed:
+                self._heap = [entry for entry in self._heap if entry[2] is not item]
+                heapq.heapify(self._heap)
+            self._save()
+        return removed
+    
+    def cancel(self, predicate, whole_bulletins=False):
+        """Retire les messages pour lesquels predicate(message) est vrai; les retourne.
+        
+        whole_bulletins: un bulletin en plusieurs parties n'est retiré qu'entier,
+        si toutes ses parties attendent encore et sont retenues; sinon (déjà
+        commencé à l'antenne) il est gardé entier. Un message dont la remise a
+        commencé n'est pas retiré.
+        """
+        with self._lock:
+            if whole_bulletins:
+                predicate = self._whole_bulletins(predicate)
+            removed = [entry[2] for entry in sorted(self._heap) if predicate(entry[2])]
+            if removed:
+                self._heap = [entry for entry in self._heap if not predicate(entry[2])]
+                heapq.heapify(self._heap)
+                self._save()
+        return removed
+    
+    def _whole_bulletins(self, predicate):
+        """predicate étendu aux bulletins entiers (appelé sous le verrou)"""
+        groups = {}
+        for entry in self._heap:
+            if entry[2].get('bulletin') is not None:
+                groups.setdefault(entry[2]['bulletin'], []).append(entry[2])
+        
+        def whole(item):
+            group = groups.get(item.get('bulletin'), [item])
+            return (len(group) == item.get('parts', len(group))
+                    and not any(part.get('started') for part in group)
+                    and all(predicate(part) for part in group))
+        return whole
+    
+    def items(self):
+        """Messages en attente, dans l'ordre d'envoi"""
+        with self._lock:
+            return [entry[2] for entry in sorted(self._heap)]
+    
+    def __len__(self):
+        return len(self._heap)
+
+
+class EmissionScheduler:
+    """Ordonnanceur à échéance: un thread dort jusqu'à la prochaine émission.
+    
+    on_due(due) est appelé dans le thread de l'ordonnanceur à l'échéance et
+    retourne la suivante (datetime, ou None pour attendre un reschedule()).
+    Tout changement d'échéance ou l'arrêt réveille immédiatement le thread.
+    Le sommeil est plafonné à max_sleep car Condition.wait suit l'horloge
+    monotone: un saut de l'horloge murale (NTP, veille) serait sinon ignoré.
+    À chaque réveil, l'écart entre horloge murale et horloge monotone depuis
+    le réveil précédent révèle ces sauts: on_clock_jump(secondes) est appelé
+    au-delà de jump_threshold.
+    """
+    
+    jump_threshold = 2
+    
+    def __init__(self, on_due, max_sleep=60, on_clock_jump=None):
+        self.on_due = on_due
+        self.max_sleep = max_sleep
+        self.on_clock_jump = on_clock_jump
+        self.wakeups = 0
+        self.clock_jumps = 0
+        self._clock_ref = None
+        self._condition = threading.Condition()
+        self._deadline = None
+        self._generation = 0
+    
+    @property
+    def active(self):
+        return self._generation % 2 == 1
+    
+    @property
+    def deadline(self):
+        return self._deadline
+    
+    def start(self, deadline=None):
+        with self._condition:
+            if self.active:
+                return
+            self._generation += 1
+            self._deadline = deadline
+            self._clock_ref = None
+            threading.Thread(target=self._run, args=(self._generation,), daemon=True).start()
+    
+    def stop(self):
+        with self._condition:
+            if self.active:
+                self._generation += 1
+            self._deadline = None
+            self._condition.notify_all()
+    
+    def reschedule(self, deadline):
+        """Remplace l'échéance (None = aucune) et réveille le thread"""
+        with self._condition:
+            self._deadline = deadline
+            self._condition.notify_all()
+    
+    def _check_clock(self):
+        """Compare l'avance des horloges murale et monotone depuis le dernier appel"""
+        wall, mono = time.time(), time.monotonic()
+        if self._clock_ref is not None:
+            jump = (wall - self._clock_ref[0]) - (mono - self._clock_ref[1])
+            if abs(jump) > self.jump_threshold:
+                self.clock_jumps += 1
+                if self.on_clock_jump:
+                    try:
+                        self.on_clock_jump(jump)
+                    except Exception as e:
+                        print(f"Scheduler error: {e}")
+        self._clock_ref = (wall, mono)
+    
+    def _run(self, generation):
+        with self._condition:
+            while self._generation == generation:
+                self._check_clock()
+                deadline = self._deadline
+                if deadline is None:
+                    self._condition.wait()
+                    self.wakeups += 1
+                    continue
+                
+                remaining = deadline.timestamp() - time.time()
+                if remaining > 0:
+                    self._condition.wait(min(remaining, self.max_sleep))
+                    self.wakeups += 1
+                    continue
+                
+                # Échéance atteinte: on appelle on_due hors du verrou
+                self._deadline = None
+                self._condition.release()
+                try:
+                    following = self.on_due(deadline)
+                except Exception as e:
+                    print(f"Erreur de l'ordonnanceur: {e}")
+                    following = None
+                finally:
+                    self._condition.acquire()
+                
+                # Un reschedule() pendant on_due a priorité
+                if self._generation == generation and self._deadline is None:
+                    self._deadline = following
+
 
 class JS8BulletinBoard:
     def __init__(self, root):
         self.root = root
         self.root.title("JS8Call Bulletin Board")
-        self.root.geometry("800x650")
+        self.root.geometry("800x680")
 
         # Définir l'icône de la fenêtre
         try:
@@ -122,7 +1143,9 @@ class JS8BulletinBoard:
         # Paramètres JS8Call
         self.js8_host = '127.0.0.1'
         self.js8_port = 2442
+        self.js8_transport = 'tcp'  # 'tcp' ou 'udp' (voir JS8_TRANSPORTS)
         self.js8_frequency = 0  # 0 = utilise la fréquence actuelle de JS8Call
+        self.js8_endpoints = []  # Instances JS8Call supplémentaires (JS8Endpoint)
         
         # NOUVEAU: Paramètre de démarrage automatique
         self.autostart_enabled = False
@@ -135,6 +1158,63 @@ class JS8BulletinBoard:
         # Initialisation JS8Call avec détection automatique
         self.js8_client = None
         self.js8_connected = False
+        self.js8_connecting = False
+        self._connect_waiters = []
+        self.js8_rig_frequency = 0  # Fréquence annoncée par JS8Call (RIG.FREQ)
+        self.reconnect_policy = ReconnectPolicy()
+        self.ping_interval = 30  # Période du ping applicatif (s), 0 = désactivé
+        self._ping_count = 0
+        self.js8_retry_info = None  # (tentative, délai) de la reconnexion automatique
+        self.tx_max_queue = 1  # Messages remis à JS8Call et pas encore émis
+        self._held_since = None  # Émission retenue car JS8Call émet déjà
+        self.js8_speed = 'normal'  # Mode de vitesse JS8 du bulletin (voir JS8_SPEEDS)
+        self.frame_counter = JS8FrameCounter()  # Trames du message en cours de saisie
+        self.text_length = 0  # Caractères dans l'éditeur, blancs de début et de fin compris
+        self.char_count = 0  # Caractères émis (texte sans blancs autour), tenu à jour à chaque modification
+        self.max_parts = 10  # Parties au plus d'un bulletin long: au-delà, la saisie est refusée
+        self.multipart_mode = 'sequence'  # Bulletin trop long: parties à la suite ('sequence') ou une par émission ('rotate')
+        self.multipart_labels = {
+            'sequence': "À la suite",
+            'rotate': "Une partie par émission",
+        }
+        self._part_index = 0  # Prochaine partie émise (mode 'rotate')
+        self._templates = {}  # Modèles compilés du bulletin en cours, par texte de partie
+        self._split = (None, None, None)  # Dernier découpage: (texte, limite, parties ou ValueError)
+        self._part_frames = {}  # Trames des parties affichées, par texte de partie
+        self.sequence = 0  # Numéro de la dernière émission ({SEQ})
+        self.station_grid = ''  # Locator lu dans JS8Call ({GRID})
+        self.speed_labels = {
+            'normal': "Normal",
+            'fast': "Rapide",
+            'turbo': "Turbo",
+            'slow': "Lent",
+        }
+        self.slot_lead = 1.0  # Remise à JS8Call avant le début du créneau visé (s)
+        self.qsy_lead = 3.0  # Avance supplémentaire pour confirmer un QSY (s)
+        self.slot_history = deque(maxlen=100)  # (créneau prévu, créneau réel)
+        self._slot_pending = None  # (créneau prévu, cycle) en attente du PTT
+        # Chemin absolu fixé au démarrage: un dialogue de fichier peut changer le dossier courant
+        self.config_file = os.path.abspath("js8_bulletin_last.json")
+        # Plafonds de temps d'émission (heure / jour), registre conservé entre deux lancements
+        self.governor = AirtimeGovernor(path=self.data_path("js8_airtime.json"))
+        self._ptt_on_at = None
+        self.catchup = CatchUpPolicy()  # Émissions manquées (veille, blocage)
+        self._catchup_left = 0  # Émissions de rattrapage restant à envoyer
+        self.station_callsign = ''  # Indicatif lu dans JS8Call (décalage anti-collision)
+        self._jitter_seed = random.getrandbits(32)
+        self._plan_window = None  # Fenêtre de planning ouverte
+        self.display_timezone = ''  # Fuseau d'affichage ('' = heure locale, 'UTC', 'Europe/Paris'...)
+        self.display_tz = None
+        self.outbox = Outbox(self.data_path("js8_outbox.json"))  # Messages en attente d'envoi, par priorité
+        self._outbox_event = threading.Event()
+        self.priority_labels = {
+            Outbox.ROUTINE: "Routine",
+            Outbox.PRIORITY: "Prioritaire",
+            Outbox.EMERGENCY: "Urgence",
+        }
+        self._plan_refresh = None
+        self._optimizer_window = None  # Fenêtre d'optimisation ouverte
+        self._optimizer_refresh = None
         
         # Configuration de l'interface AVANT de détecter JS8Call
         self.setup_ui()
@@ -144,14 +1224,23 @@ class JS8BulletinBoard:
         
         # Maintenant on peut se connecter avec les bons paramètres
         self.detect_and_connect_js8call()
+        self.connect_endpoints()
+        self.root.after(2000, self._tx_status_tick)
         
         # NOUVEAU: Démarrage automatique si activé
         if self.autostart_enabled:
             self.root.after(1000, self.try_autostart)
         
-        # Thread de surveillance
-        self.check_thread = None
-        self.running = False
+        # Ordonnanceur des émissions automatiques
+        self.scheduler = EmissionScheduler(self._on_emission_due, on_clock_jump=self._on_clock_jump)
+        
+        # Envoi de la file: un message à la fois, le plus prioritaire d'abord
+        self._resume_outbox()
+        threading.Thread(target=self._outbox_loop, daemon=True).start()
+    
+    def data_path(self, name):
+        """Fichier de données rangé à côté du fichier de configuration"""
+        return os.path.join(os.path.dirname(self.config_file), name)
     
     def try_autostart(self):
         """Tente de démarrer automatiquement les émissions"""
@@ -161,66 +1250,436 @@ class JS8BulletinBoard:
             self.log_message("Autostart annulé: message vide", "WARNING")
             return
         
-        if len(text) > self.max_chars:
-            self.log_message(f"Autostart annulé: message trop long ({len(text)}/{self.max_chars})", "WARNING")
+        error = self.bulletin_error(text)
+        if error:
+            self.log_message(f"Autostart annulé: {error}", "WARNING")
             return
         
         if not self.js8_connected:
             self.log_message("Autostart: Tentative de connexion à JS8Call...", "INFO")
-            self.reconnect_js8call()
-            
-            if not self.js8_connected:
-                self.log_message("Autostart annulé: JS8Call non connecté", "WARNING")
-                messagebox.showwarning(
-                    "Autostart - Connexion échouée",
-                    f"Impossible de se connecter à JS8Call sur {self.js8_host}:{self.js8_port}\n\n"
-                    "Les émissions automatiques ne démarreront pas.\n"
-                    "Vérifiez que JS8Call est lancé et l'API TCP activée."
-                )
-                return
+            self.ensure_js8_connection(self._autostart_after_connect)
+            return
+        
+        self._autostart_after_connect(True)
+    
+    def _autostart_after_connect(self, connected):
+        """Suite de l'autostart une fois la tentative de connexion terminée"""
+        if not connected:
+            self.log_message("Autostart annulé: JS8Call non connecté", "WARNING")
+            messagebox.showwarning(
+                "Autostart - Connexion échouée",
+                f"Impossible de se connecter à JS8Call sur {self.js8_host}:{self.js8_port}\n\n"
+                "Les émissions automatiques ne démarreront pas.\n"
+                "Vérifiez que JS8Call est lancé et l'API TCP activée."
+            )
+            return
         
         # Démarrage automatique
         self.log_message("🚀 AUTOSTART: Démarrage automatique des émissions", "INFO")
         self.start_emissions()
     
     def detect_and_connect_js8call(self):
-        """Détecte et se connecte automatiquement à JS8Call"""
+        """Détecte et se connecte automatiquement à JS8Call (sans bloquer l'interface)"""
         print("Recherche de JS8Call...")
         print(f"  Test de {self.js8_host}:{self.js8_port}...")
         
-        try:
-            client = JS8CallClient(host=self.js8_host, port=self.js8_port)
-            if client.connect():
-                self.js8_client = client
-                self.js8_connected = True
-                print(f"✓ JS8Call détecté sur {self.js8_host}:{self.js8_port}")
-                self.update_connection_status()
-                return
-        except Exception as e:
-            print(f"Erreur: {e}")
+        self._start_js8_connection(log=False)
+    
+    def _start_js8_connection(self, log=True):
+        """Crée un client avec les paramètres configurés et lance sa connexion en arrière-plan"""
+        if self.js8_client:
+            self.js8_client.disconnect()
         
-        print(f"✗ JS8Call non connecté sur {self.js8_host}:{self.js8_port}")
+        client = JS8CallClient(host=self.js8_host, port=self.js8_port, transport=self.js8_transport)
+        client.reconnect_policy = self.reconnect_policy
+        client.ping_interval = self.ping_interval
+        client.on_ping = lambda c, ok, ms: self.root.after(0, lambda: self._on_js8_ping(c, ok, ms))
+        client.on_connection_lost = lambda c: self.root.after(0, lambda: self._on_js8_connection_lost(c))
+        client.on_reconnected = lambda c, n: self.root.after(0, lambda: self._on_js8_reconnected(c, n))
+        client.on_reconnect_scheduled = lambda c, n, delay: self.root.after(0, lambda: self._on_js8_reconnect_scheduled(c, n, delay))
+        client.subscribe(self._on_js8_rig_event, types=['RIG.FREQ'])
+        client.subscribe(self._on_js8_tx_event, types=['RIG.PTT', 'TX.FRAME'])
+        
+        self.js8_client = client
         self.js8_connected = False
+        self.js8_connecting = True
+        self._ptt_on_at = None
+        self.js8_retry_info = None
         self.update_connection_status()
+        
+        future = client.connect()
+        future.add_done_callback(
+            lambda f: self.root.after(0, lambda: self._on_js8_connect_done(client, f, log))
+        )
     
+    def _on_js8_connect_done(self, client, future, log):
+        """Résultat d'une tentative de connexion (exécuté dans le thread Tk)"""
+        if future.cancelled() or client is not self.js8_client:
+            # Tentative remplacée par une plus récente (changement d'hôte/port)
+            return
+        
+        connected = future.result()
+        self.js8_connecting = False
+        self.js8_connected = connected
+        
+        if log:
+            if connected:
+                self.log_message("Reconnexion réussie!")
+            else:
+                self.log_message("Reconnexion échouée", "ERROR")
+        elif connected:
+            print(f"✓ JS8Call détecté sur {self.js8_host}:{self.js8_port}")
+        else:
+            print(f"✗ JS8Call non connecté sur {self.js8_host}:{self.js8_port}")
+        
+        if self.emission_active:
+            # Surveillance lancée après la première tentative, pas en concurrence avec elle
+            client.start_auto_reconnect()
+        
+        self.update_connection_status()
+        self.update_tx_status()
+        self.update_latency_status()
+        if connected:
+            self._read_station_callsign(client)
+            self._read_station_grid(client)
+            self._outbox_event.set()
+        self._notify_connect_waiters(connected)
+    
+    def _read_station_callsign(self, client):
+        """Lit l'indicatif configuré dans JS8Call (créneau anti-collision)"""
+        def done(future):
+            if future.exception() is None and future.result():
+                self.root.after(0, lambda: self._set_station_callsign(future.result()))
+        client.get_callsign().add_done_callback(done)
+    
+    def _read_station_grid(self, client):
+        """Lit le locator configuré dans JS8Call (variable {GRID})"""
+        def done(future):
+            if future.exception() is None and future.result():
+                grid = future.result().strip()
+                self.root.after(0, lambda: setattr(self, 'station_grid', grid))
+        client.get_grid().add_done_callback(done)
+    
+    def _set_station_callsign(self, callsign):
+        callsign = callsign.strip().upper()
+        if callsign == self.station_callsign:
+            return
+        self.station_callsign = callsign
+        self.update_schedule()
+        self.update_spread_label()
+    
+    def _notify_connect_waiters(self, connected):
+        """Prévient les actions en attente du résultat de la connexion"""
+        waiters = self._connect_waiters
+        self._connect_waiters = []
+        for callback in waiters:
+            callback(connected)
+    
+    def _on_js8_connection_lost(self, client):
+        """La connexion a été fermée par JS8Call (thread Tk)"""
+        if client is not self.js8_client:
+            return
+        self.js8_connected = False
+        if client.auto_reconnecting:
+            self.log_message("JS8Call a fermé la connexion - reconnexion automatique", "WARNING")
+        else:
+            self.log_message("JS8Call a fermé la connexion", "WARNING")
+        self.update_connection_status()
+    
+    def _on_js8_reconnected(self, client, attempts):
+        """La boucle de reconnexion automatique a rétabli la connexion (thread Tk)"""
+        if client is not self.js8_client:
+            return
+        self.js8_connected = True
+        self.js8_retry_info = None
+        self.log_message(f"Connexion JS8Call rétablie (tentative {attempts})")
+        self.update_connection_status()
+        self._outbox_event.set()
+    
+    def _on_js8_reconnect_scheduled(self, client, failures, delay):
+        """Échec d'une tentative automatique: prochaine tentative programmée (thread Tk)"""
+        if client is not self.js8_client:
+            return
+        self.js8_retry_info = (failures, delay)
+        self.log_message(f"Tentative de reconnexion {failures} échouée, prochaine dans {delay:.0f}s", "WARNING")
+        self.update_connection_status()
+    
+    def tx_clients(self):
+        """Clients des instances JS8Call connectées (principale et supplémentaires)"""
+        clients = [self.js8_client] if self.js8_client and self.js8_connected else []
+        return clients + [endpoint.client for endpoint in self.js8_endpoints if endpoint.connected]
+    
+    def tx_busy(self):
+        """True si toutes les instances JS8Call connectées émettent déjà ou ont leur file pleine.
+        
+        Une seule instance libre suffit: chacune reçoit ensuite les messages
+        quand elle est prête (voir _outbox_loop).
+        """
+        clients = self.tx_clients()
+        return bool(clients) and all(self._client_busy(client) for client in clients)
+    
+    def _client_busy(self, client):
+        return client.tx_state.busy or client.tx_state.depth >= self.tx_max_queue
+    
+    def target_busy(self, target):
+        """L'instance target (None = principale) émet déjà ou sa file contient assez de messages"""
+        client = self._target_client(target)
+        return bool(client) and self._client_busy(client)
+    
+    def tx_idle_in(self):
+        """Secondes avant qu'une instance connectée soit libre"""
+        return min((client.tx_state.idle_in() for client in self.tx_clients()), default=0)
+    
+    def update_tx_status(self):
+        """Affiche l'état d'émission de JS8Call et la profondeur de sa file"""
+        if not hasattr(self, 'tx_status_label'):
+            return
+        client = self.js8_client
+        if not (client and self.js8_connected):
+            self.tx_status_label.config(text="TX: ---", foreground="#669900")
+            return
+        
+        depth = client.tx_state.depth
+        if client.tx_state.ptt:
+            state, color = "en émission", "red"
+        elif client.tx_state.busy:
+            state, color = "entre trames", "orange"
+        else:
+            state, color = "au repos", "#669900"
+        self.tx_status_label.config(text=f"TX: {state} | file {depth}/{self.tx_max_queue}", foreground=color)
+    
+    def _on_js8_ping(self, client, ok, latency_ms):
+        """Résultat d'un ping applicatif (thread Tk)"""
+        if client is not self.js8_client:
+            return
+        if not ok:
+            self.log_message(f"Pas de réponse de JS8Call au ping (délai {client.ping_timeout}s)", "WARNING")
+        else:
+            self._ping_count += 1
+            if self._ping_count % 20 == 0:
+                self.log_message(f"Latence API: {client.latency.summary()}")
+        self.update_latency_status()
+    
+    def update_latency_status(self):
+        """Affiche l'histogramme de latence de l'API JS8Call"""
+        if not hasattr(self, 'latency_label'):
+            return
+        client = self.js8_client
+        if not (client and self.js8_connected and len(client.latency)):
+            self.latency_label.config(text="API: ---")
+            return
+        p95 = client.latency.percentile(95)
+        color = "#669900" if p95 < 250 else ("orange" if p95 < 1000 else "red")
+        self.latency_label.config(text=f"API: {client.latency.summary()}", foreground=color)
+    
+    def show_latency_histogram(self, event=None):
+        """Détail de l'histogramme de latence (clic sur le libellé)"""
+        client = self.js8_client
+        if not client or not len(client.latency):
+            return
+        buckets = client.latency.buckets()
+        peak = max(count for _, count in buckets) or 1
+        lines = [f"{label:>7} ms  {'█' * round(count * 30 / peak):<30} {count}" for label, count in buckets]
+        lines.append("")
+        lines.append(client.latency.summary())
+        lines.append(f"Pings sans réponse: {client.latency.timeouts}")
+        messagebox.showinfo("Latence de l'API JS8Call", "\n".join(lines))
+    
+    def _tx_status_tick(self):
+        """Rafraîchit périodiquement l'état TX (la fin d'émission se déduit du temps écoulé)"""
+        self.update_tx_status()
+        if not (self.js8_client and self.js8_client.tx_state.busy):
+            self.governor.settle()
+        self.update_airtime_status()
+        self.root.after(2000, self._tx_status_tick)
+    
+    def update_airtime_status(self):
+        """Affiche le temps d'émission utilisé et les plafonds (heure / jour)"""
+        if not hasattr(self, 'airtime_label'):
+            return
+        parts = []
+        exhausted = False
+        for name, window, cap in (("1h", AirtimeGovernor.HOUR, self.governor.hour_cap),
+                                  ("24h", AirtimeGovernor.DAY, self.governor.day_cap)):
+            used = self.governor.used(window)
+            if cap:
+                parts.append(f"{name} {used / 60:.0f}/{cap / 60:.0f} min")
+                exhausted = exhausted or used >= cap
+            else:
+                parts.append(f"{name} {used / 60:.0f} min")
+        wait = self.governor.wait_for(estimate_tx_seconds(self.max_chars, self.js8_speed))
+        color = "red" if exhausted else ("orange" if wait else "#669900")
+        self.airtime_label.config(text="TX " + " · ".join(parts), foreground=color)
+    
+    def check_airtime(self, *texts):
+        """Délai (s) avant que le budget permette d'émettre les textes (0, ou math.inf si jamais).
+        
+        Chaque instance connectée émet les textes: toutes sont comptées.
+        """
+        seconds = sum(js8_tx_seconds(text, self.js8_speed) for text in texts)
+        return self.governor.wait_for(seconds * max(1, len(self.tx_clients())))
+    
+    def _on_js8_tx_event(self, event):
+        """Activité d'émission de JS8Call (thread de lecture)"""
+        self.root.after(0, self.update_tx_status)
+        if event.type == 'RIG.PTT':
+            # Temps de PTT réel pour le budget d'émission
+            if event.ptt:
+                if self._ptt_on_at is None:
+                    self._ptt_on_at = event.received_at
+            elif self._ptt_on_at is not None:
+                self.governor.add_actual(event.received_at - self._ptt_on_at, event.received_at)
+                self._ptt_on_at = None
+            # Fin d'émission prévisible: la file d'envoi recalcule son attente
+            self._outbox_event.set()
+        pending = self._slot_pending
+        if pending and event.type == 'RIG.PTT' and event.ptt:
+            # Premier passage en émission après la remise: créneau réellement utilisé
+            self._slot_pending = None
+            planned, cycle = pending
+            actual = JS8SlotClock(cycle).nearest_slot(event.received_at)
+            if 0 <= actual - planned <= 40:
+                self.root.after(0, lambda: self._record_slot(planned, actual, cycle))
+        if self._held_since:
+            # Émission retenue: on revérifie à la fin prévue de cette activité
+            self.scheduler.reschedule(datetime.now(timezone.utc) + timedelta(seconds=self.tx_idle_in()))
+    
+    def _record_slot(self, planned, actual, cycle):
+        """Journalise le créneau prévu et le créneau réel d'une émission (thread Tk)"""
+        self.slot_history.append((planned, actual))
+        on_time = sum(1 for p, a in self.slot_history if p == a)
+        slip = actual - planned
+        clock = JS8SlotClock(cycle)
+        actual_time = self.format_time(datetime.fromtimestamp(clock.slot_start(actual), timezone.utc))
+        planned_time = self.format_time(datetime.fromtimestamp(clock.slot_start(planned), timezone.utc))
+        self.log_message(
+            f"À l'antenne à {actual_time} (créneau prévu {planned_time}, {slip:+d} cycle(s)) - "
+            f"à l'heure {on_time}/{len(self.slot_history)}",
+            "INFO" if slip == 0 else "WARNING"
+        )
+    
+    def _on_js8_rig_event(self, event):
+        """Fréquence courante de JS8Call (thread de lecture)"""
+        frequency = event.dial
+        if frequency and frequency != self.js8_rig_frequency:
+            self.js8_rig_frequency = frequency
+            self.root.after(0, self.update_connection_status)
+    
+    def ensure_js8_connection(self, on_done):
+        """Appelle on_done(connected) dès que l'état de la connexion est connu"""
+        if self.js8_connected:
+            on_done(True)
+            return
+        
+        self._connect_waiters.append(on_done)
+        if not self.js8_connecting:
+            self.reconnect_js8call()
 
 
+    def connect_endpoints(self):
+        """(Re)connecte les instances JS8Call supplémentaires en arrière-plan"""
+        for endpoint in self.js8_endpoints:
+            self._start_endpoint(endpoint)
+    
+    def _start_endpoint(self, endpoint):
+        """Crée le client d'une instance supplémentaire et lance sa connexion"""
+        endpoint.disconnect()
+        client = JS8CallClient(host=endpoint.host, port=endpoint.port, transport=endpoint.transport)
+        client.reconnect_policy = self.reconnect_policy
+        client.ping_interval = self.ping_interval
+        client.on_connection_lost = lambda c: self.root.after(0, lambda: self._on_endpoint_lost(endpoint, c))
+        client.on_reconnected = lambda c, n: self.root.after(0, lambda: self._on_endpoint_reconnected(endpoint, c, n))
+        client.on_reconnect_scheduled = lambda c, n, delay: self.root.after(0, lambda: self._on_endpoint_retry(endpoint, c, n, delay))
+        # Fin d'émission de cette instance: la file d'envoi lui remet son message suivant
+        client.subscribe(lambda event: self._outbox_event.set(), types=['RIG.PTT'])
+        endpoint.client = client
+        
+        client.connect().add_done_callback(
+            lambda f: self.root.after(0, lambda: self._on_endpoint_connect_done(endpoint, client, f))
+        )
+        self.update_endpoints_status()
+    
+    def _on_endpoint_connect_done(self, endpoint, client, future):
+        """Résultat de la connexion d'une instance supplémentaire (thread Tk)"""
+        if future.cancelled() or client is not endpoint.client:
+            return
+        if self.emission_active:
+            client.start_auto_reconnect()
+        if future.result():
+            self.log_message(f"[{endpoint.name}] Connecté ({endpoint.address})")
+            self._outbox_event.set()
+        else:
+            self.log_message(f"[{endpoint.name}] Non connecté ({endpoint.address})", "WARNING")
+        self.update_endpoints_status()
+    
+    def _on_endpoint_lost(self, endpoint, client):
+        if client is not endpoint.client:
+            return
+        self.log_message(f"[{endpoint.name}] JS8Call a fermé la connexion", "WARNING")
+        self.update_endpoints_status()
+    
+    def _on_endpoint_reconnected(self, endpoint, client, attempts):
+        if client is not endpoint.client:
+            return
+        endpoint.retry_info = None
+        self.log_message(f"[{endpoint.name}] Connexion rétablie (tentative {attempts})")
+        self.update_endpoints_status()
+        self._outbox_event.set()
+    
+    def _on_endpoint_retry(self, endpoint, client, failures, delay):
+        if client is not endpoint.client:
+            return
+        endpoint.retry_info = (failures, delay)
+        self.update_endpoints_status()
+    
+    def update_endpoints_status(self):
+        """Résumé de l'état des instances supplémentaires dans la zone de statut"""
+        if not hasattr(self, 'endpoints_label'):
+            return
+        if not self.js8_endpoints:
+            self.endpoints_label.config(text="")
+            return
+        states = []
+        for endpoint in self.js8_endpoints:
+            if endpoint.connected:
+                states.append(f"{endpoint.name} ✓")
+            elif endpoint.client and endpoint.client.connecting:
+                states.append(f"{endpoint.name} ⏳")
+            else:
+                states.append(f"{endpoint.name} ✗")
+        online = sum(1 for endpoint in self.js8_endpoints if endpoint.connected)
+        color = "green" if online == len(self.js8_endpoints) else "#ff9900"
+        self.endpoints_label.config(text=" · ".join(states), foreground=color)
+    
     def update_connection_status(self):
         """Met à jour l'affichage du statut de connexion"""
         if hasattr(self, 'js8_status_label'):
-            if self.js8_connected:
+            if self.js8_connecting:
+                self.js8_status_label.config(
+                    text=f"JS8Call: ⏳ Connexion… ({self.js8_transport.upper()} {self.js8_host}:{self.js8_port})",
+                    foreground="#009999"
+                )
+            elif self.js8_connected:
                 self.js8_status_label.config(
-                    text=f"JS8Call: ✓ Connecté ({self.js8_host}:{self.js8_port})",
+                    text=f"JS8Call: ✓ Connecté ({self.js8_transport.upper()} {self.js8_host}:{self.js8_port})",
                     foreground="green"
                 )
+            elif self.js8_retry_info:
+                failures, delay = self.js8_retry_info
+                self.js8_status_label.config(
+                    text=f"JS8Call: ✗ Non connecté ({self.js8_transport.upper()} {self.js8_host}:{self.js8_port}) - nouvel essai #{failures + 1} dans {delay:.0f}s",
+                    foreground="#ff9900"
+                )
             else:
                 self.js8_status_label.config(
-                    text=f"JS8Call: ✗ Non connecté ({self.js8_host}:{self.js8_port})",
+                    text=f"JS8Call: ✗ Non connecté ({self.js8_transport.upper()} {self.js8_host}:{self.js8_port})",
                     foreground="#ff9900"
                 )
     
         if hasattr(self, 'freq_status_label'):
-            if self.js8_frequency == 0:
+            if self.js8_frequency == 0 and self.js8_rig_frequency:
+                freq_display = f"Auto (actuelle: {self.js8_rig_frequency / 1000000:.3f} MHz)"
+            elif self.js8_frequency == 0:
                 freq_display = "Auto (utilise la fréquence actuelle)"
             else:
                 freq_mhz = self.js8_frequency / 1000000
@@ -229,51 +1688,42 @@ class JS8BulletinBoard:
             self.freq_status_label.config(text=f"Fréquence: {freq_display}")
 
 
-
     
     def reconnect_js8call(self):
-        """Tente de reconnecter JS8Call"""
+        """Tente de reconnecter JS8Call (annule une tentative en cours)"""
         self.log_message("Tentative de reconnexion à JS8Call...")
         
-        if self.js8_client:
-            self.js8_client.disconnect()
-        
         # Utilise les paramètres configurés
         try:
-            client = JS8CallClient(host=self.js8_host, port=self.js8_port)
-            if client.connect():
-                self.js8_client = client
-                self.js8_connected = True
-                self.log_message("Reconnexion réussie!")
-            else:
-                self.js8_connected = False
-                self.log_message("Reconnexion échouée", "ERROR")
+            self._start_js8_connection(log=True)
         except Exception as e:
+            self.js8_connecting = False
             self.js8_connected = False
             self.log_message(f"Erreur reconnexion: {e}", "ERROR")
-        
-        self.update_connection_status()
+            self.update_connection_status()
+            self._notify_connect_waiters(False)
     
 
 
-
-
     def open_settings_window(self):
         """Ouvre la fenêtre de paramètres JS8Call"""
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Paramètres JS8Call")
-        settings_window.geometry("500x520")  # Augmenté pour la nouvelle option
-        settings_window.resizable(False, False)
+        # Hauteur limitée à l'écran (portables en 768 px): le contenu défile, les boutons restent visibles
+        settings_window.geometry(f"520x{min(960, settings_window.winfo_screenheight() - 80)}")
+        settings_window.minsize(420, 300)
+        settings_window.resizable(True, True)
     
         # Centrer la fenêtre
         settings_window.transient(self.root)
         settings_window.grab_set()
     
-        main_frame = ttk.Frame(settings_window, padding="20")
-        main_frame.pack(fill=tk.BOTH, expand=True)
+        button_frame = ttk.Frame(settings_window, padding=(20, 0, 20, 15))
+        button_frame.pack(fill=tk.X, pady=(15, 0), side=tk.BOTTOM)
+        main_frame = self._scrolled_frame(settings_window, padding="20")
     
-        # Connexion TCP
-        conn_frame = ttk.LabelFrame(main_frame, text="Connexion TCP JS8Call", padding="10")
+        # Connexion JS8Call (TCP ou UDP)
+        conn_frame = ttk.LabelFrame(main_frame, text="Connexion JS8Call", padding="10")
         conn_frame.pack(fill=tk.X, pady=(0, 10))
     
         # Adresse IP
@@ -288,17 +1738,49 @@ class JS8BulletinBoard:
         port_var = tk.StringVar(value=str(self.js8_port))
         port_entry = ttk.Entry(conn_frame, textvariable=port_var, width=10)
         port_entry.grid(row=1, column=1, sticky=tk.W, padx=5)
-        ttk.Label(conn_frame, text="(Défaut: 2442)", foreground="gray", font=("TkDefaultFont", 8)).grid(row=1, column=2, sticky=tk.W, padx=5)
+        port_hint = ttk.Label(conn_frame, foreground="gray", font=("TkDefaultFont", 8))
+        port_hint.grid(row=1, column=2, sticky=tk.W, padx=5)
+    
+        # Protocole
+        ttk.Label(conn_frame, text="Protocole:").grid(row=2, column=0, sticky=tk.W, pady=5, padx=(0,10))
+        transport_var = tk.StringVar(value=self.js8_transport)
+        transport_frame = ttk.Frame(conn_frame)
+        transport_frame.grid(row=2, column=1, columnspan=2, sticky=tk.W, padx=5)
     
         # Info
         info_label = ttk.Label(
             conn_frame, 
-            text="Configuration\n'TCP Server API' dans JS8Call\n(File → Settings → Reporting → Enable TCP Server API)",
             foreground="#009999",
             font=("TkDefaultFont", 8),
             justify=tk.LEFT
         )
-        info_label.grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
+        info_label.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=(10, 0))
+        
+        transport_info = {
+            'tcp': "Configuration\n'TCP Server API' dans JS8Call\n(File → Settings → Reporting → Enable TCP Server API)",
+            'udp': "Configuration\n'UDP Server' dans JS8Call: 127.0.0.1 et le port ci-dessus\n(File → Settings → Reporting → Enable UDP Server API + Accept UDP requests)",
+        }
+        current_transport = {'name': self.js8_transport}
+        
+        def on_transport_changed():
+            """Adapte le port par défaut et l'aide au protocole choisi"""
+            old = JS8_TRANSPORTS[current_transport['name']]
+            new = JS8_TRANSPORTS[transport_var.get()]
+            current_transport['name'] = new.name
+            if port_var.get().strip() in ('', str(old.default_port)):
+                port_var.set(str(new.default_port))
+            port_hint.config(text=f"(Défaut: {new.default_port})")
+            info_label.config(text=transport_info[new.name])
+        
+        for column, transport_class in enumerate(JS8_TRANSPORTS.values()):
+            ttk.Radiobutton(
+                transport_frame,
+                text=transport_class.name.upper(),
+                variable=transport_var,
+                value=transport_class.name,
+                command=on_transport_changed
+            ).grid(row=0, column=column, sticky=tk.W, padx=(0, 10))
+        on_transport_changed()
     
         # Fréquence
         freq_frame = ttk.LabelFrame(main_frame, text="Fréquence de transmission", padding="10")
@@ -368,10 +1850,167 @@ class JS8BulletinBoard:
         )
         autostart_info.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
     
-        # Boutons
-        button_frame = ttk.Frame(main_frame)
-        button_frame.pack(fill=tk.X, pady=(15, 0), side=tk.BOTTOM)
+        # Reconnexion automatique
+        reconnect_frame = ttk.LabelFrame(main_frame, text="Reconnexion automatique", padding="10")
+        reconnect_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(reconnect_frame, text="Premier délai (s):").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        retry_initial_var = tk.StringVar(value=f"{self.reconnect_policy.initial:g}")
+        ttk.Entry(reconnect_frame, textvariable=retry_initial_var, width=6).grid(row=0, column=1, sticky=tk.W)
+        
+        ttk.Label(reconnect_frame, text="Max (s):").grid(row=0, column=2, sticky=tk.W, padx=(10, 5))
+        retry_max_var = tk.StringVar(value=f"{self.reconnect_policy.maximum:g}")
+        ttk.Entry(reconnect_frame, textvariable=retry_max_var, width=6).grid(row=0, column=3, sticky=tk.W)
+        
+        ttk.Label(reconnect_frame, text="Aléa (%):").grid(row=0, column=4, sticky=tk.W, padx=(10, 5))
+        retry_jitter_var = tk.StringVar(value=f"{self.reconnect_policy.jitter * 100:g}")
+        ttk.Entry(reconnect_frame, textvariable=retry_jitter_var, width=5).grid(row=0, column=5, sticky=tk.W)
+        
+        ttk.Label(
+            reconnect_frame,
+            text="Pendant les émissions, la connexion est rétablie en arrière-plan\n(délai doublé après chaque échec, jusqu'au maximum).",
+            foreground="#009999",
+            font=("TkDefaultFont", 8),
+            justify=tk.LEFT
+        ).grid(row=1, column=0, columnspan=6, sticky=tk.W, pady=(5, 0))
+        
+        ttk.Label(reconnect_frame, text="Période de ping (s, 0 = off):").grid(row=2, column=0, columnspan=3, sticky=tk.W, pady=(8, 0))
+        ping_var = tk.StringVar(value=f"{self.ping_interval:g}")
+        ttk.Entry(reconnect_frame, textvariable=ping_var, width=6).grid(row=2, column=3, sticky=tk.W, pady=(8, 0))
+    
+        # Budget de temps d'émission
+        airtime_frame = ttk.LabelFrame(main_frame, text="Budget d'émission", padding="10")
+        airtime_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(airtime_frame, text="Max par heure (min):").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        hour_cap_var = tk.StringVar(value=f"{self.governor.hour_cap / 60:g}")
+        ttk.Entry(airtime_frame, textvariable=hour_cap_var, width=6).grid(row=0, column=1, sticky=tk.W)
+        
+        ttk.Label(airtime_frame, text="Max par jour (min):").grid(row=0, column=2, sticky=tk.W, padx=(10, 5))
+        day_cap_var = tk.StringVar(value=f"{self.governor.day_cap / 60:g}")
+        ttk.Entry(airtime_frame, textvariable=day_cap_var, width=6).grid(row=0, column=3, sticky=tk.W)
+        
+        ttk.Label(
+            airtime_frame,
+            text="0 = pas de limite. Les émissions hors budget sont différées ou sautées.",
+            foreground="#009999",
+            font=("TkDefaultFont", 8)
+        ).grid(row=1, column=0, columnspan=4, sticky=tk.W, pady=(5, 0))
+    
+        # Émissions manquées (veille, blocage)
+        catchup_frame = ttk.LabelFrame(main_frame, text="Émissions manquées", padding="10")
+        catchup_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        catchup_labels = {
+            'skip': "Sauter si retard de plus de",
+            'once': "Émettre une fois",
+            'all': "Toutes les émettre",
+        }
+        catchup_var = tk.StringVar(value=catchup_labels[self.catchup.mode])
+        ttk.Combobox(
+            catchup_frame,
+            textvariable=catchup_var,
+            values=list(catchup_labels.values()),
+            state="readonly",
+            width=24
+        ).grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
+        
+        tolerance_var = tk.StringVar(value=f"{self.catchup.tolerance:g}")
+        ttk.Entry(catchup_frame, textvariable=tolerance_var, width=6).grid(row=0, column=1, sticky=tk.W)
+        ttk.Label(catchup_frame, text="s").grid(row=0, column=2, sticky=tk.W, padx=(2, 10))
+        
+        ttk.Label(catchup_frame, text="Espacement (s):").grid(row=0, column=3, sticky=tk.W, padx=(0, 5))
+        spacing_var = tk.StringVar(value=f"{self.catchup.spacing:g}")
+        ttk.Entry(catchup_frame, textvariable=spacing_var, width=6).grid(row=0, column=4, sticky=tk.W)
+    
+        # Instances JS8Call supplémentaires (autres radios, même bulletin)
+        endpoints_frame = ttk.LabelFrame(main_frame, text="Instances JS8Call supplémentaires", padding="10")
+        endpoints_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        endpoint_configs = [endpoint.to_config() for endpoint in self.js8_endpoints]
+        endpoints_list = tk.Listbox(endpoints_frame, height=3, width=45, exportselection=False)
+        endpoints_list.grid(row=0, column=0, rowspan=3, sticky=(tk.W, tk.E))
+        endpoints_frame.columnconfigure(0, weight=1)
+        
+        def refresh_endpoints():
+            endpoints_list.delete(0, tk.END)
+            for config in endpoint_configs:
+                endpoints_list.insert(tk.END, JS8Endpoint.from_config(config).describe())
+        
+        def edit_endpoint(index=None):
+            """Dialogue d'ajout (index None) ou de modification d'une instance"""
+            endpoint = JS8Endpoint.from_config(endpoint_configs[index]) if index is not None else JS8Endpoint("", port=None)
+            dialog = tk.Toplevel(settings_window)
+            dialog.title("Instance JS8Call")
+            dialog.resizable(False, False)
+            dialog.transient(settings_window)
+            dialog.grab_set()
+            frame = ttk.Frame(dialog, padding="10")
+            frame.pack(fill=tk.BOTH, expand=True)
+            
+            fields = {}
+            rows = [
+                ('name', "Nom (ex: 40m):", endpoint.name),
+                ('host', "Adresse IP:", endpoint.host),
+                ('port', "Port:", str(endpoint.port)),
+                ('frequency', "Fréquence (Hz, 0 = actuelle):", str(endpoint.frequency)),
+            ]
+            for row, (key, label, value) in enumerate(rows):
+                ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=3, padx=(0, 10))
+                fields[key] = tk.StringVar(value=value)
+                ttk.Entry(frame, textvariable=fields[key], width=20).grid(row=row, column=1, sticky=tk.W)
+            
+            ttk.Label(frame, text="Protocole:").grid(row=len(rows), column=0, sticky=tk.W, pady=3, padx=(0, 10))
+            endpoint_transport = tk.StringVar(value=endpoint.transport)
+            ttk.Combobox(
+                frame, textvariable=endpoint_transport, values=list(JS8_TRANSPORTS), state="readonly", width=6
+            ).grid(row=len(rows), column=1, sticky=tk.W)
+            
+            def save_endpoint():
+                try:
+                    port = int(fields['port'].get())
+                    frequency = int(fields['frequency'].get() or 0)
+                    if not 1 <= port <= 65535 or frequency < 0:
+                        raise ValueError
+                except ValueError:
+                    messagebox.showerror("Erreur", "Port ou fréquence invalide", parent=dialog)
+                    return
+                name = fields['name'].get().strip()
+                host = fields['host'].get().strip()
+                if not name or not host:
+                    messagebox.showerror("Erreur", "Le nom et l'adresse IP sont obligatoires", parent=dialog)
+                    return
+                config = JS8Endpoint(name, host, port, endpoint_transport.get(), frequency).to_config()
+                if index is None:
+                    endpoint_configs.append(config)
+                else:
+                    endpoint_configs[index] = config
+                refresh_endpoints()
+                dialog.destroy()
+            
+            buttons = ttk.Frame(frame)
+            buttons.grid(row=len(rows) + 1, column=0, columnspan=2, sticky=tk.E, pady=(10, 0))
+            ttk.Button(buttons, text="✓ Valider", command=save_endpoint).pack(side=tk.RIGHT, padx=5)
+            ttk.Button(buttons, text="❌ Annuler", command=dialog.destroy).pack(side=tk.RIGHT)
+        
+        def edit_selected_endpoint():
+            selection = endpoints_list.curselection()
+            if selection:
+                edit_endpoint(selection[0])
+        
+        def remove_selected_endpoint():
+            selection = endpoints_list.curselection()
+            if selection:
+                del endpoint_configs[selection[0]]
+                refresh_endpoints()
+        
+        ttk.Button(endpoints_frame, text="➕ Ajouter", width=12, command=edit_endpoint).grid(row=0, column=1, padx=(10, 0), sticky=tk.W)
+        ttk.Button(endpoints_frame, text="✎ Modifier", width=12, command=edit_selected_endpoint).grid(row=1, column=1, padx=(10, 0), sticky=tk.W)
+        ttk.Button(endpoints_frame, text="🗑 Retirer", width=12, command=remove_selected_endpoint).grid(row=2, column=1, padx=(10, 0), sticky=tk.W)
+        endpoints_list.bind('<Double-Button-1>', lambda e: edit_selected_endpoint())
+        refresh_endpoints()
     
+        # Boutons
         def apply_settings():
             """Applique les nouveaux paramètres"""
             try:
@@ -417,19 +2056,76 @@ class JS8BulletinBoard:
                         messagebox.showerror("Erreur", "La fréquence doit être un nombre entier")
                         return
             
+                # Reconnexion automatique
+                try:
+                    new_retry_initial = float(retry_initial_var.get())
+                    new_retry_max = float(retry_max_var.get())
+                    new_retry_jitter = float(retry_jitter_var.get()) / 100
+                    if new_retry_initial <= 0 or new_retry_max < new_retry_initial or not 0 <= new_retry_jitter <= 1:
+                        raise ValueError
+                except ValueError:
+                    messagebox.showerror("Erreur", "Délais de reconnexion invalides (0 < premier délai <= max, aléa 0-100%)")
+                    return
+                
+                try:
+                    new_ping_interval = float(ping_var.get())
+                    if new_ping_interval != 0 and new_ping_interval < 5:
+                        raise ValueError
+                except ValueError:
+                    messagebox.showerror("Erreur", "La période de ping doit être 0 (off) ou d'au moins 5 secondes")
+                    return
+                
+                try:
+                    new_hour_cap = float(hour_cap_var.get() or 0) * 60
+                    new_day_cap = float(day_cap_var.get() or 0) * 60
+                    if new_hour_cap < 0 or new_day_cap < 0:
+                        raise ValueError
+                except ValueError:
+                    messagebox.showerror("Erreur", "Les plafonds d'émission doivent être des minutes positives (0 = pas de limite)")
+                    return
+                
+                try:
+                    new_tolerance = float(tolerance_var.get())
+                    new_spacing = float(spacing_var.get())
+                    if new_tolerance < 0 or new_spacing < 0:
+                        raise ValueError
+                except ValueError:
+                    messagebox.showerror("Erreur", "La tolérance de retard et l'espacement du rattrapage doivent être des secondes positives")
+                    return
+            
                 # Applique les changements
-                connection_changed = (new_host != self.js8_host or new_port != self.js8_port)
+                new_transport = transport_var.get()
+                connection_changed = (new_host != self.js8_host or new_port != self.js8_port
+                                      or new_transport != self.js8_transport)
                 freq_changed = (new_freq != self.js8_frequency)
                 autostart_changed = (autostart_var.get() != self.autostart_enabled)
+                endpoints_changed = (endpoint_configs != [endpoint.to_config() for endpoint in self.js8_endpoints])
             
                 old_host = self.js8_host
                 old_port = self.js8_port
+                old_transport = self.js8_transport
                 old_freq = self.js8_frequency
             
                 self.js8_host = new_host
                 self.js8_port = new_port
+                self.js8_transport = new_transport
                 self.js8_frequency = new_freq
                 self.autostart_enabled = autostart_var.get()
+                self.reconnect_policy.initial = new_retry_initial
+                self.reconnect_policy.maximum = new_retry_max
+                self.reconnect_policy.jitter = new_retry_jitter
+                self.ping_interval = new_ping_interval
+                self.governor.hour_cap = new_hour_cap
+                self.governor.day_cap = new_day_cap
+                self.update_airtime_status()
+                self.catchup.mode = next(mode for mode, label in catchup_labels.items() if label == catchup_var.get())
+                self.catchup.tolerance = new_tolerance
+                self.catchup.spacing = new_spacing
+                if self.js8_client:
+                    self.js8_client.ping_interval = new_ping_interval
+                for endpoint in self.js8_endpoints:
+                    if endpoint.client:
+                        endpoint.client.ping_interval = new_ping_interval
             
                 # Met à jour l'affichage
                 self.update_connection_status()
@@ -440,7 +2136,7 @@ class JS8BulletinBoard:
                 # Messages de confirmation
                 changes = []
                 if connection_changed:
-                    changes.append(f"Connexion: {new_host}:{new_port}")
+                    changes.append(f"Connexion: {new_transport.upper()} {new_host}:{new_port}")
                 if freq_changed:
                     if new_freq == 0:
                         changes.append("Fréquence: Auto")
@@ -448,13 +2144,23 @@ class JS8BulletinBoard:
                         changes.append(f"Fréquence: {new_freq} Hz ({new_freq/1000000:.3f} MHz)")
                 if autostart_changed:
                     changes.append(f"Autostart: {'Activé' if self.autostart_enabled else 'Désactivé'}")
+                if endpoints_changed:
+                    changes.append(f"Instances supplémentaires: {len(endpoint_configs)}")
             
                 if changes:
                     self.log_message("Paramètres mis à jour: " + " | ".join(changes))
             
+                # Instances supplémentaires: on repart de zéro si la liste a changé
+                if endpoints_changed:
+                    for endpoint in self.js8_endpoints:
+                        endpoint.disconnect()
+                    self.js8_endpoints = [JS8Endpoint.from_config(config) for config in endpoint_configs]
+                    self.connect_endpoints()
+                    self.update_endpoints_status()
+            
                 # Reconnecte si les paramètres de connexion ont changé
                 if connection_changed:
-                    self.log_message(f"Reconnexion depuis {old_host}:{old_port} vers {new_host}:{new_port}...")
+                    self.log_message(f"Reconnexion depuis {old_transport.upper()} {old_host}:{old_port} vers {new_transport.upper()} {new_host}:{new_port}...")
                     self.reconnect_js8call()
             
                 messagebox.showinfo(
@@ -468,41 +2174,76 @@ class JS8BulletinBoard:
                 messagebox.showerror("Erreur", f"Erreur lors de l'application des paramètres:\n{e}")
                 self.log_message(f"Erreur paramètres: {e}", "ERROR")
     
+        # Test de connexion en cours dans la fenêtre de paramètres
+        test_state = {'client': None}
+        
+        def cancel_settings_test(*args):
+            """Annule le test en cours si l'utilisateur modifie l'hôte ou le port"""
+            client = test_state['client']
+            if client is not None:
+                test_state['client'] = None
+                client.cancel_connect()
+                if settings_window.winfo_exists():
+                    test_button.config(state=tk.NORMAL)
+        
+        host_var.trace_add('write', cancel_settings_test)
+        port_var.trace_add('write', cancel_settings_test)
+        transport_var.trace_add('write', cancel_settings_test)
+        settings_window.bind('<Destroy>', lambda e: cancel_settings_test() if e.widget is settings_window else None)
+    
         def test_connection_from_settings():
             """Teste la connexion avec les paramètres actuels"""
             try:
                 test_host = host_var.get().strip()
                 test_port = int(port_var.get())
+            except ValueError:
+                messagebox.showerror("Erreur", "Port invalide")
+                return
             
-                result = f"Test de connexion sur {test_host}:{test_port}...\n\n"
+            cancel_settings_test()
+            test_client, future = self.probe_js8call(test_host, test_port, transport_var.get())
+            test_state['client'] = test_client
+            test_button.config(state=tk.DISABLED)
             
-                try:
-                    test_client = JS8CallClient(host=test_host, port=test_port)
-                    if test_client.connect():
-                        result += f"✓ Connexion réussie sur {test_host}:{test_port}!\n\n"
-                        result += "JS8Call répond correctement."
+            future.add_done_callback(
+                lambda f: self.root.after(0, lambda: show_test_result(test_client, f, test_host, test_port))
+            )
+        
+        def show_test_result(test_client, future, test_host, test_port):
+            """Affiche le résultat du test (thread Tk)"""
+            if future.cancelled() or test_state['client'] is not test_client:
+                return
+            test_state['client'] = None
+            test_button.config(state=tk.NORMAL)
+            
+            result = f"Test de connexion sur {test_host}:{test_port}...\n\n"
+            
+            try:
+                if future.result():
+                    result += f"✓ Connexion réussie sur {test_host}:{test_port}!\n\n"
+                    result += "JS8Call répond correctement."
+                    if test_client is not self.js8_client:
                         test_client.disconnect()
-                    else:
-                        result += f"✗ Impossible de se connecter à {test_host}:{test_port}\n\n"
-                        result += "Vérifiez que:\n"
-                        result += "• JS8Call est lancé\n"
-                        result += "• TCP Server API est activé dans les paramètres\n"
-                        result += "• Le port correspond"
-                except Exception as e:
-                    result += f"✗ Erreur: {e}\n\n"
-                    result += f"L'adresse {test_host}:{test_port} n'est pas accessible."
+                else:
+                    result += f"✗ Impossible de se connecter à {test_host}:{test_port}\n\n"
+                    result += "Vérifiez que:\n"
+                    result += "• JS8Call est lancé\n"
+                    result += f"• {'TCP Server API' if test_client.transport_name == 'tcp' else 'UDP Server (Accept UDP requests)'} est activé dans les paramètres\n"
+                    result += "• Le port correspond"
+            except Exception as e:
+                result += f"✗ Erreur: {e}\n\n"
+                result += f"L'adresse {test_host}:{test_port} n'est pas accessible."
             
-                messagebox.showinfo("Test de connexion", result)
-            except ValueError:
-                messagebox.showerror("Erreur", "Port invalide")
+            messagebox.showinfo("Test de connexion", result, parent=settings_window)
     
         # Boutons avec une disposition claire
-        ttk.Button(
+        test_button = ttk.Button(
             button_frame,
             text="🔍 Tester la connexion",
             command=test_connection_from_settings,
             width=20
-        ).pack(side=tk.LEFT, padx=5)
+        )
+        test_button.pack(side=tk.LEFT, padx=5)
     
         ttk.Button(
             button_frame,
@@ -519,10 +2260,35 @@ class JS8BulletinBoard:
         ).pack(side=tk.RIGHT, padx=5)
 
 
-
-
-
-
+    def _scrolled_frame(self, parent, **options):
+        """Cadre à défilement vertical (Canvas + Scrollbar) occupant parent; retourne le cadre à remplir"""
+        container = ttk.Frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
+        canvas = tk.Canvas(container, highlightthickness=0, borderwidth=0,
+                           background=ttk.Style().lookup("TFrame", "background"))
+        scrollbar = ttk.Scrollbar(container, orient=tk.VERTICAL, command=canvas.yview)
+        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        frame = ttk.Frame(canvas, **options)
+        window = canvas.create_window(0, 0, window=frame, anchor=tk.NW)
+        frame.bind('<Configure>', lambda e: canvas.configure(scrollregion=canvas.bbox('all')))
+        # Le cadre suit la largeur de la fenêtre redimensionnée
+        canvas.bind('<Configure>', lambda e: canvas.itemconfigure(window, width=e.width))
+        
+        def scroll(event, step):
+            # Une liste défile d'elle-même; rien à faire si tout le contenu est visible
+            if isinstance(event.widget, tk.Listbox) or frame.winfo_reqheight() <= canvas.winfo_height():
+                return
+            canvas.yview_scroll(step, 'units')
+        
+        toplevel = parent.winfo_toplevel()
+        toplevel.bind('<MouseWheel>', lambda e: scroll(e, -1 if e.delta > 0 else 1), add='+')
+        toplevel.bind('<Button-4>', lambda e: scroll(e, -1), add='+')
+        toplevel.bind('<Button-5>', lambda e: scroll(e, 1), add='+')
+        return frame
+    
     def setup_ui(self):
         """Configure l'interface utilisateur (thème sombre)"""
 
@@ -754,6 +2520,19 @@ class JS8BulletinBoard:
         )
         self.duration_label.pack(side=tk.RIGHT, padx=5)
 
+        # Mode de vitesse JS8 du bulletin
+        self.speed_var = tk.StringVar(value=self.speed_labels[self.js8_speed])
+        speed_combo = ttk.Combobox(
+                length_control_frame,
+                textvariable=self.speed_var,
+                values=list(self.speed_labels.values()),
+                state="readonly",
+                width=8
+        )
+        speed_combo.pack(side=tk.RIGHT, padx=5)
+        speed_combo.bind('<<ComboboxSelected>>', self.on_speed_changed)
+        ttk.Label(length_control_frame, text="Vitesse:").pack(side=tk.RIGHT)
+
         # Durée initiale
         self.update_duration_estimate()
 
@@ -767,6 +2546,11 @@ class JS8BulletinBoard:
                 font=("Source Code Pro", 12, "bold")
         )
         self.text_area.pack(fill=tk.BOTH, expand=True)
+        
+        # Caractères hors alphabet JS8 surlignés (sous la sélection)
+        self.text_area.tag_configure('unsupported', background="#ffc0c0", foreground="#cc0000")
+        self.text_area.tag_lower('unsupported')
+        self._hook_text_edits()
 
         # Binding pour validation stricte des caractères
         self.text_area.bind('<<Modified>>', self.on_text_modified)
@@ -777,6 +2561,21 @@ class JS8BulletinBoard:
 
         self.char_label = ttk.Label(counter_frame, text=f"0 / {self.max_chars} caractères")
         self.char_label.pack(side=tk.LEFT)
+        
+        self.optimize_button = ttk.Button(
+                counter_frame,
+                text="✂ Optimiser",
+                command=self.open_optimizer_window
+        )
+        self.optimize_button.pack(side=tk.LEFT, padx=(10, 0))
+        
+        self.transliterate_button = ttk.Button(
+                counter_frame,
+                text="🔤 Translittérer",
+                command=self.transliterate_unsupported,
+                state=tk.DISABLED
+        )
+        self.transliterate_button.pack(side=tk.LEFT, padx=(5, 0))
 
         self.progress_bar = ttk.Progressbar(
                 counter_frame,
@@ -816,6 +2615,91 @@ class JS8BulletinBoard:
                         command=self.update_schedule
                 ).grid(row=i//6, column=i%6, sticky=tk.W, padx=10, pady=2)
 
+        # Décalage par rapport à la grille (ex: 5 = à hh:05, hh:20... pour 15 minutes)
+        ttk.Label(interval_frame, text="Décalage (min):").grid(row=2, column=0, sticky=tk.W, padx=10, pady=2)
+        self.offset_var = tk.StringVar(value="0")
+        ttk.Spinbox(
+                interval_frame,
+                from_=0,
+                to=1439,
+                increment=1,
+                width=6,
+                textvariable=self.offset_var,
+                command=self.update_schedule
+        ).grid(row=2, column=1, sticky=tk.W, padx=10, pady=2)
+        self.offset_var.trace_add('write', lambda *args: self.update_schedule())
+        ttk.Label(
+                interval_frame,
+                text="Horaires alignés sur minuit UTC",
+                foreground="gray",
+                font=("TkDefaultFont", 8)
+        ).grid(row=2, column=2, columnspan=2, sticky=tk.W, padx=10, pady=2)
+        ttk.Label(interval_frame, text="Affichage:").grid(row=2, column=4, sticky=tk.E, padx=(10, 0), pady=2)
+        self.timezone_var = tk.StringVar(value="Locale")
+        timezone_combo = ttk.Combobox(
+                interval_frame,
+                textvariable=self.timezone_var,
+                values=["Locale", "UTC", "Europe/Paris", "Europe/London", "America/New_York", "America/Los_Angeles", "Asia/Tokyo", "Australia/Sydney"],
+                width=16
+        )
+        timezone_combo.grid(row=2, column=5, sticky=tk.W, padx=5, pady=2)
+        timezone_combo.bind('<<ComboboxSelected>>', self.on_timezone_changed)
+        timezone_combo.bind('<Return>', self.on_timezone_changed)
+        timezone_combo.bind('<FocusOut>', self.on_timezone_changed)
+
+        # Dispersion anti-collision: créneau propre à l'indicatif + gigue aléatoire
+        ttk.Label(interval_frame, text="Dispersion (min):").grid(row=3, column=0, sticky=tk.W, padx=10, pady=2)
+        self.spread_var = tk.StringVar(value="10")
+        ttk.Spinbox(
+                interval_frame,
+                from_=0,
+                to=120,
+                increment=1,
+                width=6,
+                textvariable=self.spread_var,
+                command=self.update_schedule
+        ).grid(row=3, column=1, sticky=tk.W, padx=10, pady=2)
+        self.spread_var.trace_add('write', lambda *args: self.update_schedule())
+        ttk.Label(interval_frame, text="Gigue (créneaux):").grid(row=3, column=2, sticky=tk.W, padx=10, pady=2)
+        self.jitter_var = tk.StringVar(value="0")
+        ttk.Spinbox(
+                interval_frame,
+                from_=0,
+                to=20,
+                increment=1,
+                width=4,
+                textvariable=self.jitter_var,
+                command=self.update_schedule
+        ).grid(row=3, column=3, sticky=tk.W, padx=10, pady=2)
+        self.jitter_var.trace_add('write', lambda *args: self.update_schedule())
+        self.spread_label = ttk.Label(interval_frame, foreground="gray", font=("TkDefaultFont", 8))
+        self.spread_label.grid(row=3, column=4, columnspan=2, sticky=tk.W, padx=10, pady=2)
+
+        # Bulletin plus long que la limite: découpé en parties numérotées
+        ttk.Label(interval_frame, text="Bulletins longs:").grid(row=4, column=0, sticky=tk.W, padx=10, pady=2)
+        self.multipart_var = tk.StringVar(value=self.multipart_labels[self.multipart_mode])
+        multipart_combo = ttk.Combobox(
+                interval_frame,
+                textvariable=self.multipart_var,
+                values=list(self.multipart_labels.values()),
+                state="readonly",
+                width=24
+        )
+        multipart_combo.grid(row=4, column=1, columnspan=2, sticky=tk.W, padx=10, pady=2)
+        multipart_combo.bind('<<ComboboxSelected>>', self.on_multipart_changed)
+        ttk.Label(interval_frame, text="Parties max:").grid(row=4, column=3, sticky=tk.W, padx=10, pady=2)
+        self.max_parts_var = tk.StringVar(value=str(self.max_parts))
+        ttk.Spinbox(
+                interval_frame,
+                from_=1,
+                to=MAX_BULLETIN_PARTS,
+                increment=1,
+                width=4,
+                textvariable=self.max_parts_var,
+                command=self.on_max_parts_changed
+        ).grid(row=4, column=4, sticky=tk.W, padx=10, pady=2)
+        self.max_parts_var.trace_add('write', lambda *args: self.on_max_parts_changed())
+
         # --- Boutons de contrôle ---
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=3, column=0, columnspan=2, pady=10)
@@ -845,6 +2729,22 @@ class JS8BulletinBoard:
         )
         self.send_now_button.grid(row=0, column=2, padx=5)
 
+        self.priority_var = tk.StringVar(value=self.priority_labels[Outbox.ROUTINE])
+        ttk.Combobox(
+                button_frame,
+                textvariable=self.priority_var,
+                values=list(self.priority_labels.values()),
+                state="readonly",
+                width=11
+        ).grid(row=0, column=3, padx=5)
+
+        ttk.Button(
+                button_frame,
+                text="📅 Planning",
+                command=self.open_plan_window,
+                width=15
+        ).grid(row=0, column=4, padx=5)
+
         # --- Zone de statut ---
         status_frame = ttk.LabelFrame(main_frame, text="Statut", padding="5")
         status_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
@@ -874,6 +2774,28 @@ class JS8BulletinBoard:
         self.last_emission_label = ttk.Label(status_frame, text="Dernière émission: ---", foreground="#669900")
         self.last_emission_label.grid(row=4, column=0, sticky=tk.W)
 
+        # État d'émission de JS8Call
+        self.tx_status_label = ttk.Label(status_frame, text="TX: ---", foreground="#669900")
+        self.tx_status_label.grid(row=0, column=1, sticky=tk.E)
+
+        # Latence de l'API JS8Call (clic = histogramme)
+        self.latency_label = ttk.Label(status_frame, text="API: ---", foreground="#669900", cursor="hand2")
+        self.latency_label.grid(row=1, column=1, sticky=tk.E)
+        self.latency_label.bind('<Button-1>', self.show_latency_histogram)
+        
+        # Instances JS8Call supplémentaires
+        self.endpoints_label = ttk.Label(status_frame, text="", foreground="#669900")
+        self.endpoints_label.grid(row=2, column=1, sticky=tk.E)
+        
+        # Budget de temps d'émission
+        self.airtime_label = ttk.Label(status_frame, text="TX 1h 0 min · 24h 0 min", foreground="#669900")
+        self.airtime_label.grid(row=3, column=1, sticky=tk.E)
+        
+        # File d'envoi
+        self.outbox_label = ttk.Label(status_frame, text="", foreground="#669900")
+        self.outbox_label.grid(row=4, column=1, sticky=tk.E)
+        status_frame.columnconfigure(0, weight=1)
+
         # --- Log d'activité ---
         log_frame = ttk.LabelFrame(main_frame, text="Journal d'activité", padding="5")
         log_frame.grid(row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
@@ -896,13 +2818,142 @@ class JS8BulletinBoard:
         main_frame.rowconfigure(5, weight=1)
 
 
-
-
+    
+    def compiled_template(self, text):
+        """Modèle compilé d'un texte, analysé une seule fois tant que le bulletin ne change pas"""
+        template = self._templates.get(text)
+        if template is None:
+            template = self._templates[text] = BulletinTemplate(text)
+        return template
+    
+    def template_error(self, parts):
+        """Problème qui empêcherait un rendu correct des variables (vérifié avant d'émettre), ou None"""
+        for part in parts:
+            template = self.compiled_template(part)
+            if template.miscased:
+                fixed = ', '.join(f"{field} → {field.upper()}" for field in template.miscased)
+                return f"Les variables s'écrivent en majuscules: {fixed}"
+            if template.unknown:
+                known = ', '.join(f"{{{name}}}" for name in TEMPLATE_FIELDS)
+                return f"Variable(s) inconnue(s): {', '.join(template.unknown)} (connues: {known})"
+            if 'GRID' in template.fields and not self.station_grid:
+                return "{GRID} est utilisé mais le locator est inconnu (à renseigner dans JS8Call)"
+            if template.max_length > self.max_chars:
+                return f"Longueur maximale {template.max_length} > {self.max_chars}"
+        return None
+    
+    def next_sequence(self):
+        """Numéro de la prochaine émission ({SEQ}: 1 à 9999, puis retour à 1)"""
+        self.sequence = self.sequence % 9999 + 1
+        return self.sequence
+    
+    def template_values(self, sequence=None, following=None):
+        """Valeurs des variables au moment de l'émission.
+        
+        following: émission planifiée suivante ({NEXT}), fixée quand le message
+        est mis en file; None si aucune n'est prévue (émissions arrêtées).
+        """
+        return {
+            'UTC': datetime.now(timezone.utc).strftime('%H%MZ'),
+            'SEQ': sequence if sequence is not None else self.next_sequence(),
+            'GRID': self.station_grid[:TEMPLATE_FIELDS['GRID']].upper(),
+            'NEXT': following.astimezone(timezone.utc).strftime('%H%MZ') if following else TEMPLATE_NO_NEXT,
+        }
+    
+    def following_emission(self):
+        """Émission planifiée qui suivra un message envoyé maintenant ({NEXT}); None si les émissions sont arrêtées"""
+        if not self.emission_active:
+            return None
+        return self.next_emission or self.calculate_next_emission()
+    
+    def bulletin_parts(self, text=None):
+        """Parties du bulletin (une seule s'il tient dans la limite de caractères).
+        
+        ValueError si la limite est trop petite pour le découper: le bulletin
+        n'est jamais tronqué (voir bulletin_error).
+        """
+        if text is None:
+            text = self.text_area.get("1.0", tk.END).strip()
+        # Même texte et même limite qu'au dernier appel (garde de saisie puis
+        # affichage de la même frappe): le découpage est repris tel quel
+        cached, max_chars, parts = self._split
+        if text != cached or max_chars != self.max_chars:
+            try:
+                parts = split_bulletin(text, self.max_chars)
+            except ValueError as e:
+                parts = e
+            self._split = (text, self.max_chars, parts)
+        if isinstance(parts, ValueError):
+            raise ValueError(*parts.args)
+        return list(parts)
+    
+    def bulletin_error(self, text):
+        """Raison pour laquelle le bulletin ne peut pas être émis (vérifiée avant d'émettre), ou None"""
+        try:
+            parts = self.bulletin_parts(text)
+        except ValueError:
+            return f"La limite de {self.max_chars} caractères est trop petite pour découper ce bulletin en parties"
+        return self.template_error(parts)
+    
+    def broadcast_parts(self):
+        """Parties à émettre à la prochaine émission planifiée: toutes à la suite, ou la suivante"""
+        parts = self.bulletin_parts()
+        if self.multipart_mode == 'rotate' and len(parts) > 1:
+            return [parts[self._part_index % len(parts)]]
+        return parts
+    
+    def broadcast_airtime(self):
+        """Temps d'émission (s) d'une émission planifiée, en moyenne pour une partie par émission"""
+        try:
+            parts = self.bulletin_parts()
+        except ValueError:
+            return 0  # Bulletin refusé à l'émission (voir _on_emission_due)
+        total = sum(js8_tx_seconds(part, self.js8_speed) for part in parts)
+        if self.multipart_mode == 'rotate' and parts:
+            return total // len(parts)
+        return total
+    
+    def on_multipart_changed(self, event=None):
+        """Mode d'émission des bulletins en plusieurs parties"""
+        self.set_multipart_mode(next(name for name, label in self.multipart_labels.items() if label == self.multipart_var.get()))
+    
+    def set_multipart_mode(self, mode):
+        """'sequence': toutes les parties à chaque émission; 'rotate': une partie par émission"""
+        if mode not in self.multipart_labels:
+            mode = 'sequence'
+        self.multipart_mode = mode
+        self.multipart_var.set(self.multipart_labels[mode])
+        self._part_index = 0
+        self.update_airtime_status()
+    
+    def on_max_parts_changed(self):
+        """Nombre maximal de parties d'un bulletin long (garde de saisie)"""
+        try:
+            max_parts = int(self.max_parts_var.get())
+        except ValueError:
+            return
+        if 1 <= max_parts <= MAX_BULLETIN_PARTS and max_parts != self.max_parts:
+            self.max_parts = max_parts
+            self.update_char_display(self.char_count)
+    
+    def on_speed_changed(self, event=None):
+        """Mode de vitesse choisi pour le bulletin"""
+        self.set_speed(next(name for name, label in self.speed_labels.items() if label == self.speed_var.get()))
+    
+    def set_speed(self, speed):
+        """Change le mode de vitesse: durées, compteur, budget et créneaux suivent"""
+        if speed not in JS8_SPEEDS:
+            speed = 'normal'
+        self.js8_speed = speed
+        self.speed_var.set(self.speed_labels[speed])
+        self.update_duration_estimate()
+        self.update_char_display(self.char_count)
+        self.update_airtime_status()
+        self.update_schedule()
     
     def update_duration_estimate(self):
         """Met à jour l'estimation de durée de transmission"""
-        segments = (self.max_chars // 13) + 1
-        duration_seconds = segments * 15
+        duration_seconds = estimate_tx_seconds(self.max_chars, self.js8_speed)
         
         if duration_seconds < 60:
             duration_text = f"~{duration_seconds}s"
@@ -940,7 +2991,7 @@ class JS8BulletinBoard:
             if custom_value > 500:
                 if not messagebox.askyesno(
                     "Attention",
-                    f"{custom_value} caractères = ~{custom_value // 13} segments = ~{(custom_value // 13) * 15 // 60} minutes de transmission.\n\nContinuer?"
+                    f"{custom_value} caractères = ~{JS8_SPEEDS[self.js8_speed].estimate_frames(custom_value)} segments = ~{estimate_tx_seconds(custom_value, self.js8_speed) // 60} minutes de transmission.\n\nContinuer?"
                 ):
                     return
             
@@ -959,44 +3010,26 @@ class JS8BulletinBoard:
         
         current_text = self.text_area.get("1.0", tk.END).strip()
         if len(current_text) > new_max:
-            if messagebox.askyesno(
-                "Message trop long",
-                f"Le message actuel ({len(current_text)} car) dépasse la nouvelle limite ({new_max} car).\n\nTronquer à {new_max} caractères?"
-            ):
-                truncated = current_text[:new_max]
-                self.text_area.delete("1.0", tk.END)
-                self.text_area.insert("1.0", truncated)
+            try:
+                parts = len(self.bulletin_parts(current_text))
+                self.log_message(f"Message plus long que la nouvelle limite: émis en {parts} parties")
+            except ValueError:
+                self.log_message("Message impossible à découper à la nouvelle limite: il ne sera pas émis", "WARNING")
         
-        text_length = len(self.text_area.get("1.0", tk.END).strip())
-        self.update_char_display(text_length)
+        self.update_char_display(self.char_count)
         
         self.log_message(f"Limite de caractères changée: {old_max} → {new_max}")
     
     def on_text_modified(self, event=None):
-        """Validation stricte du nombre de caractères avec feedback visuel"""
+        """Met à jour le compteur (un message trop long est découpé en parties, plus tronqué).
+        
+        Le nombre de caractères et les trames sont tenus à jour par
+        _after_text_edit: rien n'est relu ici, quelle que soit la longueur.
+        """
         if self.text_area.edit_modified():
             self.text_area.edit_modified(False)
-            
-            text = self.text_area.get("1.0", tk.END).strip()
-            char_count = len(text)
-            
-            if char_count > self.max_chars:
-                cursor_pos = self.text_area.index(tk.INSERT)
-                truncated_text = text[:self.max_chars]
-                self.text_area.delete("1.0", tk.END)
-                self.text_area.insert("1.0", truncated_text)
-                
-                try:
-                    row, col = cursor_pos.split('.')
-                    new_pos = f"{row}.{min(int(col), self.max_chars)}"
-                    self.text_area.mark_set(tk.INSERT, new_pos)
-                except:
-                    self.text_area.mark_set(tk.INSERT, tk.END)
-                
-                self.root.bell()
-                char_count = self.max_chars
-            
-            self.update_char_display(char_count)
+            self._templates = {}
+            self.update_char_display(self.char_count)
     
     def update_char_display(self, char_count):
         """Met à jour l'affichage du compteur et de la barre de progression"""
@@ -1005,7 +3038,10 @@ class JS8BulletinBoard:
         warning_threshold = max(self.max_chars - 30, int(self.max_chars * 0.85))
         critical_threshold = max(self.max_chars - 15, int(self.max_chars * 0.93))
         
-        if char_count >= self.max_chars:
+        if char_count > self.max_chars:
+            color = "#0066cc"
+            msg = ""
+        elif char_count >= self.max_chars:
             color = "red"
             msg = "LIMITE ATTEINTE"
         elif char_count >= critical_threshold:
@@ -1020,21 +3056,282 @@ class JS8BulletinBoard:
             msg = ""
         
         label_text = f"{char_count} / {self.max_chars} caractères"
+        if char_count > self.max_chars:
+            try:
+                parts = self.bulletin_parts()
+            except ValueError:
+                parts = None
+            if parts is None:
+                color = "red"
+                label_text += " · découpage impossible"
+            else:
+                # Trames par texte de partie: seules les parties modifiées sont recomptées
+                known = self._part_frames
+                self._part_frames = {part: known[part] if part in known else count_js8_frames(part) for part in parts}
+                frames = sum(self._part_frames[part] for part in parts)
+                label_text += f" · {len(parts)} parties"
+                label_text += f" · {frames} trame(s) = {frames * JS8_SPEEDS[self.js8_speed].cycle} s"
+        elif char_count:
+            frames = self.frame_counter.frames
+            label_text += f" · {frames} trame(s) = {frames * JS8_SPEEDS[self.js8_speed].cycle} s"
         if msg:
             label_text += f" - {msg}"
         
         self.char_label.config(text=label_text, foreground=color)
+        unsupported = self.text_area.tag_nextrange('unsupported', "1.0")
+        self.transliterate_button.config(state=tk.NORMAL if unsupported and self.text_editable() else tk.DISABLED)
+        if self._optimizer_refresh:
+            self._optimizer_refresh()
+    
+    def _load_message(self, text):
+        """Remplace le texte du bulletin (fichier ouvert); prévient si la garde de saisie l'a coupé"""
+        self.text_area.delete("1.0", tk.END)
+        self.text_area.insert("1.0", text)
+        if self.text_length < len(text):
+            messagebox.showwarning(
+                "Message tronqué",
+                f"Le message dépasse {self.max_parts} parties de {self.max_chars} caractères et a été tronqué "
+                f"({len(text)} → {self.text_length})."
+            )
+    
+    def _hook_text_edits(self):
+        """Intercepte les insertions et suppressions du widget texte (comme idlelib.redirector):
+        la zone modifiée est connue exactement, seule celle-ci est revalidée.
+        
+        La commande du widget devient un alias vers la procédure Tcl JS8_TEXT_PROC,
+        qui exécute elle-même la commande d'origine: ses erreurs remontent telles
+        quelles à l'appelant (les liaisons de classe Text comptent sur catch), et
+        seules les modifications passent par Python, avant et après l'opération.
+        """
+        widget = self.text_area._w
+        self._text_command = widget + "_js8"
+        self._text_edit = None
+        # Tcl 8.6 compte un caractère hors du plan de base comme deux
+        self._tk_surrogates = self.root.tk.call('string', 'length', '\U0001F600') == 2
+        self.root.tk.call("rename", widget, self._text_command)
+        self.root.tk.eval(JS8_TEXT_PROC)
+        self.root.tk.call(
+            "interp", "alias", "", widget, "", "js8_text_command", self._text_command,
+            self.root.register(self._before_text_edit), self.root.register(self._after_text_edit),
+        )
+        # Zone modifiée, en index Tk: l'insertion se place entre les deux marques
+        self.text_area.mark_set('js8_edit_start', "1.0")
+        self.text_area.mark_gravity('js8_edit_start', tk.LEFT)
+        self.text_area.mark_set('js8_edit_end', "1.0")
+        self.text_area.mark_gravity('js8_edit_end', tk.RIGHT)
+    
+    def text_editable(self):
+        """Le widget texte accepte les modifications (il est désactivé pendant les émissions)"""
+        return str(self.text_area.cget('state')) != tk.DISABLED
+    
+    def _before_text_edit(self, operation, *args):
+        """Avant une modification: note la zone touchée et retourne la commande à
+        exécuter, éventuellement raccourcie, ou () pour ne rien faire.
+        
+        Garde de saisie: ce qui ferait dépasser max_parts parties n'est pas inséré,
+        sans réécrire le texte (historique d'annulation et curseur intacts); une
+        suppression n'est jamais refusée.
+        """
+        self._text_edit = None
+        if operation in ('insert', 'replace', 'delete') and not self.text_editable():
+            # Tk ignorerait la modification: les compteurs ne doivent pas la voir non plus
+            return ()
+        try:
+            if operation in ('insert', 'replace') and args:
+                start = self._text_position(args[0])
+                end = self._text_position(args[1]) if operation == 'replace' else start
+                removed = self.text_area.get(start, end)
+                head = args[:1] if operation == 'insert' else args[:2]
+                chars = ''.join(args[len(head)::2])
+                # Une seule partie tient toujours: le découpage n'est vérifié qu'au-delà
+                if chars and self.text_length + len(chars) - len(removed) > self.max_chars:
+                    room = self._insert_room(start, end, chars)
+                    if room < len(chars):
+                        self.root.bell()
+                        chars = chars[:room]
+                        if not chars and operation == 'insert':
+                            return ()
+                        args = head + (chars,) + args[len(head) + 1:len(head) + 2]
+            elif operation == 'delete' and len(args) in (1, 2):
+                start = self._text_position(args[0])
+                end = self._text_position(args[1] if len(args) == 2 else f"{start}+1c")
+                removed = self.text_area.get(start, end)
+                chars = ''
+            else:
+                return (operation,) + args
+            self._text_edit = (self._text_offset(start), removed, chars)
+            self.text_area.mark_set('js8_edit_start', start)
+            self.text_area.mark_set('js8_edit_end', start)
+        except tk.TclError:
+            # Index invalide (sel.first sans sélection...): la commande d'origine
+            # renverra elle-même l'erreur à l'appelant
+            self._text_edit = None
+        return (operation,) + args
+    
+    def _insert_room(self, start, end, chars):
+        """Caractères de chars qui peuvent remplacer start..end sans que le bulletin
+        dépasse max_parts parties, d'après split_bulletin (en-tête et numérotation compris).
+        
+        Le découpage passe par bulletin_parts: quand tout chars tient (une frappe),
+        l'affichage qui suit reprend ce découpage au lieu de redécouper le texte.
+        """
+        before = self.text_area.get("1.0", start)
+        after = self.text_area.get(end, "end-1c")
+        
+        def fits(count):
+            try:
+                return len(self.bulletin_parts((before + chars[:count] + after).strip())) <= self.max_parts
+            except ValueError:
+                return False
+        
+        if fits(len(chars)):
+            return len(chars)
+        # Plus longue insertion qui tient (recherche dichotomique)
+        low, high = 0, len(chars) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if fits(middle):
+                low = middle
+            else:
+                high = middle - 1
+        return low
+    
+    def _after_text_edit(self, operation, *args):
+        """Après une modification réussie: tient à jour, à partir de la seule zone
+        modifiée, le nombre de caractères, les trames et le surlignage"""
+        edit, self._text_edit = self._text_edit, None
+        if edit is not None:
+            offset, removed, chars = edit
+            self.text_length += len(chars) - len(removed)
+            # Le compteur de trames est en positions Tk, comme offset
+            self.frame_counter.splice(offset, len(self._tk_text(removed)), self._tk_text(chars))
+            self._count_chars()
+            self.validate_js8_region('js8_edit_start', 'js8_edit_end')
+        elif operation == 'delete' or (operation == 'edit' and args and args[0] in ('undo', 'redo')):
+            # Suppression multiple ou annulation: zone inconnue, tout est recompté
+            self._resync_text()
+    
+    def _text_position(self, index):
+        """Index Tk normalisé, ramené avant le retour à la ligne final du widget"""
+        position = self.text_area.index(index)
+        if self.text_area.compare(position, '>', "end-1c"):
+            position = self.text_area.index("end-1c")
+        return position
+    
+    def _text_offset(self, position):
+        """Nombre de caractères avant position"""
+        return int(self.root.tk.call(self._text_command, 'count', '-chars', "1.0", position))
+    
+    def _tk_text(self, text):
+        """Texte tel que le widget le compte (paires de substitution sous Tcl 8.6)"""
+        return tk_chars(text) if self._tk_surrogates else text
+    
+    def _tk_index(self, text, offset):
+        """Index Tk du caractère offset (Python) de text, texte complet du widget"""
+        return f"1.0+{len(self._tk_text(text[:offset]))}c"
+    
+    def _resync_text(self):
+        """Recompte le texte entier (après une modification dont la zone n'est pas connue)"""
+        text = self.text_area.get("1.0", "end-1c")
+        self.text_length = len(text)
+        self.frame_counter.update(self._tk_text(text))
+        self._count_chars()
+        self.validate_js8_region("1.0", "end-1c")
+    
+    def _count_chars(self):
+        """char_count: longueur du texte émis (sans blancs de début et de fin).
+        
+        Les blancs sont les mêmes dans le texte du compteur de trames, dont
+        seule la forme des emoji diffère: le compteur les tient à jour à chaque
+        modification, ils se retirent de text_length sans relire le texte.
+        """
+        self.char_count = self.text_length - self.frame_counter.blanks
+    
+    def validate_js8_region(self, start, end):
+        """Surligne les caractères hors alphabet JS8 entre start et end.
+        
+        Coût proportionnel à la zone, pas au message; près du début, la zone
+        s'étend à l'en-tête dirigé éventuel, dont les @ et : sont valides.
+        """
+        widget = self.text_area
+        # Une variable ({UTC}...) peut déborder de la zone modifiée: elle est élargie
+        start = widget.index(f"{start}-{TEMPLATE_FIELD_MAX}c")
+        end = widget.index(f"{end}+{TEMPLATE_FIELD_MAX}c")
+        header_end = None
+        if widget.compare(start, '<', f"1.0+{JS8_HEADER_MAX}c"):
+            start = "1.0"
+            head = self._tk_text(widget.get("1.0", f"1.0+{JS8_HEADER_MAX}c"))
+            match = JS8_DIRECTED_HEADER.match(head.lstrip().upper())
+            header_end = len(head) - len(head.lstrip()) + match.end() if match else 0
+            if widget.compare(end, '<', f"1.0+{JS8_HEADER_MAX}c"):
+                end = f"1.0+{JS8_HEADER_MAX}c"
+        # Positions comptées comme Tk (un emoji y occupe deux caractères)
+        text = self._tk_text(widget.get(start, end))
+        before = self._tk_text(widget.get(f"{start}-{TEMPLATE_FIELD_MAX}c", start))
+        after = self._tk_text(widget.get(end, f"{end}+{TEMPLATE_FIELD_MAX}c"))
+        fields = set()
+        for match in TEMPLATE_FIELD.finditer(before + text + after):
+            # {utc} ou {Grid} restent surlignés: refusés avant d'émettre (template_error)
+            if match.group(1) in TEMPLATE_FIELDS:
+                fields.update(range(match.start() - len(before), match.end() - len(before)))
+        widget.tag_remove('unsupported', start, end)
+        for offset, char in enumerate(text):
+            if offset in fields:
+                continue
+            if not js8_supported(char) and (header_end is None or offset >= header_end):
+                widget.tag_add('unsupported', f"{start}+{offset}c")
+    
+    def transliterate_unsupported(self):
+        """Remplace en bloc les caractères surlignés par leur équivalent JS8"""
+        if not self.text_editable():
+            return
+        ranges = self.text_area.tag_ranges('unsupported')
+        count = 0
+        # De la fin vers le début: les positions précédentes restent valables
+        for index in range(len(ranges) - 2, -1, -2):
+            start, end = ranges[index], ranges[index + 1]
+            text = self.text_area.get(start, end)
+            self.text_area.delete(start, end)
+            self.text_area.insert(start, js8_transliterate(text))
+            count += len(text)
+        if count:
+            self.log_message(f"Translittéré(s): {count} caractère(s)")
+    
+    def probe_js8call(self, host, port, transport):
+        """Lance un test de connexion; retourne (client, Future résolu avec True/False).
+        
+        En UDP un seul client peut écouter un port: si le client principal
+        l'utilise déjà, on l'interroge plutôt que d'ouvrir un second socket.
+        """
+        client = self.js8_client
+        if (transport == 'udp' and client and client.connected
+                and client.transport_name == 'udp' and client.port == port):
+            future = Future()
+            client.get_callsign().add_done_callback(lambda f: future.set_result(f.exception() is None))
+            return client, future
+        
+        client = JS8CallClient(host=host, port=port, transport=transport)
+        return client, client.connect()
     
     def test_connection(self):
         """Teste et affiche le statut de la connexion"""
+        test_client, future = self.probe_js8call(self.js8_host, self.js8_port, self.js8_transport)
+        future.add_done_callback(
+            lambda f: self.root.after(0, lambda: self._show_connection_test(test_client, f))
+        )
+    
+    def _show_connection_test(self, test_client, future):
+        """Affiche le résultat de test_connection (thread Tk)"""
         result = "=== Test de connexion JS8Call ===\n\n"
-        result += f"Test de {self.js8_host}:{self.js8_port}...\n"
+        result += f"Test de {test_client.transport_name.upper()} {test_client.host}:{test_client.port}...\n"
         
         try:
-            test_client = JS8CallClient(host=self.js8_host, port=self.js8_port)
-            if test_client.connect():
+            if future.cancelled():
+                result += f"✗ Connexion échouée\n"
+            elif future.result():
                 result += f"✓ Connexion réussie!\n"
-                test_client.disconnect()
+                if test_client is not self.js8_client:
+                    test_client.disconnect()
             else:
                 result += f"✗ Connexion échouée\n"
         except Exception as e:
@@ -1051,7 +3348,7 @@ class JS8BulletinBoard:
     
     def log_message(self, message, level="INFO"):
         """Ajoute un message au journal"""
-        timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp = self.format_time(datetime.now(timezone.utc))
         log_entry = f"[{timestamp}] {level}: {message}\n"
         
         self.log_area.config(state=tk.NORMAL)
@@ -1073,6 +3370,9 @@ class JS8BulletinBoard:
         if messagebox.askyesno("Nouveau fichier", "Créer un nouveau message ? Les modifications non sauvegardées seront perdues."):
             self.text_area.delete("1.0", tk.END)
             self.interval_var.set("15")
+            self.offset_var.set("0")
+            self.set_speed('normal')
+            self.set_multipart_mode('sequence')
             self.current_file = None
             self.file_label.config(text="Sans titre")
             self.update_char_display(0)
@@ -1125,35 +3425,21 @@ class JS8BulletinBoard:
                                     self.custom_length_var.set(str(saved_max_chars))
                                     self.apply_custom_length()
                         
-                        if len(message_text) > self.max_chars:
-                            message_text = message_text[:self.max_chars]
-                            messagebox.showwarning(
-                                "Message tronqué",
-                                f"Le message a été tronqué à {self.max_chars} caractères."
-                            )
-                        
-                        self.text_area.delete("1.0", tk.END)
-                        self.text_area.insert("1.0", message_text)
+                        self._load_message(message_text)
                         self.interval_var.set(data.get('interval', '15'))
+                        self.offset_var.set(data.get('schedule_offset', '0'))
+                        self.set_speed(data.get('speed', 'normal'))
+                        self.set_multipart_mode(data.get('multipart', 'sequence'))
                     else:
                         content = f.read()
                         
-                        if len(content) > self.max_chars:
-                            content = content[:self.max_chars]
-                            messagebox.showwarning(
-                                "Message tronqué",
-                                f"Le message a été tronqué à {self.max_chars} caractères."
-                            )
-                        
-                        self.text_area.delete("1.0", tk.END)
-                        self.text_area.insert("1.0", content)
+                        self._load_message(content)
                 
                 self.current_file = filename
                 self.file_label.config(text=os.path.basename(filename))
                 self.log_message(f"Fichier ouvert: {os.path.basename(filename)}")
                 
-                text = self.text_area.get("1.0", tk.END).strip()
-                self.update_char_display(len(text))
+                self.update_char_display(self.char_count)
                 
             except Exception as e:
                 messagebox.showerror("Erreur", f"Impossible d'ouvrir le fichier:\n{e}")
@@ -1185,15 +3471,24 @@ class JS8BulletinBoard:
         """Enregistre dans un fichier"""
         try:
             text = self.text_area.get("1.0", tk.END).strip()
+            try:
+                parts = len(self.bulletin_parts(text))
+            except ValueError:
+                parts = 0  # Découpage impossible à cette limite
             
             if filename.endswith('.json'):
                 data = {
                     'message': text,
                     'interval': self.interval_var.get(),
+                    'schedule_offset': self.offset_var.get(),
+                    'speed': self.js8_speed,
+                    'multipart': self.multipart_mode,
                     'max_chars': self.max_chars,
                     'char_count': len(text),
+                    'parts': parts,
                     'js8_host': self.js8_host,
                     'js8_port': self.js8_port,
+                    'js8_transport': self.js8_transport,
                     'js8_frequency': self.js8_frequency,
                     'saved_at': datetime.now().isoformat()
                 }
@@ -1213,7 +3508,7 @@ class JS8BulletinBoard:
     
     def load_last_config(self):
         """Charge la dernière configuration au démarrage"""
-        config_file = "js8_bulletin_last.json"
+        config_file = self.config_file
         if os.path.exists(config_file):
             try:
                 with open(config_file, 'r', encoding='utf-8') as f:
@@ -1229,6 +3524,10 @@ class JS8BulletinBoard:
                     if saved_port:
                         self.js8_port = saved_port
                     
+                    saved_transport = data.get('js8_transport')
+                    if saved_transport in JS8_TRANSPORTS:
+                        self.js8_transport = saved_transport
+                    
                     saved_freq = data.get('js8_frequency')
                     if saved_freq is not None:
                         self.js8_frequency = saved_freq
@@ -1238,6 +3537,36 @@ class JS8BulletinBoard:
                     if saved_autostart is not None:
                         self.autostart_enabled = saved_autostart
                     
+                    # Mêmes limites que dans les paramètres; une valeur invalide garde le défaut
+                    policy = self.reconnect_policy
+                    policy.initial = config_number(data.get('reconnect_initial'), policy.initial, lambda v: v > 0)
+                    policy.maximum = max(policy.initial, config_number(data.get('reconnect_max'), policy.maximum))
+                    policy.jitter = config_number(data.get('reconnect_jitter'), policy.jitter, lambda v: 0 <= v <= 1)
+                    self.ping_interval = config_number(data.get('ping_interval'), self.ping_interval,
+                                                       lambda v: v == 0 or v >= 5)
+                    self.js8_endpoints = [JS8Endpoint.from_config(e) for e in data.get('js8_endpoints', [])]
+                    self.governor.hour_cap = config_number(data.get('airtime_hour_cap'), self.governor.hour_cap,
+                                                           lambda v: v >= 0)
+                    self.governor.day_cap = config_number(data.get('airtime_day_cap'), self.governor.day_cap,
+                                                          lambda v: v >= 0)
+                    if data.get('catchup_policy') in CatchUpPolicy.MODES:
+                        self.catchup.mode = data['catchup_policy']
+                    self.catchup.tolerance = config_number(data.get('catchup_tolerance'), self.catchup.tolerance,
+                                                           lambda v: v >= 0)
+                    self.catchup.spacing = config_number(data.get('catchup_spacing'), self.catchup.spacing,
+                                                         lambda v: v >= 0)
+                    self.station_callsign = data.get('station_callsign', self.station_callsign)
+                    self.station_grid = data.get('station_grid', self.station_grid)
+                    self.max_parts = int(config_number(data.get('max_parts'), self.max_parts,
+                                                       lambda v: v == int(v) and 1 <= v <= MAX_BULLETIN_PARTS))
+                    self.max_parts_var.set(str(self.max_parts))
+                    self.sequence = int(config_number(data.get('sequence'), self.sequence,
+                                                      lambda v: v == int(v) and 0 <= v <= 9999))
+                    self.spread_var.set(data.get('spread_minutes', self.spread_var.get()))
+                    self.jitter_var.set(data.get('jitter_slots', self.jitter_var.get()))
+                    if self.set_display_timezone(data.get('display_timezone', '')):
+                        self.timezone_var.set(self.display_timezone or "Locale")
+                    
                     saved_max_chars = data.get('max_chars', 210)
                     if saved_max_chars != self.max_chars:
                         for option_name, option_value in self.max_chars_options.items():
@@ -1246,13 +3575,14 @@ class JS8BulletinBoard:
                                 self.max_chars = saved_max_chars
                                 break
                     
-                    if len(message) > self.max_chars:
-                        message = message[:self.max_chars]
-                    
                     if hasattr(self, 'text_area'):
-                        self.text_area.insert("1.0", message)
+                        # Limites déjà chargées: un message trop long est coupé et l'opérateur prévenu
+                        self._load_message(message)
                         self.interval_var.set(data.get('interval', '15'))
-                        self.update_char_display(len(message))
+                        self.offset_var.set(data.get('schedule_offset', '0'))
+                        self.set_speed(data.get('speed', 'normal'))
+                        self.set_multipart_mode(data.get('multipart', 'sequence'))
+                        self.update_char_display(self.char_count)
                         self.update_duration_estimate()
                     
                 autostart_status = "activé" if self.autostart_enabled else "désactivé"
@@ -1262,17 +3592,38 @@ class JS8BulletinBoard:
     
     def save_current_config(self):
         """Sauvegarde la configuration actuelle"""
-        config_file = "js8_bulletin_last.json"
+        config_file = self.config_file
         try:
             text = self.text_area.get("1.0", tk.END).strip()
             data = {
                 'message': text,
                 'interval': self.interval_var.get(),
+                'schedule_offset': self.offset_var.get(),
+                'speed': self.js8_speed,
+                'multipart': self.multipart_mode,
                 'max_chars': self.max_chars,
                 'js8_host': self.js8_host,
                 'js8_port': self.js8_port,
+                'js8_transport': self.js8_transport,
                 'js8_frequency': self.js8_frequency,
-                'autostart_enabled': self.autostart_enabled,  # NOUVEAU
+                'autostart_enabled': self.autostart_enabled,
+                'reconnect_initial': self.reconnect_policy.initial,
+                'reconnect_max': self.reconnect_policy.maximum,
+                'reconnect_jitter': self.reconnect_policy.jitter,
+                'ping_interval': self.ping_interval,  # NOUVEAU
+                'js8_endpoints': [endpoint.to_config() for endpoint in self.js8_endpoints],
+                'airtime_hour_cap': self.governor.hour_cap,
+                'airtime_day_cap': self.governor.day_cap,
+                'catchup_policy': self.catchup.mode,
+                'catchup_tolerance': self.catchup.tolerance,
+                'catchup_spacing': self.catchup.spacing,
+                'station_callsign': self.station_callsign,
+                'station_grid': self.station_grid,
+                'max_parts': self.max_parts,
+                'sequence': self.sequence,
+                'spread_minutes': self.spread_var.get(),
+                'jitter_slots': self.jitter_var.get(),
+                'display_timezone': self.display_timezone,
                 'saved_at': datetime.now().isoformat()
             }
             with open(config_file, 'w', encoding='utf-8') as f:
@@ -1280,48 +3631,327 @@ class JS8BulletinBoard:
         except Exception as e:
             print(f"Erreur sauvegarde config: {e}")
     
+    def emission_schedule(self):
+        """Planning correspondant à l'intervalle et au décalage choisis, décalé du créneau de la station"""
+        try:
+            offset = int(float(self.offset_var.get()) * 60)
+        except ValueError:
+            offset = 0
+        schedule = EmissionSchedule.from_interval(self.interval_var.get(), offset)
+        return EmissionSchedule(schedule.period, schedule.offset + self.station_offset(schedule.period))
+    
+    def station_offset(self, period):
+        """Décalage anti-collision (s): créneau tiré de l'indicatif dans la fenêtre de dispersion"""
+        try:
+            spread = float(self.spread_var.get()) * 60
+        except ValueError:
+            spread = 0
+        cycle = self.slot_clock().cycle
+        return station_slot_offset(self.station_callsign, int(min(spread, period) // cycle), cycle)
+    
+    def emission_jitter(self, planned):
+        """Gigue (s) d'une émission planifiée: tirée au hasard, mais fixe pour une émission donnée"""
+        try:
+            slots = max(0, int(self.jitter_var.get()))
+        except ValueError:
+            slots = 0
+        if not slots:
+            return 0
+        rng = random.Random(self._jitter_seed ^ int(planned.timestamp()))
+        return rng.randint(0, slots) * self.slot_clock().cycle
+    
     def calculate_next_emission(self):
-        """Calcule la prochaine heure d'émission"""
-        now = datetime.now()
-        interval = self.interval_var.get()
-        
-        if interval == "odd":
-            next_hour = now.replace(minute=0, second=0, microsecond=0)
-            while next_hour.hour % 2 != 1 or next_hour <= now:
-                next_hour += timedelta(hours=1)
-            return next_hour
-        elif interval == "even":
-            next_hour = now.replace(minute=0, second=0, microsecond=0)
-            while next_hour.hour % 2 != 0 or next_hour <= now:
-                next_hour += timedelta(hours=1)
-            return next_hour
-        else:
-            minutes = int(interval)
-            next_time = now.replace(second=0, microsecond=0)
-            
-            current_minute = next_time.minute
-            next_minute = ((current_minute // minutes) + 1) * minutes
-            
-            if next_minute >= 60:
-                next_time += timedelta(hours=next_minute // 60)
-                next_minute = next_minute % 60
-            
-            next_time = next_time.replace(minute=next_minute)
-            return next_time
+        """Calcule la prochaine heure d'émission (grille alignée sur minuit UTC, plus la gigue).
+        
+        Une émission dont la remise à JS8Call est déjà passée n'est plus «à venir».
+        """
+        earliest = datetime.now(timezone.utc) + timedelta(seconds=self.handoff_lead())
+        schedule = self.emission_schedule()
+        planned = schedule.next_after(earliest - timedelta(seconds=schedule.period))
+        while planned + timedelta(seconds=self.emission_jitter(planned)) <= earliest:
+            planned = schedule.next_after(planned)
+        return planned + timedelta(seconds=self.emission_jitter(planned))
+    
+    def on_timezone_changed(self, event=None):
+        """Fuseau d'affichage choisi ou saisi (nom IANA)"""
+        name = self.timezone_var.get().strip()
+        if name == "Locale":
+            name = ''
+        if name == self.display_timezone:
+            return
+        if not self.set_display_timezone(name):
+            hint = "" if ZoneInfo else "\n(les fuseaux nommés demandent Python 3.9+)"
+            messagebox.showerror("Erreur", f"Fuseau inconnu: {name}{hint}")
+            self.timezone_var.set(self.display_timezone or "Locale")
+            return
+        self.log_message(f"Heures affichées en {self.display_timezone or 'heure locale'}")
+    
+    def update_spread_label(self):
+        """Affiche le décalage anti-collision de la station"""
+        if not hasattr(self, 'spread_label'):
+            return
+        if not self.station_callsign:
+            self.spread_label.config(text="(indicatif pas encore lu dans JS8Call)")
+            return
+        offset = self.station_offset(self.emission_schedule().period)
+        self.spread_label.config(text=f"{self.station_callsign}: +{offset // 60}:{offset % 60:02d}")
+    
+    def slot_clock(self):
+        return JS8SlotClock(JS8_CYCLE_SECONDS[self.js8_speed])
+    
+    def handoff_lead(self):
+        """Avance de la remise à JS8Call sur le début du créneau visé"""
+        qsy = self.js8_frequency or any(endpoint.frequency for endpoint in self.js8_endpoints)
+        return self.slot_lead + (self.qsy_lead if qsy else 0)
+    
+    def handoff_time(self, target):
+        """Instant de remise à JS8Call pour émettre dans le créneau commençant à target (ou juste après)"""
+        clock = self.slot_clock()
+        start = clock.slot_start(clock.slot_at_or_after(target.timestamp()))
+        return datetime.fromtimestamp(start - self.handoff_lead(), target.tzinfo)
     
     def update_schedule(self):
         """Met à jour l'affichage de la prochaine émission"""
+        self.update_spread_label()
+        if self._plan_refresh:
+            self._plan_refresh()
         if self.emission_active:
             self.next_emission = self.calculate_next_emission()
+            self.scheduler.reschedule(self.handoff_time(self.next_emission))
             if self.next_emission:
-                time_diff = self.next_emission - datetime.now()
+                time_diff = self.next_emission - datetime.now(timezone.utc)
                 minutes = int(time_diff.total_seconds() // 60)
+                utc = "" if self.display_tz is timezone.utc else f" ({self.next_emission.strftime('%H:%M')} UTC)"
                 self.next_emission_label.config(
-                    text=f"Prochaine émission: {self.next_emission.strftime('%H:%M:%S')} (dans {minutes} min)"
+                    text=f"Prochaine émission: {self.format_time(self.next_emission)}{utc} (dans {minutes} min)"
                 )
             else:
                 self.next_emission_label.config(text="Prochaine émission: Manuel uniquement")
     
+    def display_time(self, when):
+        """Instant UTC converti dans le fuseau d'affichage"""
+        return when.astimezone(self.display_tz)
+    
+    def format_time(self, when, pattern='%H:%M:%S'):
+        return self.display_time(when).strftime(pattern)
+    
+    def set_display_timezone(self, name):
+        """Change le fuseau d'affichage; retourne False si le nom est inconnu"""
+        zone = load_timezone(name)
+        if name.strip() and zone is None:
+            return False
+        self.display_timezone = name.strip()
+        self.display_tz = zone
+        self.update_schedule()
+        return True
+    
+    def planned_emissions(self, horizon):
+        """Émissions des horizon prochaines secondes: range d'instants Unix de la grille (gigue non comprise)"""
+        start = time.time() + self.handoff_lead()
+        return self.emission_schedule().timestamps_between(start, start + horizon)
+    
+    def emission_time(self, timestamp):
+        """Heure d'émission (datetime UTC) d'un instant de la grille, gigue comprise"""
+        planned = datetime.fromtimestamp(timestamp, timezone.utc)
+        return planned + timedelta(seconds=self.emission_jitter(planned))
+    
+    def open_plan_window(self):
+        """Fenêtre de planning: émissions à venir sur un horizon choisi, avec le temps d'émission total.
+        
+        La liste est virtuelle: seules les lignes visibles sont construites,
+        un an d'émissions toutes les 10 minutes s'affiche donc instantanément.
+        """
+        if self._plan_window is not None and self._plan_window.winfo_exists():
+            self._plan_window.lift()
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Planning des émissions")
+        window.geometry("520x560")
+        self._plan_window = window
+        
+        main_frame = ttk.Frame(window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        top_frame = ttk.Frame(main_frame)
+        top_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(top_frame, text="Horizon:").pack(side=tk.LEFT, padx=(0, 5))
+        horizons = {
+            "1 jour": 1,
+            "1 semaine": 7,
+            "1 mois": 31,
+            "1 an": 365,
+        }
+        horizon_var = tk.StringVar(value="1 semaine")
+        horizon_combo = ttk.Combobox(top_frame, textvariable=horizon_var, values=list(horizons), state="readonly", width=12)
+        horizon_combo.pack(side=tk.LEFT)
+        
+        summary_label = ttk.Label(main_frame, foreground="#669900")
+        summary_label.pack(fill=tk.X, pady=(0, 5))
+        
+        list_frame = ttk.Frame(main_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        listbox = tk.Listbox(list_frame, height=24, font=("Courier", 10), activestyle=tk.NONE)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        view = {'plan': range(0), 'first': 0, 'rows': 24}
+        
+        def resize(event):
+            """Nombre de lignes visibles d'après la hauteur réelle de la liste (fenêtre redimensionnée)"""
+            # Hauteur d'une ligne de Listbox: interligne de la police + 1 + bordures de sélection
+            line = (tkfont.Font(font=listbox.cget('font')).metrics('linespace') + 1
+                    + 2 * int(listbox.cget('selectborderwidth')))
+            inner = event.height - 2 * (int(listbox.cget('borderwidth')) + int(listbox.cget('highlightthickness')))
+            rows = max(1, inner // line)
+            if rows != view['rows']:
+                view['rows'] = rows
+                render()
+        
+        def render():
+            plan = view['plan']
+            rows = view['rows']
+            first = view['first'] = max(0, min(view['first'], len(plan) - rows))
+            listbox.delete(0, tk.END)
+            for timestamp in plan[first:first + rows]:
+                utc = self.emission_time(timestamp)
+                when = self.display_time(utc)
+                listbox.insert(tk.END, f"{when.strftime('%a %d/%m/%Y  %H:%M:%S')}   ({utc.strftime('%H:%M')} UTC)")
+            if plan:
+                scrollbar.set(first / len(plan), min(1.0, (first + rows) / len(plan)))
+            else:
+                scrollbar.set(0, 1)
+        
+        def scroll(action, amount, what=None):
+            if action == 'moveto':
+                view['first'] = int(float(amount) * len(view['plan']))
+            else:
+                view['first'] += int(amount) * (view['rows'] if what == 'pages' else 1)
+            render()
+        
+        def refresh(*args):
+            days = horizons[horizon_var.get()]
+            view['plan'] = self.planned_emissions(days * 86400)
+            count = len(view['plan'])
+            airtime = count * self.broadcast_airtime()
+            summary_label.config(
+                text=f"{count} émission(s) · temps d'émission {airtime // 3600} h {airtime % 3600 // 60:02d} min"
+                     f" (≈ {airtime / 60 / days:.0f} min/jour)"
+            )
+            render()
+        
+        def on_close():
+            self._plan_window = None
+            self._plan_refresh = None
+            window.destroy()
+        
+        scrollbar.config(command=scroll)
+        listbox.bind('<MouseWheel>', lambda e: scroll('scroll', -1 if e.delta > 0 else 1, 'units'))
+        listbox.bind('<Button-4>', lambda e: scroll('scroll', -1, 'units'))
+        listbox.bind('<Button-5>', lambda e: scroll('scroll', 1, 'units'))
+        listbox.bind('<Configure>', resize)
+        horizon_combo.bind('<<ComboboxSelected>>', refresh)
+        window.protocol("WM_DELETE_WINDOW", on_close)
+        self._plan_refresh = refresh
+        refresh()
+    
+    def open_optimizer_window(self):
+        """Fenêtre d'optimisation: abréviations et formats plus courts, classés par trames gagnées.
+        
+        Les propositions sont recalculées à chaque frappe tant que la fenêtre est ouverte.
+        """
+        if self._optimizer_window is not None and self._optimizer_window.winfo_exists():
+            self._optimizer_window.lift()
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Optimiseur de bulletin")
+        window.geometry("520x400")
+        self._optimizer_window = window
+        
+        main_frame = ttk.Frame(window, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        summary_label = ttk.Label(main_frame, foreground="#669900")
+        summary_label.pack(fill=tk.X, pady=(0, 5))
+        
+        listbox = tk.Listbox(main_frame, height=14, font=("Courier", 10), activestyle=tk.NONE, exportselection=False)
+        listbox.pack(fill=tk.BOTH, expand=True)
+        
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        view = {'text': '', 'suggestions': []}
+        
+        def current_text():
+            return self.text_area.get("1.0", "end-1c")
+        
+        def refresh(*args):
+            text = view['text'] = current_text()
+            suggestions = view['suggestions'] = suggest_abbreviations(text)
+            cycle = JS8_SPEEDS[self.js8_speed].cycle
+            frames = count_js8_frames(text.strip())
+            optimized = count_js8_frames(apply_edits(text, [edit for suggestion in suggestions for edit in suggestion[4]]).strip())
+            summary_label.config(
+                text=f"Actuellement: {frames} trame(s) ({frames * cycle} s) · "
+                     f"avec toutes les propositions: {optimized} ({optimized * cycle} s)"
+            )
+            listbox.delete(0, tk.END)
+            for saved_frames, saved_bits, original, replacement, edits in suggestions:
+                count = f" ×{len(edits)}" if len(edits) > 1 else ""
+                listbox.insert(
+                    tk.END,
+                    f"-{saved_frames} tr. ({frames} → {frames - saved_frames}) -{saved_bits:>3} bits   "
+                    f"{original} → {replacement}{count}"
+                )
+            if not suggestions:
+                listbox.insert(tk.END, "Aucune proposition")
+        
+        def apply(edits):
+            if not self.text_editable():
+                self.log_message("Bulletin verrouillé pendant les émissions: les arrêter pour l'optimiser", "WARNING")
+                return
+            if current_text() != view['text']:
+                refresh()
+                return
+            # De la fin vers le début: les positions précédentes restent valables
+            text = view['text']
+            for start, end, replacement in sorted(edits, reverse=True):
+                start, end = self._tk_index(text, start), self._tk_index(text, end)
+                self.text_area.delete(start, end)
+                self.text_area.insert(start, replacement)
+            self.log_message(f"Bulletin optimisé: {len(edits)} substitution(s)")
+        
+        def apply_selected(event=None):
+            selection = listbox.curselection()
+            if selection and selection[0] < len(view['suggestions']):
+                apply(view['suggestions'][selection[0]][4])
+        
+        def apply_all():
+            edits = []
+            for suggestion in view['suggestions']:
+                edits += suggestion[4]
+            # Substitutions qui se chevauchent: seule la première est appliquée
+            kept = []
+            for edit in sorted(edits):
+                if not kept or edit[0] >= kept[-1][1]:
+                    kept.append(edit)
+            if kept:
+                apply(kept)
+        
+        def on_close():
+            self._optimizer_window = None
+            self._optimizer_refresh = None
+            window.destroy()
+        
+        ttk.Button(button_frame, text="✓ Appliquer", command=apply_selected).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="✓ Tout appliquer", command=apply_all).pack(side=tk.LEFT, padx=5)
+        listbox.bind('<Double-Button-1>', apply_selected)
+        window.protocol("WM_DELETE_WINDOW", on_close)
+        self._optimizer_refresh = refresh
+        refresh()
+    
     def start_emissions(self):
         """Démarre le cycle d'émissions automatiques"""
         text = self.text_area.get("1.0", tk.END).strip()
@@ -1329,8 +3959,9 @@ class JS8BulletinBoard:
             messagebox.showerror("Erreur", "Le message est vide!")
             return
         
-        if len(text) > self.max_chars:
-            messagebox.showerror("Erreur", f"Message trop long! ({len(text)}/{self.max_chars} caractères)")
+        error = self.bulletin_error(text)
+        if error:
+            messagebox.showerror("Bulletin", error)
             return
         
         if not self.js8_connected:
@@ -1340,75 +3971,526 @@ class JS8BulletinBoard:
             ):
                 pass
             else:
-                self.reconnect_js8call()
-                if not self.js8_connected:
-                    return
+                self.ensure_js8_connection(lambda connected: self._begin_emissions() if connected else None)
+                return
+        
+        self._begin_emissions()
+    
+    def _begin_emissions(self):
+        """Active le cycle d'émissions (message déjà validé)"""
+        if self.emission_active:
+            return
         
         self.emission_active = True
-        self.running = True
+        self._part_index = 0
+        if self.js8_client and (self.js8_connected or self.js8_connecting):
+            # Mode simulation choisi explicitement: pas de reconnexion automatique
+            self.js8_client.start_auto_reconnect()
+        for endpoint in self.js8_endpoints:
+            if endpoint.client:
+                endpoint.client.start_auto_reconnect()
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         self.text_area.config(state=tk.DISABLED)
+        # Texte figé pendant les émissions: rien à optimiser ni à translittérer
+        self.optimize_button.config(state=tk.DISABLED)
+        self.transliterate_button.config(state=tk.DISABLED)
         self.status_label.config(text="✓ Émissions actives", foreground="green")
         
         self.log_message("Émissions automatiques démarrées")
+        self.scheduler.start()
         self.update_schedule()
-        
-        self.check_thread = threading.Thread(target=self.emission_loop, daemon=True)
-        self.check_thread.start()
     
     def stop_emissions(self):
         """Arrête les émissions automatiques"""
         self.emission_active = False
-        self.running = False
+        self.scheduler.stop()
+        self._held_since = None
+        self._catchup_left = 0
+        if self.js8_client:
+            self.js8_client.stop_auto_reconnect()
+            self.js8_retry_info = None
+            self.update_connection_status()
+        for endpoint in self.js8_endpoints:
+            if endpoint.client:
+                endpoint.client.stop_auto_reconnect()
+            endpoint.retry_info = None
+        self.update_endpoints_status()
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.text_area.config(state=tk.NORMAL)
+        self.optimize_button.config(state=tk.NORMAL)
+        self.update_char_display(self.char_count)
         self.status_label.config(text="Inactif", foreground="black")
         self.next_emission_label.config(text="Prochaine émission: ---")
         self.log_message("Émissions automatiques arrêtées")
     
-    def emission_loop(self):
-        """Boucle de vérification des émissions"""
-        while self.running:
-            if self.emission_active and self.next_emission:
-                now = datetime.now()
-                if now >= self.next_emission:
-                    self.emit_message()
-                    self.next_emission = self.calculate_next_emission()
-                    self.root.after(0, self.update_schedule)
-            
-            time.sleep(1)
+    def interval_seconds(self):
+        """Durée nominale entre deux émissions"""
+        return self.emission_schedule().period
     
-    def emit_message(self):
-        """Émet le message via JS8Call"""
-        text = self.text_area.get("1.0", tk.END).strip()
+    def _on_emission_due(self, due):
+        """Échéance atteinte (thread de l'ordonnanceur); retourne la prochaine échéance"""
+        if not self.emission_active:
+            return None
+        now = datetime.now(timezone.utc)
+        late = (now - due).total_seconds()
+        if late > self.catchup.grace and not self._catchup_left:
+            following = self._catch_up(now, late)
+            if following is not None:
+                return following
+        
+        if self.tx_busy():
+            return self._hold_emission(now)
+        
+        # Revalidé à chaque émission: limite, locator ou texte ont pu changer depuis le démarrage
+        error = self.bulletin_error(self.text_area.get("1.0", tk.END).strip())
+        if error:
+            # Le bulletin n'est ni tronqué ni émis avec des variables non remplacées
+            self.root.after(0, lambda: self.log_message(f"Émission sautée: {error}", "ERROR"))
+            self.next_emission = self.calculate_next_emission()
+            self.root.after(0, self.update_schedule)
+            return self.handoff_time(self.next_emission)
+        parts = self.broadcast_parts()
+        wait = self.check_airtime(*parts)
+        if wait:
+            return self._defer_for_airtime(now, wait)
+        
+        planned = self.slot_clock().slot_at_or_after(self.next_emission.timestamp()) if self.next_emission else None
+        if self._held_since:
+            held = int((now - self._held_since).total_seconds())
+            self.root.after(0, lambda: self.log_message(f"JS8Call libre, émission relâchée après {held}s"))
+            self._held_since = None
+        total = len(self.bulletin_parts())
+        if len(parts) < total:
+            part = self._part_index % total + 1
+            self.root.after(0, lambda: self.log_message(f"Bulletin en plusieurs parties: partie {part}/{total}"))
+        # {NEXT} de cette émission: la suivante, fixée avant la mise en file
+        following = self.calculate_next_emission()
+        if self.js8_reachable():
+            self.queue_bulletin(parts, Outbox.ROUTINE, 'schedule', planned, following)
+        else:
+            # Simulation, ou émission sautée pendant la reconnexion (journalisé)
+            sequence = self.next_sequence()
+            for index, part in enumerate(parts):
+                self.emit_message(planned_slot=planned if index == 0 else None, text=part, sequence=sequence, following=following)
+        self._part_index += 1
+        self.next_emission = following
+        self.root.after(0, self.update_schedule)
+        
+        if self._catchup_left:
+            self._catchup_left -= 1
+            retry = now + timedelta(seconds=self.catchup.spacing)
+            if retry < self.handoff_time(self.next_emission):
+                return retry
+            left = self._catchup_left + 1
+            self._catchup_left = 0
+            self.root.after(0, lambda: self.log_message(
+                f"Rattrapage arrêté: l'émission suivante approche, {left} émission(s) manquée(s) abandonnée(s)", "WARNING"
+            ))
+        return self.handoff_time(self.next_emission)
+    
+    def missed_emissions(self, now):
+        """Émissions planifiées dont la remise est passée (au plus CatchUpPolicy.limit, les plus récentes) et leur nombre total"""
+        if self.next_emission is None:
+            return [], 0
+        period = self.emission_schedule().period
+        first = self.next_emission.timestamp()
+        last = self.calculate_next_emission().timestamp() - period
+        if last < first:
+            return [], 0
+        total = int(round((last - first) / period)) + 1
+        count = min(total, self.catchup.limit)
+        return [datetime.fromtimestamp(last - k * period, timezone.utc) for k in reversed(range(count))], total
+    
+    def _catch_up(self, now, late):
+        """Échéance atteinte en retard (veille, blocage): applique la politique des émissions manquées.
+        
+        Retourne la prochaine échéance si rien n'est émis maintenant, None sinon.
+        """
+        missed, total = self.missed_emissions(now)
+        if not total:
+            return None
+        
+        fire = self.catchup.plan(missed, now)
+        latest = missed[-1]
+        behind = int((now - latest).total_seconds())
+        dropped = total - len(fire)
+        if dropped:
+            self.root.after(0, lambda: self.log_message(
+                f"Ordonnanceur réveillé avec {late:.0f} s de retard: {dropped}/{total} émission(s) manquée(s) sautée(s) (politique '{self.catchup.mode}', dernière prévue à {self.format_time(latest)}, {behind} s de retard)", "WARNING"
+            ))
+        if not fire:
+            self.next_emission = self.calculate_next_emission()
+            self.root.after(0, self.update_schedule)
+            return self.handoff_time(self.next_emission)
+        
+        # Le rattrapage se fait sur le créneau à venir
+        self.next_emission = None
+        self._catchup_left = len(fire) - 1
+        first = self.format_time(fire[0])
+        count = len(fire)
+        spacing = self.catchup.spacing
+        if count == 1:
+            message = f"Émission manquée de {first} envoyée avec {int((now - fire[0]).total_seconds())} s de retard"
+        else:
+            message = f"Rattrapage de {count} émissions manquées depuis {first}, une toutes les {spacing:g} s"
+        self.root.after(0, lambda: self.log_message(message, "WARNING"))
+        return None
+    
+    def _on_clock_jump(self, jump):
+        """Saut de l'horloge murale (thread de l'ordonnanceur): NTP, veille, changement manuel"""
+        self.root.after(0, lambda: self.log_message(
+            f"Saut de l'horloge système de {jump:+.0f} s (correction NTP ou veille)", "WARNING"
+        ))
+        if jump < 0 and self.emission_active:
+            # Horloge reculée: la prochaine émission de la grille est peut-être plus proche
+            self.root.after(0, self.update_schedule)
+    
+    def _defer_for_airtime(self, now, wait):
+        """Budget d'émission dépassé: diffère l'émission si elle tient avant la suivante, sinon la saute"""
+        following = self.emission_schedule().next_after(now + timedelta(seconds=self.handoff_lead()))
+        retry = now + timedelta(seconds=wait)
+        if wait != math.inf and self.handoff_time(retry) < self.handoff_time(following):
+            self.root.after(0, lambda: self.log_message(
+                f"Budget d'émission atteint - émission différée de {wait / 60:.0f} min", "WARNING"
+            ))
+            return self.handoff_time(retry)
+        
+        if wait == math.inf:
+            reason = "message plus long que le plafond d'émission"
+        else:
+            reason = "budget d'émission atteint"
+        self.root.after(0, lambda: self.log_message(f"Émission refusée: {reason}", "WARNING"))
+        self.next_emission = self.calculate_next_emission()
+        self.root.after(0, self.update_schedule)
+        return self.handoff_time(self.next_emission)
+    
+    def _hold_emission(self, now):
+        """Retient l'émission due tant que JS8Call émet; l'abandonne au-delà d'un demi-intervalle.
+        
+        Retourne l'instant de la prochaine vérification: fin prévue de l'activité
+        TX (un événement RIG.PTT/TX.FRAME réveille l'ordonnanceur plus tôt).
+        """
+        if self._held_since is None:
+            self._held_since = now
+            depth = max((client.tx_state.depth for client in self.tx_clients()), default=0)
+            self.root.after(0, lambda: self.log_message(f"JS8Call occupé (file {depth}/{self.tx_max_queue}) - émission retenue", "WARNING"))
+        elif (now - self._held_since).total_seconds() > self.interval_seconds() / 2:
+            self._held_since = None
+            self.next_emission = self.calculate_next_emission()
+            self.root.after(0, lambda: self.log_message("JS8Call toujours occupé - émission abandonnée et reprogrammée", "WARNING"))
+            self.root.after(0, self.update_schedule)
+            return self.handoff_time(self.next_emission)
+        
+        # File pleine sans activité visible: on revérifie toutes les 5 s
+        retry = self.tx_idle_in() or 5
+        return now + timedelta(seconds=retry)
+    
+    def emit_message(self, planned_slot=None, text=None, speed=None, sequence=None, following=None):
+        """Émet le message via JS8Call, en parallèle sur toutes les instances configurées.
+        
+        planned_slot: créneau JS8 visé (par défaut le prochain), comparé au
+        créneau réellement utilisé par l'instance principale.
+        Les variables du modèle ({UTC}, {SEQ}...) sont rendues ici, au moment
+        de l'émission; sequence: numéro d'émission ({SEQ}, par défaut le suivant);
+        following: émission planifiée suivante ({NEXT}, voir template_values).
+        Retourne le Future de la remise à l'instance principale (None sans elle).
+        """
+        if text is None:
+            text = self.text_area.get("1.0", tk.END).strip()
+        text = self.render_message(text, sequence, following)
+        if speed not in JS8_SPEEDS:
+            speed = self.js8_speed
+        main_delivery = None
         
         try:
-            if self.js8_connected and self.js8_client:
-                # Change la fréquence si configurée
-                if self.js8_frequency > 0:
-                    self.js8_client.set_frequency(self.js8_frequency)
-                
-                success = self.js8_client.send_message(text, self.js8_frequency)
-                if success:
-                    preview = text[:50] + "..." if len(text) > 50 else text
-                    freq_info = f" @ {self.js8_frequency} Hz" if self.js8_frequency > 0 else ""
-                    self.root.after(0, lambda: self.log_message(f"Message émis ({len(text)} car{freq_info}): '{preview}'"))
-                else:
-                    self.root.after(0, lambda: self.log_message("Échec d'émission - vérifier JS8Call", "ERROR"))
-                    self.root.after(0, self.reconnect_js8call)
-            else:
+            # Chaque instance a sa propre file d'écriture et son propre QSY:
+            # une instance lente ne retarde pas les autres
+            delivered = 0
+            skipped = False
+            for target in self.delivery_targets():
+                future = self._deliver_to(target, text, speed, planned_slot)
+                if future is not None:
+                    delivered += 1
+                    if target is None:
+                        main_delivery = future
+                elif target is not None or self.js8_client.auto_reconnecting or self.js8_endpoints:
+                    # La simulation n'a de sens qu'avec une seule instance
+                    skipped = True
+                    self._log_skipped(target)
+            
+            if not delivered:
+                if skipped:
+                    return None
                 preview = text[:50] + "..." if len(text) > 50 else text
                 freq_info = f" @ {self.js8_frequency} Hz" if self.js8_frequency > 0 else ""
                 self.root.after(0, lambda: self.log_message(f"[SIMULATION] Message ({len(text)} car{freq_info}): '{preview}'", "WARNING"))
             
             self.root.after(0, lambda: self.last_emission_label.config(
-                text=f"Dernière émission: {datetime.now().strftime('%H:%M:%S')}"
+                text=f"Dernière émission: {self.format_time(datetime.now(timezone.utc))}"
             ))
             
         except Exception as e:
             self.root.after(0, lambda: self.log_message(f"Erreur émission: {e}", "ERROR"))
+        return main_delivery
+    
+    def render_message(self, text, sequence=None, following=None):
+        """Texte à émettre: variables du modèle ({UTC}, {SEQ}...) rendues maintenant"""
+        template = self.compiled_template(text)
+        if template.fields:
+            text = template.render(self.template_values(sequence, following))
+        return text
+    
+    def delivery_targets(self):
+        """Destinations d'un message: None (instance principale) et noms des instances supplémentaires"""
+        return ([None] if self.js8_client else []) + [endpoint.name for endpoint in self.js8_endpoints]
+    
+    def _endpoint_named(self, name):
+        return next((endpoint for endpoint in self.js8_endpoints if endpoint.name == name), None)
+    
+    def _target_client(self, target):
+        """Client JS8Call d'une destination (None = instance principale), None si elle n'existe plus"""
+        if target is None:
+            return self.js8_client
+        endpoint = self._endpoint_named(target)
+        return endpoint.client if endpoint else None
+    
+    def _target_connected(self, target):
+        if target is None:
+            return bool(self.js8_connected and self.js8_client)
+        endpoint = self._endpoint_named(target)
+        return bool(endpoint and endpoint.connected)
+    
+    def _deliver_to(self, target, text, speed, planned_slot=None):
+        """Remet text à une destination (None = instance principale); retourne le Future, ou None si elle n'est pas connectée"""
+        if not self._target_connected(target):
+            return None
+        if target is None:
+            clock = JS8SlotClock(JS8_SPEEDS[speed].cycle)
+            if planned_slot is None:
+                planned_slot = clock.slot_at_or_after(time.time())
+            self._slot_pending = (planned_slot, clock.cycle)
+            reservation = self.governor.reserve(js8_tx_seconds(text, speed))
+            return self._deliver(None, self.js8_client, text, self.js8_frequency, reservation, speed)
+        endpoint = self._endpoint_named(target)
+        reservation = self.governor.reserve(js8_tx_seconds(text, speed), source=endpoint.name)
+        return self._deliver(endpoint, endpoint.client, text, endpoint.frequency, reservation, speed)
+    
+    def _log_skipped(self, target):
+        """Journalise une émission sautée faute de connexion à la destination"""
+        if target is None and self.js8_client and self.js8_client.auto_reconnecting:
+            message = f"{self._endpoint_prefix(None)}Émission sautée: JS8Call non connecté (reconnexion automatique en cours)"
+        else:
+            message = f"{self._endpoint_prefix(self._endpoint_named(target))}Émission sautée: non connecté"
+        self.root.after(0, lambda: self.log_message(message, "WARNING"))
+    
+    def queue_bulletin(self, parts, priority=Outbox.ROUTINE, source='manual', planned_slot=None, following=None):
+        """Met en file les parties d'un bulletin, dans l'ordre (tout thread); journalisé comme un seul bulletin.
+        
+        Toutes les parties partagent le même numéro d'émission ({SEQ}) et la
+        même émission suivante ({NEXT}): following, ou à défaut la prochaine
+        émission planifiée (aucune si elles sont arrêtées). Un
+        bulletin d'urgence annule le trafic de routine encore en attente, par
+        bulletins entiers: un bulletin déjà commencé part jusqu'au bout.
+        """
+        if priority == Outbox.EMERGENCY:
+            cancelled = self.outbox.cancel(lambda queued: queued['priority'] == Outbox.ROUTINE, whole_bulletins=True)
+            for item in cancelled:
+                preview = item['text'][:30]
+                self.root.after(0, lambda p=preview: self.log_message(
+                    f"Message de routine annulé pour un trafic d'urgence: '{p}'", "WARNING"
+                ))
+            kept = sum(1 for item in self.outbox.items() if item['priority'] == Outbox.ROUTINE)
+            if kept:
+                self.root.after(0, lambda: self.log_message(
+                    f"{kept} partie(s) de routine gardée(s): leur bulletin est déjà à l'antenne", "WARNING"
+                ))
+        if following is None:
+            following = self.following_emission()
+        self.outbox.put_bulletin(
+            parts, priority, planned_slot, self.delivery_targets(),
+            source=source, speed=self.js8_speed, sequence=self.next_sequence(),
+            following=following.timestamp() if following else None,
+        )
+        self._outbox_event.set()
+        self.root.after(0, self.update_outbox_status)
+        if len(parts) > 1:
+            self.root.after(0, lambda: self.log_message(
+                f"Bulletin en plusieurs parties: {len(parts)} parties en file, à la suite"
+            ))
+    
+    def _resume_outbox(self):
+        """Au démarrage: abandonne les émissions planifiées passées, demande avant de renvoyer les messages manuels"""
+        stale = self.outbox.cancel(lambda item: item.get('source') == 'schedule')
+        if stale:
+            self.log_message(f"File d'envoi: {len(stale)} émission(s) planifiée(s) passée(s) abandonnée(s)")
+        count = len(self.outbox)
+        if count and messagebox.askyesno(
+            "File d'envoi",
+            f"{count} message(s) de la session précédente attendent encore d'être envoyés.\n\nLes envoyer maintenant?"
+        ):
+            self.log_message(f"File d'envoi: {count} message(s) de la session précédente encore à envoyer", "WARNING")
+        elif count:
+            self.outbox.cancel(lambda item: True)
+            self.log_message(f"File d'envoi: {count} message(s) de la session précédente abandonné(s)", "WARNING")
+        self.update_outbox_status()
+    
+    def js8_reachable(self):
+        """Au moins une instance JS8Call connectée (principale ou supplémentaire)"""
+        return self.js8_connected or any(endpoint.connected for endpoint in self.js8_endpoints)
+    
+    def _outbox_loop(self):
+        """Thread d'envoi: chaque instance JS8Call reçoit les messages un par un, le plus prioritaire d'abord.
+        
+        Chaque instance avance à son rythme: son message suivant attend que la
+        remise du précédent soit terminée et qu'elle soit de nouveau libre,
+        sans retenir les autres instances. Un message urgent arrivé
+        entre-temps passe donc devant la routine déjà en file. Un message
+        n'est retiré de la file qu'une fois remis partout (voir _deliver_item).
+        """
+        while True:
+            timeout = 5
+            waits = [self._target_client(target).tx_state.idle_in() for target in self.outbox.targets()
+                     if self._target_connected(target) and self.target_busy(target)]
+            if waits:
+                timeout = min(timeout, max(0.5, min(waits)))
+            self._outbox_event.wait(timeout)
+            self._outbox_event.clear()
+            
+            failed = set()  # Remise en échec: nouvel essai au prochain réveil
+            while True:
+                batch = self._outbox_batch(failed)
+                if not batch:
+                    break
+                for item, targets in batch:
+                    if item['priority'] != Outbox.ROUTINE:
+                        label = self.priority_labels[item['priority']]
+                        self.root.after(0, lambda l=label, t=item['text'][:30]: self.log_message(f"File d'envoi: envoi ({l}) '{t}'", "WARNING"))
+                    self._deliver_item(item, targets)
+                    failed.update(target for target in targets if target in item['targets'])
+    
+    def _outbox_batch(self, excluded=()):
+        """Messages à remettre maintenant, [(message, destinations)] par ordre d'envoi.
+        
+        Pour chaque destination en attente: son message le plus prioritaire si
+        elle est libre, ou s'il faut le lui retirer (instance supprimée,
+        émission planifiée sur une instance déconnectée). Une instance qui
+        émet ou déconnectée (message manuel) garde ses messages.
+        """
+        batch = {}
+        for target in self.outbox.targets() - set(excluded):
+            item = self.outbox.next_for(target)
+            if item is None:
+                continue
+            if self._target_connected(target):
+                if self.target_busy(target):
+                    continue
+            elif self._target_client(target) is not None and item.get('source') != 'schedule':
+                continue
+            batch.setdefault(item['id'], (item, []))[1].append(target)
+        return sorted(batch.values(), key=lambda entry: (entry[0]['priority'], entry[0]['id']))
+    
+    def _deliver_item(self, item, targets=None):
+        """Remet un message de la file aux instances targets (par défaut toutes celles
+        qui l'attendent encore); retourne True s'il a quitté la file.
+        
+        Il n'en sort qu'une fois remis partout: une instance déconnectée ou une
+        remise en échec le garde, fichier compris, pour un nouvel essai. Seule
+        une émission planifiée est sautée sur une instance déconnectée (la
+        suivante la remplace).
+        """
+        speed = item.get('speed') if item.get('speed') in JS8_SPEEDS else self.js8_speed
+        following = item.get('following')
+        if following is not None:
+            following = datetime.fromtimestamp(following, timezone.utc)
+        text = self.render_message(item['text'], item.get('sequence'), following)
+        deliveries = {}
+        for target in list(item['targets'] if targets is None else targets):
+            if target is None and not self.js8_client or target is not None and not self._endpoint_named(target):
+                self.outbox.done(item, target)  # Instance retirée de la configuration
+                continue
+            if not self._target_connected(target):
+                if item.get('source') == 'schedule':
+                    self._log_skipped(target)
+                    self.outbox.done(item, target)
+                continue
+            if not item.get('started'):
+                self.outbox.mark_started(item)
+            future = self._deliver_to(target, text, speed, item.get('planned_slot'))
+            if future is not None:
+                deliveries[target] = future
+        for target, future in deliveries.items():
+            try:
+                future.result(timeout=120)
+            except Exception:
+                # Échec déjà journalisé par _report_delivery
+                prefix = self._endpoint_prefix(self._endpoint_named(target))
+                self.root.after(0, lambda p=prefix: self.log_message(
+                    f"{p}Message gardé dans la file d'envoi pour un nouvel essai", "WARNING"
+                ))
+                continue
+            self.outbox.done(item, target)
+        self.root.after(0, self.update_outbox_status)
+        return not item['targets']
+    
+    def update_outbox_status(self):
+        """Affiche le nombre de messages en attente d'envoi"""
+        if not hasattr(self, 'outbox_label'):
+            return
+        items = self.outbox.items()
+        if not items:
+            self.outbox_label.config(text="")
+            return
+        urgent = sum(1 for item in items if item['priority'] == Outbox.EMERGENCY)
+        text = f"File: {len(items)}"
+        if urgent:
+            text += f" ({urgent} urgence)"
+        self.outbox_label.config(text=text, foreground="red" if urgent else "orange")
+    
+    def _endpoint_prefix(self, endpoint):
+        """Préfixe des messages du journal propres à une instance (vide s'il n'y en a qu'une)"""
+        if endpoint is not None:
+            return f"[{endpoint.name}] "
+        return "[Principal] " if self.js8_endpoints else ""
+    
+    def _deliver(self, endpoint, client, text, frequency, reservation=None, speed='normal'):
+        """Envoie le bulletin à une instance (endpoint None = instance principale); retourne le Future"""
+        future = client.send_bulletin(text, frequency, speed)
+        future.add_done_callback(
+            lambda f: self.root.after(0, lambda: self._report_delivery(endpoint, client, text, frequency, f, reservation))
+        )
+        return future
+    
+    def _report_delivery(self, endpoint, client, text, frequency, future, reservation=None):
+        """Journalise le succès ou l'échec de l'émission sur une instance (thread Tk)"""
+        prefix = self._endpoint_prefix(endpoint)
+        if endpoint is None:
+            self.update_tx_status()
+        
+        error = future.exception()
+        if error is not None and endpoint is None:
+            self._slot_pending = None
+        if error is not None and reservation is not None:
+            self.governor.release(reservation)
+        self.update_airtime_status()
+        if error is None:
+            preview = text[:50] + "..." if len(text) > 50 else text
+            freq_info = f" @ {frequency} Hz" if frequency > 0 else ""
+            self.log_message(f"{prefix}Message émis ({len(text)} car{freq_info}): '{preview}'")
+            return
+        
+        if isinstance(error, TimeoutError):
+            self.log_message(f"{prefix}{error} - message non émis", "ERROR")
+            return
+        
+        self.log_message(f"{prefix}Échec d'émission - vérifier JS8Call", "ERROR")
+        if client.auto_reconnecting:
+            return
+        if endpoint is None:
+            self.reconnect_js8call()
+        elif client is endpoint.client:
+            self._start_endpoint(endpoint)
     
     def send_now(self):
         """Envoie immédiatement le message"""
@@ -1417,8 +4499,22 @@ class JS8BulletinBoard:
             messagebox.showerror("Erreur", "Le message est vide!")
             return
         
-        if len(text) > self.max_chars:
-            messagebox.showerror("Erreur", f"Message trop long! ({len(text)}/{self.max_chars} caractères)")
+        error = self.bulletin_error(text)
+        if error:
+            messagebox.showerror("Bulletin", error)
+            return
+        
+        priority = next(p for p, label in self.priority_labels.items() if label == self.priority_var.get())
+        
+        # L'urgence n'est pas soumise au budget d'émission (elle y est comptée)
+        parts = self.bulletin_parts(text)
+        wait = self.check_airtime(*parts) if priority != Outbox.EMERGENCY else 0
+        if wait:
+            messagebox.showerror(
+                "Budget d'émission",
+                "Ce message dépasserait le budget d'émission."
+                + (f"\n\nIl tiendra dans environ {wait / 60:.0f} min." if wait != math.inf else "\n\nIl est plus long que le plafond lui-même.")
+            )
             return
         
         if not self.js8_connected:
@@ -1426,13 +4522,13 @@ class JS8BulletinBoard:
                 "JS8Call non connecté",
                 f"JS8Call n'est pas connecté sur {self.js8_host}:{self.js8_port}.\n\nEssayer de reconnecter?"
             ):
-                self.reconnect_js8call()
-                if not self.js8_connected:
-                    return
-            else:
-                return
+                self.ensure_js8_connection(lambda connected: self.queue_bulletin(parts, priority) if connected else None)
+            return
         
-        self.emit_message()
+        ahead = sum(1 for item in self.outbox.items() if item['priority'] <= priority)
+        self.queue_bulletin(parts, priority)
+        if ahead or self.tx_busy():
+            self.log_message(f"JS8Call occupé - message mis en file ({ahead} devant lui)", "WARNING")
     
     def quit_app(self):
         """Quitte l'application proprement"""
@@ -1451,6 +4547,11 @@ class JS8BulletinBoard:
                 self.js8_client.disconnect()
             except:
                 pass
+        for endpoint in self.js8_endpoints:
+            try:
+                endpoint.disconnect()
+            except:
+                pass
         
         self.root.destroy()
 
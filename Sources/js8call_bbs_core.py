@@ -0,0 +1,1122 @@
+"""Cœur commun aux interfaces En et Fr: comptage JS8, planning, budget d'émission.
+
+Aucun texte affiché ici: les messages destinés à l'utilisateur restent dans
+js8call-BBS-v1_En.py et js8call-BBS-v1_Fr.py, qui importent ce module.
+"""
+
+from datetime import datetime, timezone
+import bisect
+import itertools
+import json
+import math
+import os
+import random
+import re
+import string
+import threading
+import time
+import unicodedata
+import zlib
+from collections import deque
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9: heure locale ou UTC seulement
+    ZoneInfo = None
+
+
+class JS8Event:
+    """Message reçu de l'API JS8Call (une ligne JSON: type, value, params)"""
+    
+    def __init__(self, type, value='', params=None):
+        self.type = type
+        self.value = value
+        self.params = params or {}
+        self.received_at = time.time()
+    
+    @property
+    def id(self):
+        """Identifiant _ID renvoyé par JS8Call (None pour les événements spontanés)"""
+        return self.params.get('_ID')
+    
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.type!r}, {self.value!r})"
+
+
+class RigFreqEvent(JS8Event):
+    """RIG.FREQ: fréquence du transceiver"""
+    
+    @property
+    def dial(self):
+        return int(self.params.get('DIAL', 0) or 0)
+    
+    @property
+    def offset(self):
+        return int(self.params.get('OFFSET', 0) or 0)
+    
+    @property
+    def frequency(self):
+        return int(self.params.get('FREQ', 0) or 0) or self.dial + self.offset
+
+
+class RigPttEvent(JS8Event):
+    """RIG.PTT: passage en émission / réception"""
+    
+    @property
+    def ptt(self):
+        if 'PTT' in self.params:
+            return bool(self.params['PTT'])
+        return str(self.value).lower() == 'on'
+
+
+class RxEvent(JS8Event):
+    """RX.ACTIVITY, RX.DIRECTED, RX.SPOT...: activité reçue sur la bande"""
+    
+    @property
+    def sender(self):
+        return self.params.get('FROM', '')
+    
+    @property
+    def snr(self):
+        return self.params.get('SNR')
+    
+    @property
+    def text(self):
+        return self.params.get('TEXT', self.value)
+
+
+class StationEvent(JS8Event):
+    """STATION.CALLSIGN, STATION.GRID, STATION.INFO, STATION.STATUS"""
+    pass
+
+
+class TxEvent(JS8Event):
+    """TX.FRAME, TX.TEXT: état du tampon d'émission de JS8Call"""
+    pass
+
+
+JS8_EVENT_CLASSES = {
+    'RIG.FREQ': RigFreqEvent,
+    'RIG.PTT': RigPttEvent,
+}
+JS8_EVENT_PREFIXES = {
+    'RX.': RxEvent,
+    'STATION.': StationEvent,
+    'TX.': TxEvent,
+}
+
+
+def decode_js8_event(data):
+    """Convertit un dictionnaire JSON JS8Call en événement typé"""
+    event_type = str(data.get('type', ''))
+    cls = JS8_EVENT_CLASSES.get(event_type)
+    if cls is None:
+        cls = JS8Event
+        for prefix, prefix_cls in JS8_EVENT_PREFIXES.items():
+            if event_type.startswith(prefix):
+                cls = prefix_cls
+                break
+    params = data.get('params')
+    return cls(event_type, data.get('value', ''), params if isinstance(params, dict) else {})
+
+
+class JS8LineParser:
+    """Découpage incrémental du flux JSON de JS8Call (un message par ligne).
+    
+    Le tampon est borné: une ligne plus longue que max_line est abandonnée
+    jusqu'au prochain retour à la ligne, la mémoire ne grossit donc jamais
+    au-delà de max_line + la taille d'un recv().
+    """
+    
+    def __init__(self, max_line=65536):
+        self.max_line = max_line
+        self._buffer = bytearray()
+        self._discarding = False
+        self.dropped = 0
+    
+    def feed(self, data):
+        """Ajoute des octets reçus et retourne la liste des messages complets décodés"""
+        messages = []
+        start = 0
+        
+        while True:
+            end = data.find(b'\n', start)
+            if end < 0:
+                break
+            
+            if self._discarding:
+                self._discarding = False
+            elif self._buffer:
+                self._buffer += data[start:end]
+                self._decode(bytes(self._buffer), messages)
+                self._buffer.clear()
+            else:
+                self._decode(data[start:end], messages)
+            start = end + 1
+        
+        if start < len(data) and not self._discarding:
+            self._buffer += data[start:]
+            if len(self._buffer) > self.max_line:
+                # Ligne anormalement longue: on l'ignore jusqu'au prochain '\n'
+                self._buffer.clear()
+                self._discarding = True
+                self.dropped += 1
+        
+        return messages
+    
+    def _decode(self, line, messages):
+        line = line.strip()
+        if not line:
+            return
+        if len(line) > self.max_line:
+            self.dropped += 1
+            return
+        try:
+            data = json.loads(line)
+        except ValueError:
+            self.dropped += 1
+            return
+        if isinstance(data, dict):
+            messages.append(data)
+    
+    def reset(self):
+        self._buffer.clear()
+        self._discarding = False
+
+
+# Alphabet de Huffman statique de JS8Call (varicode.cpp) pour le texte libre;
+# les minuscules sont émises en majuscules, les autres caractères sont ignorés
+JS8_HUFFMAN_CODES = {
+    " ": "01", "E": "100", "T": "1101", "A": "0011", "O": "11111", "I": "11100",
+    "N": "10111", "S": "10100", "H": "00011", "R": "00000", "D": "111011", "L": "110011",
+    "C": "110001", "U": "101101", "M": "101011", "W": "001011", "F": "001001", "G": "000101",
+    "Y": "000011", "P": "1111011", "B": "1111001", ".": "1110100", "V": "1100101", "K": "1100100",
+    "-": "1100001", "+": "1100000", "?": "1011001", "!": "1011000", "\"": "1010101", "X": "1010100",
+    "0": "0010101", "J": "0010100", "1": "0010001", "Q": "0010000", "2": "0001001", "Z": "0001000",
+    "3": "0000101", "5": "0000100", "4": "11110101", "9": "11110100", "8": "11110001", "6": "11110000",
+    "7": "11101011", "/": "11101010",
+}
+JS8_CHAR_BITS = {char: len(code) for char, code in JS8_HUFFMAN_CODES.items()}
+
+# Trame de données: 72 bits dont 3 d'en-tête; un caractère n'est jamais coupé
+# entre deux trames et il reste au moins un bit de bourrage (fin de texte)
+JS8_FRAME_BITS = 72
+JS8_FRAME_HEADER_BITS = 3
+JS8_FRAME_DATA_BITS = JS8_FRAME_BITS - JS8_FRAME_HEADER_BITS - 1
+
+# En-tête dirigé (@GROUPE ou INDICATIF: en tête de message): une trame dirigée à part
+JS8_DIRECTED_HEADER = re.compile(r'^(@[A-Z0-9/]+|[A-Z0-9]{1,3}[0-9][A-Z0-9/]*:)\s*')
+
+
+# Majuscules de l'alphabet JS8 (lettres ASCII) sans changer la longueur du texte
+_JS8_UPPER = str.maketrans(string.ascii_lowercase, string.ascii_uppercase)
+# Blancs que str.strip() retire en début de texte (\s suit str.isspace)
+_LEADING_BLANKS = re.compile(r'\s*')
+
+
+# Caractères par bloc du compteur de trames (voir JS8FrameCounter)
+JS8_FRAME_BLOCK = 64
+
+
+class _JS8FrameBlock:
+    """Morceau du texte de JS8FrameCounter, traversé sans relire ses caractères.
+    
+    cost[i]: bits cumulés des caractères 0 à i; opened[i]: (trames ouvertes,
+    bits de la dernière) jusqu'à la fin du bloc si une trame s'ouvre au
+    caractère i, calculé à la première demande. Pour tout état d'entrée, la
+    sortie du bloc coûte une recherche dichotomique par trame du bloc.
+    """
+    
+    __slots__ = ('text', 'cost', 'opened')
+    
+    def __init__(self, text):
+        self.text = text
+        self.cost = list(itertools.accumulate(map(JS8_CHAR_BITS.get, text, itertools.repeat(0))))
+        self.opened = {}
+    
+    def cross(self, bits):
+        """(trames ouvertes dans le bloc, bits de la trame courante en sortie) pour bits en entrée"""
+        cost = self.cost
+        index = bisect.bisect_right(cost, JS8_FRAME_DATA_BITS - bits)
+        if index == len(cost):
+            return 0, bits + cost[-1]
+        # Trames successives jusqu'à la fin du bloc ou à une trame déjà calculée
+        starts = []
+        while index < len(cost) and index not in self.opened:
+            starts.append(index)
+            base = cost[index - 1] if index else 0
+            index = bisect.bisect_right(cost, JS8_FRAME_DATA_BITS + base, index + 1)
+        frames, last = self.opened[index] if index < len(cost) else (0, cost[-1] - base)
+        for start in reversed(starts):
+            frames += 1
+            self.opened[start] = (frames, last)
+        return self.opened[starts[0]] if starts else self.opened[index]
+
+
+class JS8FrameCounter:
+    """Nombre de trames JS8 d'un texte, mis à jour de façon incrémentale.
+    
+    Les caractères sont empaquetés dans l'ordre, trame après trame, selon les
+    règles ci-dessus (table de Huffman, 68 bits par trame). Le texte après
+    l'en-tête dirigé est découpé en blocs d'environ JS8_FRAME_BLOCK
+    caractères; pour chacun on garde les bits de la trame en cours à son
+    entrée et les trames qui s'y ouvrent. Après une modification, seuls les
+    blocs touchés sont relus; les suivants sont traversés sans relire leurs
+    caractères (_JS8FrameBlock.cross), et on s'arrête au premier dont l'état
+    d'entrée n'a pas changé: les trames retombent sur les anciennes et la
+    suite est inchangée. Seules les lettres ASCII passent en majuscules: le
+    texte garde sa longueur, et les positions de splice() restent celles du
+    texte d'origine (ß reste ß, pas SS).
+    """
+    
+    def __init__(self, text=''):
+        self.text = ''
+        self.header = 0  # Longueur de l'en-tête dirigé (0 = aucun)
+        self._blocks = []  # _JS8FrameBlock du texte après l'en-tête
+        self._sizes = []  # Caractères de chaque bloc
+        self._ends = []  # Fin de chaque bloc (caractères cumulés)
+        self._entry = []  # Bits de la trame en cours à l'entrée de chaque bloc
+        self._opened = []  # Trames ouvertes dans chaque bloc
+        self._data_frames = 0
+        self.leading = 0  # Blancs en début de texte (tout le texte s'il n'est que blancs)
+        self.trailing = 0  # Blancs en fin de texte (idem)
+        self.repacked = 0  # Caractères relus lors de la dernière modification (mesure)
+        self.update(text)
+    
+    @property
+    def frames(self):
+        return self._data_frames + (1 if self.header else 0)
+    
+    @property
+    def blanks(self):
+        """Blancs de début et de fin (ce que strip() retirerait)"""
+        return min(self.leading + self.trailing, len(self.text))
+    
+    def update(self, text):
+        """Nouveau texte (tel qu'il sera émis); retourne le nombre de trames"""
+        text = text.translate(_JS8_UPPER)
+        old = self.text
+        changed = len(os.path.commonprefix([old, text]))
+        if changed == len(old) == len(text):
+            self.repacked = 0
+            return self.frames
+        # Fin commune, sans chevaucher le début commun
+        limit = min(len(old), len(text)) - changed
+        tail = len(os.path.commonprefix([old[len(old) - limit:][::-1], text[len(text) - limit:][::-1]]))
+        return self._repack(text, changed, len(old) - changed - tail, len(text) - changed - tail)
+    
+    def splice(self, offset, removed, inserted):
+        """Modification connue: removed caractères remplacés par inserted à offset.
+        
+        Évite de comparer l'ancien et le nouveau texte; retourne le nombre de trames.
+        """
+        if not removed and not inserted:
+            self.repacked = 0
+            return self.frames
+        text = self.text[:offset] + inserted.translate(_JS8_UPPER) + self.text[offset + removed:]
+        return self._repack(text, offset, removed, len(inserted))
+    
+    def _repack(self, text, offset, removed, inserted):
+        """text: nouveau texte, où inserted caractères remplacent removed caractères à offset"""
+        match = JS8_DIRECTED_HEADER.match(text)
+        header = match.end() if match else 0
+        tail = len(text) - offset - inserted  # Fin inchangée
+        if header == self.header and offset >= header:
+            start = offset - header
+        else:
+            # En-tête modifié: le texte après l'en-tête change à partir de son début
+            start = 0
+            tail -= max(0, self.header - offset - removed, header - offset - inserted)
+        old_length = len(self.text) - self.header
+        # Blancs de début et de fin relus seulement si la modification les touche
+        if offset <= self.leading:
+            self.leading = _LEADING_BLANKS.match(text).end()
+        if offset + removed >= len(self.text) - self.trailing:
+            end = len(text)
+            while end and text[end - 1].isspace():
+                end -= 1
+            self.trailing = len(text) - end
+        self.header = header
+        self.text = text
+        self._splice_data(start, old_length - start - tail, text[header + start:len(text) - tail])
+        return self.frames
+    
+    def _splice_data(self, start, removed, inserted):
+        """Remplace removed caractères à start (texte après l'en-tête) par inserted"""
+        blocks, ends = self._blocks, self._ends
+        if blocks:
+            # Blocs touchés: de celui qui contient start à celui qui contient le dernier caractère supprimé
+            first = min(bisect.bisect_right(ends, start), len(blocks) - 1)
+            last = min(bisect.bisect_right(ends, start + removed - 1), len(blocks) - 1) if removed else first
+        else:
+            first, last = 0, -1
+        begin = ends[first - 1] if first else 0
+        piece = ''.join(block.text for block in blocks[first:last + 1])
+        piece = piece[:start - begin] + inserted + piece[start - begin + removed:]
+        if len(piece) < JS8_FRAME_BLOCK // 2 and last + 1 < len(blocks):
+            last += 1  # Bloc trop petit: fusionné avec le suivant
+            piece += blocks[last].text
+        count = max(len(piece) // JS8_FRAME_BLOCK, 1 if piece else 0)
+        size = -(-len(piece) // count) if count else 0
+        new = [_JS8FrameBlock(piece[index:index + size]) for index in range(0, len(piece), size or 1)]
+        
+        entry = self._entry[first] if first < len(self._entry) else JS8_FRAME_DATA_BITS
+        self._data_frames -= sum(self._opened[first:last + 1])
+        blocks[first:last + 1] = new
+        self._entry[first:last + 1] = [None] * len(new)
+        self._opened[first:last + 1] = [0] * len(new)
+        self._sizes[first:last + 1] = [len(block.text) for block in new]
+        self._ends = list(itertools.accumulate(self._sizes))
+        self.repacked = len(piece)
+        
+        # Blocs suivants traversés jusqu'à retrouver l'état d'entrée d'avant la modification
+        bits = entry
+        for index in range(first, len(blocks)):
+            if index >= first + len(new) and self._entry[index] == bits:
+                break
+            self._entry[index] = bits
+            opened, bits = blocks[index].cross(bits)
+            self._data_frames += opened - self._opened[index]
+            self._opened[index] = opened
+
+
+def count_js8_frames(text):
+    """Nombre de trames JS8 d'un texte (sans état, voir JS8FrameCounter)"""
+    return JS8FrameCounter(text).frames
+
+
+def js8_bits(text):
+    """Bits de Huffman d'un texte (caractères hors alphabet: 0)"""
+    return sum(JS8_CHAR_BITS.get(char, 0) for char in text.upper())
+
+
+# Abréviations admises dans le trafic écrit radioamateur: codes Q de même sens et
+# abréviations d'usage (anglais, puis français). Pas de contractions télégraphiques
+# (ARE -> R, FOR -> FER, AND -> ES...) qui rendent un bulletin difficile à lire.
+# Seules celles qui réduisent réellement le nombre de bits sont proposées.
+JS8_ABBREVIATIONS = {
+    "MY LOCATION IS": "QTH", "LOCATION": "QTH", "FREQUENCY": "QRG", "CHANGE FREQUENCY": "QSY",
+    "STANDING BY": "QRX", "STAND BY": "QRX", "CLOSING DOWN": "QRT", "SIGNING OFF": "QRT",
+    "INTERFERENCE": "QRM", "LOW POWER": "QRP", "HIGH POWER": "QRO", "ACKNOWLEDGE": "QSL",
+    "ACKNOWLEDGED": "QSL", "FADING": "QSB", "RELAY": "QSP",
+    "PLEASE": "PSE", "THANKS": "TNX", "THANK YOU": "TNX", "MESSAGE": "MSG", "MESSAGES": "MSGS",
+    "REPORT": "RPT", "WEATHER": "WX", "INFORMATION": "INFO", "STATION": "STN", "ANTENNA": "ANT",
+    "POWER": "PWR", "NUMBER": "NR", "BULLETIN": "BLN", "BEST REGARDS": "73",
+    "GOOD MORNING": "GM", "GOOD EVENING": "GE", "GOOD NIGHT": "GN",
+    "CONDITIONS": "CONDX", "PROPAGATION": "PROP", "SIGNAL": "SIG", "OPERATOR": "OP",
+    "RECEIVE": "RX", "RECEIVER": "RX", "TRANSMIT": "TX", "TRANSMITTER": "TX", "TRANSCEIVER": "XCVR",
+    "WORKED": "WKD", "MINUTES": "MIN", "HOURS": "HRS", "KILOMETERS": "KM", "KILOMETRES": "KM",
+    "MÉTÉO": "WX", "MERCI": "TNX", "AMITIÉS": "73", "FRÉQUENCE": "QRG", "ANTENNE": "ANT",
+    "PUISSANCE": "PWR", "RAPPORT": "RPT", "INFORMATIONS": "INFO", "RENDEZ-VOUS": "RDV",
+}
+_ABBREVIATION_PATTERN = re.compile(
+    r'(?<![\w/])(' + '|'.join(re.escape(phrase) for phrase in sorted(JS8_ABBREVIATIONS, key=len, reverse=True)) + r')(?![\w/])',
+    re.IGNORECASE
+)
+
+# Formats de nombres plus courts: (motif, remplacement). Un nombre n'est jamais pris
+# au milieu d'un autre (2,000 / 1.0.0), et «,000» ou «.000» peut séparer des milliers:
+# il n'est pas supprimé.
+JS8_NUMBER_FORMATS = [
+    (re.compile(r'(?<![\w.,:])([01]?\d|2[0-3])[:H.]?([0-5]\d) ?(?:UTC|GMT)\b', re.IGNORECASE), r'\1\2Z'),  # 12:30 UTC -> 1230Z
+    (re.compile(r'(?<![\w.,])(\d+)[.,](?:0{1,2}|0{4,})(?![\w.,])'), r'\1'),  # 5.0 -> 5
+    (re.compile(r'(?<![\w.,])(\d+(?:[.,]\d+)*) ?WATTS?\b', re.IGNORECASE), r'\1W'),  # 100 WATTS -> 100W
+    (re.compile(r' {2,}'), ' '),  # espaces multiples
+]
+
+
+def _abbreviation_edits(text):
+    """Substitutions possibles: (début, fin, remplacement) qui économisent des bits"""
+    edits = [(match.start(), match.end(), JS8_ABBREVIATIONS[match.group(0).upper()])
+             for match in _ABBREVIATION_PATTERN.finditer(text)]
+    for pattern, template in JS8_NUMBER_FORMATS:
+        edits.extend((match.start(), match.end(), match.expand(template)) for match in pattern.finditer(text))
+    for start, end, replacement in edits:
+        original = text[start:end]
+        if js8_bits(replacement) < js8_bits(original):
+            # Respecte la casse d'un texte saisi en minuscules (JS8 émet tout en majuscules)
+            yield start, end, replacement.lower() if original.islower() else replacement
+
+
+def apply_edits(text, edits):
+    """Applique des substitutions (début, fin, remplacement); les chevauchements sont ignorés"""
+    parts = []
+    position = 0
+    for start, end, replacement in sorted(edits):
+        if start < position:
+            continue
+        parts += [text[position:start], replacement]
+        position = end
+    parts.append(text[position:])
+    return ''.join(parts)
+
+
+def suggest_abbreviations(text):
+    """Substitutions qui raccourcissent l'émission, classées par trames gagnées.
+    
+    Retourne une liste de (trames gagnées, bits gagnés, original, remplacement, edits),
+    chaque ligne regroupant toutes les occurrences d'une même substitution;
+    edits est la liste des (début, fin, remplacement) à appliquer sur text.
+    """
+    groups = {}
+    for start, end, replacement in _abbreviation_edits(text):
+        groups.setdefault((text[start:end].upper(), replacement.upper()), []).append((start, end, replacement))
+    
+    frames = count_js8_frames(text.strip())
+    suggestions = []
+    for (original, replacement), edits in groups.items():
+        saved_bits = len(edits) * (js8_bits(original) - js8_bits(replacement))
+        saved_frames = frames - count_js8_frames(apply_edits(text, edits).strip())
+        suggestions.append((saved_frames, saved_bits, original, replacement, edits))
+    suggestions.sort(key=lambda suggestion: (-suggestion[0], -suggestion[1], suggestion[2]))
+    return suggestions
+
+
+# Équivalents des caractères hors alphabet JS8 (appliqués aussi après décomposition
+# des accents); un caractère sans équivalent est supprimé, comme le ferait JS8Call
+JS8_TRANSLITERATIONS = {
+    "“": '"', "”": '"', "„": '"', "«": '"', "»": '"', "″": '"',
+    "'": " ", "’": " ", "‘": " ", "`": " ", "´": " ", "′": " ",
+    "–": "-", "—": "-", "−": "-", "‐": "-", "…": "...", "⁄": "/",
+    ",": ".", ";": ".", ":": ".", "&": "+", "×": "X", "%": "PCT", "€": "EUR", "£": "GBP", "$": "USD",
+    "œ": "oe", "Œ": "OE", "æ": "ae", "Æ": "AE", "ß": "ss", "\t": " ",
+}
+
+# Longueur maximale d'un en-tête dirigé (@GROUPE ou INDICATIF:), dont les caractères sont valides
+JS8_HEADER_MAX = 32
+
+
+def js8_supported(char):
+    """Caractère transmis tel quel par JS8 (minuscules comprises; les retours à la ligne
+    sont laissés à la mise en page)"""
+    return char.upper() in JS8_CHAR_BITS or char == '\n'
+
+
+def js8_transliterate(text):
+    """Remplace les caractères hors alphabet JS8 par leur équivalent le plus proche"""
+    result = []
+    for char in text:
+        if js8_supported(char):
+            result.append(char)
+            continue
+        replacement = JS8_TRANSLITERATIONS.get(char)
+        if replacement is None:
+            replacement = ''.join(
+                JS8_TRANSLITERATIONS.get(part, part) for part in unicodedata.normalize('NFKD', char)
+            )
+            replacement = ''.join(part for part in replacement if js8_supported(part))
+        result.append(replacement)
+    return ''.join(result)
+
+
+_ASTRAL_CHAR = re.compile('[\U00010000-\U0010FFFF]')
+
+
+def tk_chars(text):
+    """Texte compté comme Tcl 8.6: un caractère hors du plan de base (emoji)
+    y devient sa paire de substitution UTF-16 et occupe deux positions d'index"""
+    return _ASTRAL_CHAR.sub(_surrogate_pair, text)
+
+
+def _surrogate_pair(match):
+    code = ord(match.group()) - 0x10000
+    return chr(0xD800 + (code >> 10)) + chr(0xDC00 + (code & 0x3FF))
+
+
+# Commande Tcl d'un widget Text surveillé (voir idlelib.redirector): exécute la
+# commande d'origine sans l'envelopper, donc ses erreurs remontent à l'appelant.
+# Seules les modifications passent par les rappels Python before/after; before
+# retourne la commande à exécuter, ou une liste vide pour l'ignorer.
+JS8_TEXT_PROC = """
+proc js8_text_command {command before after operation args} {
+    if {$operation ni {insert replace delete edit}} {
+        return [$command $operation {*}$args]
+    }
+    set call [$before $operation {*}$args]
+    if {![llength $call]} {
+        return
+    }
+    set result [$command {*}$call]
+    $after {*}$call
+    return $result
+}
+"""
+
+def split_bulletin(text, max_chars):
+    """Découpe un bulletin trop long en parties numérotées ("1/3 ...", "2/3 ...").
+    
+    Coupe entre les mots (un mot plus long qu'une partie est coupé), chaque
+    partie numérotée tenant dans max_chars. Un en-tête dirigé (@GROUPE,
+    INDICATIF:) est répété en tête de chaque partie. Retourne [text] si le
+    bulletin tient dans la limite, [] s'il est vide.
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+    
+    match = JS8_DIRECTED_HEADER.match(text.upper())
+    header = text[:match.end()].rstrip() + ' ' if match else ''
+    if len(header) > max_chars // 2:
+        header = ''  # En-tête trop long pour être répété: envoyé une seule fois
+    words = text[len(header.rstrip()):].split() if header else text.split()
+    body = ' '.join(words)
+    
+    digits = 1
+    while True:
+        # Place laissée par l'en-tête et la numérotation la plus longue ("12/12 ")
+        room = max_chars - len(header) - 2 * digits - 2
+        if room < 1:
+            raise ValueError(f"limit of {max_chars} characters too small to split the bulletin")
+        # Le plus de mots possible par partie (le moteur d'expressions régulières
+        # recule jusqu'à l'espace); un mot plus long qu'une partie est coupé
+        chunks = re.findall(f' ?(.{{1,{room}}}(?= |\\Z)|.{{{room}}})', body)
+        if len(chunks) < 10 ** digits:
+            break
+        digits += 1
+    
+    return [f"{header}{index}/{len(chunks)} {chunk}" for index, chunk in enumerate(chunks, 1)]
+
+
+# Nombre maximal de parties d'un bulletin long (réglable de 1 à 99)
+MAX_BULLETIN_PARTS = 99
+
+
+def bulletin_fits(text, max_chars, max_parts):
+    """Le bulletin tient-il en max_parts parties au plus? Découpé par split_bulletin,
+    en-tête répété et numérotation compris; un découpage impossible ne tient pas."""
+    try:
+        return len(split_bulletin(text, max_chars)) <= max_parts
+    except ValueError:
+        return False
+
+
+# Variables de modèle et largeur maximale de leur valeur; jamais plus que "{NOM}"
+# lui-même: la longueur du texte du modèle borne donc celle du message émis
+TEMPLATE_FIELDS = {
+    'UTC': 5,  # Heure d'émission, ex. 1430Z
+    'SEQ': 4,  # Numéro d'émission, 1 à 9999
+    'GRID': 6,  # Locator de la station (JS8Call)
+    'NEXT': 5,  # Heure de l'émission suivante, ex. 1445Z
+}
+# {NEXT} quand aucune émission n'est planifiée (envoi manuel, émissions arrêtées)
+TEMPLATE_NO_NEXT = 'NONE'
+# Reconnues quelle que soit la casse, pour signaler {utc} ou {Grid} (seul {UTC} est remplacé)
+TEMPLATE_FIELD = re.compile(r'\{([A-Za-z]+)\}')
+TEMPLATE_FIELD_MAX = max(len(name) for name in TEMPLATE_FIELDS) + 2
+
+
+class BulletinTemplate:
+    """Bulletin à variables ({UTC}, {SEQ}, {GRID}, {NEXT}): analysé une fois, rendu à l'émission.
+    
+    Le texte est découpé en littéraux et en variables; render() n'a plus qu'à
+    les assembler. max_length est la longueur du pire rendu possible.
+    """
+    
+    def __init__(self, text):
+        self.text = text
+        self.pieces = []  # Littéraux (str) et variables (tuple (nom,))
+        self.unknown = []  # {NOM} inconnus, laissés tels quels
+        self.miscased = []  # Variables connues mal écrites ({utc}, {Grid}), laissées telles quelles
+        position = 0
+        for match in TEMPLATE_FIELD.finditer(text):
+            name = match.group(1)
+            if name not in TEMPLATE_FIELDS:
+                if name.upper() in TEMPLATE_FIELDS:
+                    self.miscased.append(match.group(0))
+                else:
+                    self.unknown.append(match.group(0))
+                continue
+            self.pieces += [text[position:match.start()], (match.group(1),)]
+            position = match.end()
+        self.pieces.append(text[position:])
+        self.pieces = [piece for piece in self.pieces if piece]
+        self.fields = {piece[0] for piece in self.pieces if isinstance(piece, tuple)}
+        self.max_length = sum(
+            TEMPLATE_FIELDS[piece[0]] if isinstance(piece, tuple) else len(piece) for piece in self.pieces
+        )
+    
+    def render(self, values):
+        """Texte à émettre; values: {nom: valeur}, chaque valeur limitée à sa largeur maximale"""
+        if not self.fields:
+            return self.text
+        return ''.join(
+            str(values[piece[0]])[:TEMPLATE_FIELDS[piece[0]]] if isinstance(piece, tuple) else piece
+            for piece in self.pieces
+        )
+
+
+class JS8Speed:
+    """Mode de vitesse JS8: code SPEED de l'API, durée du cycle (s) et caractères par trame.
+    
+    Un message part en trames d'un cycle chacune; la durée d'émission est
+    donc le nombre de trames multiplié par la durée du cycle du mode.
+    """
+    
+    def __init__(self, name, code, cycle, chars_per_frame=13):
+        self.name = name
+        self.code = code
+        self.cycle = cycle
+        self.chars_per_frame = chars_per_frame
+    
+    def frames(self, text):
+        """Trames d'un texte, empaqueté comme le fait JS8Call"""
+        return count_js8_frames(text)
+    
+    def estimate_frames(self, char_count):
+        """Trames estimées pour char_count caractères d'un texte moyen (ex. longueur maximale)"""
+        return char_count // self.chars_per_frame + 1
+    
+    def tx_seconds(self, text):
+        return self.frames(text) * self.cycle
+    
+    def estimate_tx_seconds(self, char_count):
+        return self.estimate_frames(char_count) * self.cycle
+
+
+# Modes de vitesse JS8 (code SPEED de l'API JS8Call)
+JS8_SPEEDS = {
+    'normal': JS8Speed('normal', 0, 15),
+    'fast': JS8Speed('fast', 1, 10),
+    'turbo': JS8Speed('turbo', 2, 6),
+    'slow': JS8Speed('slow', 4, 30),
+}
+
+# Longueur des cycles d'émission (s) par mode de vitesse JS8
+JS8_CYCLE_SECONDS = {name: speed.cycle for name, speed in JS8_SPEEDS.items()}
+
+
+def js8_tx_seconds(text, speed='normal'):
+    """Durée d'émission d'un message dans un mode de vitesse"""
+    return JS8_SPEEDS[speed].tx_seconds(text)
+
+
+def estimate_tx_seconds(char_count, speed='normal'):
+    """Durée d'émission estimée pour char_count caractères d'un texte moyen (ex. longueur maximale)"""
+    return JS8_SPEEDS[speed].estimate_tx_seconds(char_count)
+
+
+class JS8SlotClock:
+    """Créneaux d'émission JS8: cycles de longueur fixe alignés sur l'horloge UTC.
+    
+    En mode Normal les cycles commencent à :00, :15, :30 et :45; JS8Call ne
+    commence un message qu'au début d'un cycle.
+    """
+    
+    def __init__(self, cycle=15):
+        self.cycle = cycle
+    
+    def slot_at_or_after(self, timestamp):
+        """Indice du premier créneau commençant à timestamp ou après"""
+        return math.ceil(timestamp / self.cycle)
+    
+    def nearest_slot(self, timestamp):
+        """Indice du début de créneau le plus proche (PTT observé un peu avant ou après)"""
+        return round(timestamp / self.cycle)
+    
+    def slot_start(self, slot):
+        return slot * self.cycle
+
+
+class TxStateTracker:
+    """État d'émission de JS8Call, déduit des événements RIG.PTT et TX.FRAME.
+    
+    JS8Call coupe le PTT entre deux trames d'un même message: l'émission n'est
+    considérée terminée qu'après idle_gap secondes sans activité. Les messages
+    remis à JS8Call (handoff) restent comptés dans la file tant qu'ils n'ont pas
+    été vus partir, ou jusqu'à expiration de leur durée estimée.
+    """
+    
+    def __init__(self, idle_gap=20.0):
+        self.idle_gap = idle_gap
+        self.ptt = False
+        self._last_activity = None
+        self._outstanding = {}
+        self._next_token = 0
+        self._lock = threading.Lock()
+    
+    def on_event(self, event):
+        with self._lock:
+            now = time.monotonic()
+            if event.type == 'RIG.PTT':
+                self.ptt = event.ptt
+            self._last_activity = now
+            for entry in self._outstanding.values():
+                entry[1] = True
+    
+    def reset(self):
+        """Connexion perdue: l'état PTT n'est plus connu"""
+        with self._lock:
+            self.ptt = False
+            self._last_activity = None
+    
+    def idle_in(self):
+        """Secondes avant que JS8Call soit considéré libre (0 s'il l'est déjà)"""
+        with self._lock:
+            if self.ptt:
+                return self.idle_gap
+            if self._last_activity is None:
+                return 0
+            return max(0, self._last_activity + self.idle_gap - time.monotonic())
+    
+    @property
+    def busy(self):
+        """True si JS8Call émet (ou vient d'émettre une trame d'un message en cours)"""
+        with self._lock:
+            return self._busy(time.monotonic())
+    
+    def _busy(self, now):
+        return self.ptt or (self._last_activity is not None and now - self._last_activity < self.idle_gap)
+    
+    def handoff(self, airtime):
+        """Enregistre un message remis à JS8Call; retourne un jeton pour discard()"""
+        with self._lock:
+            self._next_token += 1
+            # [échéance, émission observée]
+            self._outstanding[self._next_token] = [time.monotonic() + airtime * 2 + 60, False]
+            return self._next_token
+    
+    def discard(self, token):
+        with self._lock:
+            self._outstanding.pop(token, None)
+    
+    @property
+    def depth(self):
+        """Nombre de messages remis à JS8Call et pas encore terminés"""
+        with self._lock:
+            now = time.monotonic()
+            busy = self._busy(now)
+            for token, (expiry, seen) in list(self._outstanding.items()):
+                if now >= expiry or (seen and not busy):
+                    del self._outstanding[token]
+            return len(self._outstanding)
+
+
+class LatencyHistogram:
+    """Histogramme glissant des temps aller-retour de l'API JS8Call (ms)"""
+    
+    BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+    
+    def __init__(self, size=200):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+        self.timeouts = 0
+    
+    def add(self, latency_ms):
+        with self._lock:
+            self._samples.append(latency_ms)
+    
+    def add_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+    
+    def __len__(self):
+        return len(self._samples)
+    
+    def percentile(self, p):
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))]
+    
+    def buckets(self):
+        """Nombre d'échantillons par tranche: [('<10', n), ('<25', n), ..., ('>=5000', n)]"""
+        with self._lock:
+            samples = list(self._samples)
+        counts = [0] * (len(self.BUCKETS) + 1)
+        for value in samples:
+            index = 0
+            while index < len(self.BUCKETS) and value >= self.BUCKETS[index]:
+                index += 1
+            counts[index] += 1
+        labels = [f"<{limit}" for limit in self.BUCKETS] + [f">={self.BUCKETS[-1]}"]
+        return list(zip(labels, counts))
+    
+    def summary(self):
+        """Résumé court pour l'interface et le journal"""
+        if not self._samples:
+            return "---"
+        return (f"p50 {self.percentile(50):.0f} ms · p95 {self.percentile(95):.0f} ms · "
+                f"max {self.percentile(100):.0f} ms (n={len(self._samples)})")
+
+
+class ReconnectPolicy:
+    """Délais de reconnexion automatique: backoff exponentiel borné avec jitter"""
+    
+    def __init__(self, initial=2.0, factor=2.0, maximum=300.0, jitter=0.25):
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+        self.jitter = jitter
+    
+    def delay(self, attempt):
+        """Délai avant la tentative suivante (attempt = nombre d'échecs - 1)"""
+        base = min(self.maximum, self.initial * (self.factor ** min(attempt, 32)))
+        spread = base * self.jitter
+        return max(0.0, min(self.maximum, base + random.uniform(-spread, spread)))
+
+
+class AirtimeGovernor:
+    """Budget d'émission sur fenêtres glissantes d'une heure et d'un jour.
+    
+    Une émission compte d'abord pour sa durée estimée (reserve), puis pour le
+    temps de PTT réellement mesuré (add_actual) une fois JS8Call revenu au
+    repos. Le PTT sans émission réservée (émission manuelle depuis JS8Call)
+    est compté aussi. Chaque instance JS8Call (source) a ses propres
+    émissions: le PTT d'une instance n'est imputé qu'aux siennes.
+    Plafonds en secondes, 0 = pas de limite.
+    
+    Le registre est réécrit dans path (JSON) à chaque changement: un
+    redémarrage ne remet pas le budget du jour à zéro.
+    """
+    
+    HOUR = 3600
+    DAY = 86400
+    
+    def __init__(self, hour_cap=0, day_cap=0, path=None):
+        self.hour_cap = hour_cap
+        self.day_cap = day_cap
+        self.path = path
+        self._entries = deque()  # [instant, durée estimée, durée mesurée, en cours, source]
+        self._lock = threading.Lock()
+        self.load()
+    
+    def load(self):
+        """Relit le registre; les émissions en cours à l'arrêt comptent pour ce qui est connu"""
+        if not (self.path and os.path.exists(self.path)):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            entries = [[float(when), float(estimate), float(actual), False, source]
+                       for when, estimate, actual, _, source in saved]
+        except (OSError, ValueError, TypeError):
+            # Registre illisible: le budget repart de zéro plutôt que de bloquer l'émission
+            return
+        with self._lock:
+            self._entries = deque(sorted(entries, key=lambda entry: entry[0]))
+            self._prune(time.time())
+    
+    def _save(self):
+        """Écriture atomique (fichier temporaire puis remplacement); appelé sous le verrou"""
+        if not self.path:
+            return
+        try:
+            temp = self.path + '.tmp'
+            with open(temp, 'w', encoding='utf-8') as f:
+                json.dump(list(self._entries), f)
+            os.replace(temp, self.path)
+        except OSError:
+            pass  # Le budget reste tenu en mémoire
+    
+    @staticmethod
+    def _charge(entry):
+        _, estimate, actual, pending, _ = entry
+        if actual and not pending:
+            return actual
+        return max(estimate, actual)
+    
+    def _prune(self, now):
+        while self._entries and self._entries[0][0] <= now - self.DAY:
+            self._entries.popleft()
+    
+    def _limits(self):
+        return ((self.HOUR, self.hour_cap), (self.DAY, self.day_cap))
+    
+    def reserve(self, seconds, now=None, source=None):
+        """Compte une émission remise à une instance JS8Call; retourne une entrée pour release()"""
+        now = time.time() if now is None else now
+        entry = [now, seconds, 0.0, True, source]
+        with self._lock:
+            self._prune(now)
+            self._entries.append(entry)
+            self._save()
+        return entry
+    
+    def release(self, entry):
+        """L'émission n'a pas été remise à JS8Call: elle ne compte pas"""
+        with self._lock:
+            try:
+                self._entries.remove(entry)
+            except ValueError:
+                return
+            self._save()
+    
+    def add_actual(self, seconds, now=None, source=None):
+        """Temps de PTT mesuré, imputé à la plus ancienne émission en cours de la même instance"""
+        now = time.time() if now is None else now
+        with self._lock:
+            for entry in self._entries:
+                if entry[3] and entry[4] == source:
+                    entry[2] += seconds
+                    break
+            else:
+                self._entries.append([now, 0.0, seconds, False, source])
+            self._save()
+    
+    def settle(self, now=None):
+        """JS8Call au repos: les émissions mesurées ne comptent plus que pour leur durée réelle.
+        
+        Une émission jamais mesurée (instance sans suivi du PTT) reste comptée
+        pour sa durée estimée.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            changed = False
+            for entry in self._entries:
+                if entry[3] and (entry[2] or now > entry[0] + entry[1] * 2 + 60):
+                    entry[3] = False
+                    changed = True
+            if changed:
+                self._save()
+    
+    def used(self, window, now=None):
+        now = time.time() if now is None else now
+        with self._lock:
+            return sum(self._charge(entry) for entry in self._entries if entry[0] > now - window)
+    
+    def wait_for(self, seconds, now=None):
+        """Délai avant qu'une émission de seconds secondes tienne dans le budget.
+        
+        0 = tout de suite, math.inf = jamais (plus longue qu'un plafond).
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._prune(now)
+            entries = list(self._entries)
+        
+        wait = 0
+        for window, cap in self._limits():
+            if not cap:
+                continue
+            if seconds > cap:
+                return math.inf
+            inside = [entry for entry in entries if entry[0] > now - window]
+            used = sum(self._charge(entry) for entry in inside)
+            # Les entrées sortent de la fenêtre de la plus ancienne à la plus récente
+            for entry in inside:
+                if used + seconds <= cap:
+                    break
+                used -= self._charge(entry)
+                wait = max(wait, entry[0] + window - now)
+        return wait
+
+
+class EmissionSchedule:
+    """Instants d'émission périodiques alignés sur une époque fixe (minuit UTC, 1er janvier 1970).
+    
+    Les émissions ont lieu à k * period + offset secondes de l'époque: le
+    calcul est en O(1) et ne dépend ni de l'heure de démarrage ni du fuseau.
+    """
+    
+    def __init__(self, period, offset=0):
+        period = int(period)
+        if period <= 0:
+            raise ValueError("period must be > 0")
+        self.period = period
+        self.offset = int(offset) % period
+    
+    @classmethod
+    def from_interval(cls, interval, offset=0):
+        """Planning d'un choix de l'interface: minutes, 'even' (heures UTC paires) ou 'odd'"""
+        if interval == "even":
+            return cls(2 * 3600, offset)
+        if interval == "odd":
+            return cls(2 * 3600, 3600 + offset)
+        return cls(int(interval) * 60, offset)
+    
+    def next_timestamp(self, timestamp):
+        """Premier instant planifié strictement postérieur à timestamp (secondes Unix)"""
+        whole = math.floor(timestamp)
+        return ((whole - self.offset) // self.period + 1) * self.period + self.offset
+    
+    def timestamps_between(self, start, end):
+        """Instants planifiés dans ]start, end] (secondes Unix).
+        
+        Retourne un range: sa longueur et n'importe quel élément s'obtiennent
+        en O(1), sans énumérer la période (un an se «calcule» instantanément).
+        """
+        return range(self.next_timestamp(start), math.floor(end) + 1, self.period)
+    
+    def next_timestamps(self, timestamp, count):
+        first = self.next_timestamp(timestamp)
+        return [first + i * self.period for i in range(count)]
+    
+    def next_after(self, when):
+        """Prochaine émission après when (datetime naïf local ou avec fuseau, même type en retour)"""
+        return self._to_datetime(self.next_timestamp(when.timestamp()), when)
+    
+    def next_n(self, when, count):
+        return [self._to_datetime(ts, when) for ts in self.next_timestamps(when.timestamp(), count)]
+    
+    @staticmethod
+    def _to_datetime(timestamp, like):
+        return datetime.fromtimestamp(timestamp, like.tzinfo)
+
+
+def config_number(value, default, valid=None):
+    """Nombre lu dans le fichier de configuration, ou default s'il est absent,
+    non numérique ou refusé par valid (fichier modifié à la main)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        return default
+    if valid is not None and not valid(value):
+        return default
+    return value
+
+
+def load_timezone(name):
+    """Fuseau d'affichage: '' = heure locale du système (None), 'UTC' ou nom IANA ('Europe/Paris').
+    
+    Retourne None (heure locale) si le nom est inconnu ou si zoneinfo
+    n'est pas disponible.
+    """
+    name = (name or '').strip()
+    if not name:
+        return None
+    if name.upper() in ('UTC', 'GMT', 'Z'):
+        return timezone.utc
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(name)
+    except Exception:
+        return None
+
+
+class CatchUpPolicy:
+    """Que faire des émissions manquées (veille de l'ordinateur, blocage, saut d'horloge).
+    
+    mode 'skip': seules les émissions en retard de moins de tolerance secondes partent;
+    'once': une seule émission (la plus récente), quel que soit le retard;
+    'all': toutes (au plus limit), espacées de spacing secondes.
+    """
+    
+    MODES = ('skip', 'once', 'all')
+    grace = 2  # Retard de l'ordonnanceur (s) en deçà duquel l'échéance est à l'heure
+    limit = 24
+    
+    def __init__(self, mode='skip', tolerance=300, spacing=60):
+        self.mode = mode
+        self.tolerance = tolerance
+        self.spacing = spacing
+    
+    def plan(self, missed, now):
+        """Parmi les émissions manquées (ordre chronologique), celles à émettre"""
+        if not missed:
+            return []
+        if self.mode == 'once':
+            return missed[-1:]
+        if self.mode == 'all':
+            return missed[-self.limit:]
+        return [when for when in missed if (now - when).total_seconds() <= self.tolerance]
+
+
+def station_slot_offset(callsign, slots, cycle):
+    """Décalage (s) propre à une station: crc32 de l'indicatif réparti sur slots créneaux JS8.
+    
+    Déterministe: une station garde le même créneau d'un lancement à l'autre,
+    et des stations différentes se répartissent sur les créneaux disponibles.
+    """
+    callsign = (callsign or '').strip().upper()
+    if not callsign or slots <= 1:
+        return 0
+    return zlib.crc32(callsign.encode('utf-8')) % slots * cycle
@@ -0,0 +1,97 @@
+"""Relevé du nombre de trames émises par JS8Call, pour vérifier le compteur de trames.
+
+Usage: python3 benchmarks/js8call_frames.py [HÔTE] [PORT]
+
+Il faut un JS8Call réel, API TCP activée, en mode Normal. Chaque message
+est réellement émis: brancher une charge fictive ou choisir «None» comme rig
+et une sortie audio muette. Les comptes sont écrits dans
+tests/data/js8call_frames.json, que tests/test_frames.py compare au
+compteur (test ignoré tant que le fichier n'existe pas).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+from transports import load_frontend
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'tests', 'data', 'js8call_frames.json')
+
+# Messages relevés: limites de trame (une lettre ou un espace de plus déborde),
+# chiffres à 8 bits, minuscules, caractères ignorés et en-têtes dirigés
+JS8_CAPTURE_MESSAGES = [
+    "E",
+    "E" * 22,
+    "E" * 23,
+    " " * 33 + "E",
+    "7" * 8,
+    "7" * 9,
+    "7" * 17,
+    "e" * 23,
+    "E" * 22 + "é€",
+    "CQ CQ DE F4ABC",
+    "@ALLCALL TEST",
+    "@ALLCALL HELLO WORLD FROM THE BBS",
+    "F4ABC: HELLO",
+    "NET CHECK IN 73 DE F4ABC WX REPORT QSL 14078 KHZ",
+    "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG 0123456789 ./?+-!\"",
+]
+
+
+def capture_frames(client, text, timeout=600):
+    """Émet text et compte ses événements TX.FRAME (une trame chacun); None si rien n'est parti"""
+    frames = []
+    seen = threading.Event()
+    
+    def on_frame(event):
+        frames.append(event)
+        seen.set()
+    
+    token = client.subscribe(on_frame, types=['TX.FRAME'])
+    try:
+        client.send_bulletin(text).result(timeout=30)
+        if not seen.wait(timeout):
+            return None
+        # JS8Call coupe le PTT entre deux trames: fin du message après idle_gap secondes sans activité
+        deadline = time.monotonic() + timeout
+        while client.tx_state.idle_in() > 0 and time.monotonic() < deadline:
+            time.sleep(0.5)
+        return len(frames)
+    finally:
+        client.unsubscribe(token)
+
+
+def capture_all(host='127.0.0.1', port=None):
+    """Relève tous les messages de JS8_CAPTURE_MESSAGES et enregistre les comptes"""
+    frontend = load_frontend()
+    client = frontend.JS8CallClient(host, port)
+    if not client.connect().result():
+        print(f"Cannot connect to JS8Call on {host}:{client.port}")
+        return 1
+    
+    captured = []
+    try:
+        for text in JS8_CAPTURE_MESSAGES:
+            frames = capture_frames(client, text)
+            print(f"  {frames} frame(s): {text!r}")
+            if frames is None:
+                print("  No TX.FRAME event received: is JS8Call allowed to transmit?")
+                return 1
+            captured.append({'text': text, 'frames': frames})
+    finally:
+        client.disconnect()
+    
+    os.makedirs(os.path.dirname(OUTPUT), exist_ok=True)
+    with open(OUTPUT, 'w', encoding='utf-8') as f:
+        json.dump({'speed': 'normal', 'captured': time.strftime('%Y-%m-%d'), 'messages': captured}, f, ensure_ascii=False, indent=1)
+    print(f"Saved to {os.path.normpath(OUTPUT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(capture_all(
+        sys.argv[1] if len(sys.argv) > 1 else '127.0.0.1',
+        int(sys.argv[2]) if len(sys.argv) > 2 else None,
+    ))
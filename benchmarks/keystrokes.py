@@ -0,0 +1,138 @@
+"""Banc d'essai du coût de chaque frappe dans l'éditeur de bulletin.
+
+Usage: python3 benchmarks/keystrokes.py [CARACTÈRES]
+
+La mesure de l'éditeur complet nécessite un affichage (lancer par exemple
+sous xvfb-run); celle des compteurs seuls n'en a pas besoin.
+"""
+
+import os
+import random
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Sources'))
+
+from js8call_bbs_core import MAX_BULLETIN_PARTS, JS8FrameCounter
+from transports import load_frontend
+
+
+def typing_edits(limit, seed=None):
+    """Frappes d'un bulletin de limit caractères: (position, caractère).
+    
+    En fin de texte, plus 10 % d'insertions au hasard; des mots de longueur
+    réaliste, pour que le découpage en parties coupe entre les mots.
+    """
+    rng = random.Random(seed)
+    words = "CQ NET CHECK IN WX REPORT QSL 73 DE F4ABC 14078 KHZ THE NEXT BULLETIN AT 1430Z".split()
+    stream = ''
+    while len(stream) < limit:
+        stream += rng.choice(words) + ' '
+    edits = []
+    for length, char in enumerate(stream[:limit]):
+        position = rng.randint(0, length) if rng.random() < 0.1 else length
+        edits.append((position, char))
+    return edits
+
+
+def print_latencies(name, samples):
+    last = sorted(samples[-1000:])
+    samples = sorted(samples)
+    p50, p99 = (samples[min(len(samples) - 1, int(len(samples) * p))] for p in (0.50, 0.99))
+    print(
+        f"  {name}: p50 {p50:.1f} µs | p99 {p99:.1f} µs | "
+        f"last 1000 keystrokes p50 {last[len(last) // 2]:.1f} µs, p99 {last[int(len(last) * 0.99)]:.1f} µs"
+    )
+
+
+def benchmark_editor(limit=20000, seed=None):
+    """Temps de réponse de l'éditeur à chaque frappe, widget Tk compris.
+    
+    Chaque frappe passe par le vrai widget Text: garde de saisie et suivi des
+    modifications (_before_text_edit, _after_text_edit), puis
+    on_text_modified() et l'affichage du compteur, découpage en parties et
+    trames par partie compris. La limite de caractères est choisie pour que
+    le texte dépasse une partie dès les premières centaines de frappes et
+    tienne en MAX_BULLETIN_PARTS parties: la garde ne refuse rien.
+    """
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        print("Editor keystroke benchmark skipped: no display (run under xvfb-run)")
+        return
+    root.withdraw()
+    frontend = load_frontend()
+    # Seul l'éditeur est construit: pas de fenêtre complète ni de connexion
+    app = object.__new__(frontend.JS8BulletinBoard)
+    app.root = root
+    app.max_chars = max(160, limit // (MAX_BULLETIN_PARTS - 9))
+    app.max_parts = MAX_BULLETIN_PARTS
+    app.text_length = 0
+    app.char_count = 0
+    app.frame_counter = JS8FrameCounter()
+    app.js8_speed = 'normal'
+    app._templates = {}
+    app._split = (None, None, None)
+    app._part_frames = {}
+    app._optimizer_refresh = None
+    app.text_area = tk.Text(root, undo=True)
+    app.text_area.tag_configure('unsupported')
+    app.progress_bar = ttk.Progressbar(root, maximum=app.max_chars)
+    app.char_label = ttk.Label(root)
+    app.transliterate_button = ttk.Button(root)
+    app._hook_text_edits()
+    
+    print(f"Editor keystroke benchmark ({limit} characters typed, limit {app.max_chars} characters per part)")
+    latencies = []
+    for position, char in typing_edits(limit, seed):
+        started = time.perf_counter()
+        app.text_area.insert(f"1.0+{position}c", char)
+        app.on_text_modified()
+        latencies.append((time.perf_counter() - started) * 1000000)
+    print_latencies("editor", latencies)
+    root.destroy()
+
+
+def benchmark_keystrokes(limit=20000, seed=None):
+    """Coût par frappe des compteurs seuls (caractères et trames), recompte complet ou incrémental.
+    
+    Mêmes frappes que benchmark_editor(). «Recompte complet»: longueur et
+    trames recalculées sur le texte entier à chaque frappe; «incrémental»:
+    longueur tenue par différence, blancs de début et de fin et trames par
+    splice(). Ni le widget Tk ni
+    l'affichage ne sont mesurés (pas d'affichage requis).
+    """
+    edits = typing_edits(limit, seed)
+    print(f"Counter-only keystroke benchmark ({limit} characters typed, no Tk widget)")
+    
+    text = ''
+    counter = JS8FrameCounter()
+    latencies = []
+    for position, char in edits:
+        text = text[:position] + char + text[position:]
+        started = time.perf_counter()
+        char_count = len(text.strip())
+        counter.update(text.strip())
+        latencies.append((time.perf_counter() - started) * 1000000)
+    full = latencies
+    
+    length = 0
+    counter = JS8FrameCounter()
+    latencies = []
+    for position, char in edits:
+        started = time.perf_counter()
+        length += 1
+        counter.splice(position, 0, char)
+        char_count = length - counter.blanks
+        latencies.append((time.perf_counter() - started) * 1000000)
+    
+    print_latencies("full recount", full)
+    print_latencies("incremental", latencies)
+
+
+if __name__ == "__main__":
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    benchmark_keystrokes(limit)
+    benchmark_editor(limit)
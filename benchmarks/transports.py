@@ -0,0 +1,126 @@
+"""Banc d'essai des transports TCP et UDP de l'API JS8Call (latence et CPU par commande).
+
+Usage: python3 benchmarks/transports.py [COMMANDES]
+"""
+
+import importlib.util
+import json
+import os
+import socket
+import sys
+import threading
+import time
+
+SOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Sources')
+sys.path.insert(0, SOURCES)
+
+from js8call_bbs_core import JS8LineParser
+
+
+def load_frontend():
+    """Charge l'interface En (nom de fichier non importable) pour son client JS8Call"""
+    spec = importlib.util.spec_from_file_location('js8call_bbs_en', os.path.join(SOURCES, 'js8call-BBS-v1_En.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _fake_js8call(transport):
+    """Faux JS8Call local répondant à STATION.GET_CALLSIGN; retourne (port, stop)"""
+    stop = threading.Event()
+    parser = JS8LineParser()
+    
+    def reply(data):
+        replies = []
+        for message in parser.feed(data):
+            params = {'_ID': (message.get('params') or {}).get('_ID')}
+            replies.append(json.dumps({'type': 'STATION.CALLSIGN', 'value': 'N0CALL', 'params': params}) + '\n')
+        return [r.encode('utf-8') for r in replies]
+    
+    if transport == 'tcp':
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        
+        def serve():
+            conn, _ = listener.accept()
+            conn.settimeout(0.2)
+            while not stop.is_set():
+                try:
+                    data = conn.recv(65536)
+                except socket.timeout:
+                    continue
+                if not data:
+                    break
+                conn.sendall(b''.join(reply(data)))
+            conn.close()
+            listener.close()
+    else:
+        # JS8Call émet vers le port du client: on en réserve un libre
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+        probe.close()
+        server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        server.bind(('127.0.0.1', 0))
+        server.settimeout(0.2)
+        
+        def serve():
+            while not stop.is_set():
+                try:
+                    data, address = server.recvfrom(65536)
+                except socket.timeout:
+                    # Battement de JS8Call: permet au client d'apprendre notre adresse
+                    server.sendto(b'{"type": "PING", "value": "", "params": {}}', ('127.0.0.1', port))
+                    continue
+                except ConnectionResetError:
+                    continue
+                for datagram in reply(data + b'\n'):
+                    server.sendto(datagram, address)
+            server.close()
+    
+    threading.Thread(target=serve, daemon=True).start()
+    return port, stop.set
+
+
+def benchmark_transports(count=2000):
+    """Compare la latence et le coût CPU par commande des transports TCP et UDP.
+    
+    Chaque commande est une requête STATION.GET_CALLSIGN attendue jusqu'à sa
+    réponse. Le faux JS8Call tourne dans le même processus: le temps CPU
+    mesuré couvre donc les deux extrémités.
+    """
+    frontend = load_frontend()
+    print(f"Benchmark of JS8Call transports ({count} commands)")
+    for name in frontend.JS8_TRANSPORTS:
+        port, stop = _fake_js8call(name)
+        client = frontend.JS8CallClient('127.0.0.1', port, transport=name)
+        client.ping_interval = 0
+        if not client.connect().result():
+            print(f"  {name.upper()}: connection failed")
+            stop()
+            continue
+        
+        latencies = []
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        for _ in range(count):
+            started = time.perf_counter()
+            client.request('STATION.GET_CALLSIGN', response_type='STATION.CALLSIGN').result()
+            latencies.append((time.perf_counter() - started) * 1000)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        client.disconnect()
+        stop()
+        
+        latencies.sort()
+        p50, p95, p99 = (latencies[min(len(latencies) - 1, int(len(latencies) * p))] for p in (0.50, 0.95, 0.99))
+        print(
+            f"  {name.upper()}: p50 {p50:.3f} ms | p95 {p95:.3f} ms | p99 {p99:.3f} ms | "
+            f"CPU {cpu / count * 1000000:.0f} µs/command | {count / wall:.0f} commands/s"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_transports(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,18 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# Le cœur commun est importé tel quel par les deux interfaces
+SOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'Sources')
+sys.path.insert(0, SOURCES)
+
+
+@pytest.fixture(scope='session')
+def frontend():
+    """Interface En chargée comme module (nom de fichier non importable)"""
+    spec = importlib.util.spec_from_file_location('js8call_bbs_en', os.path.join(SOURCES, 'js8call-BBS-v1_En.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
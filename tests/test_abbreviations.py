@@ -0,0 +1,32 @@
+from js8call_bbs_core import JS8_ABBREVIATIONS, apply_edits, suggest_abbreviations
+
+
+def substitutions(text):
+    return {(original, replacement) for _, _, original, replacement, _ in suggest_abbreviations(text)}
+
+
+def optimized(text):
+    return apply_edits(text, [edit for suggestion in suggest_abbreviations(text) for edit in suggestion[4]])
+
+
+def test_shorter_number_formats():
+    assert optimized("NET AT 12:30 UTC") == "NET AT 1230Z"
+    assert optimized("QRG 7.0 MHZ") == "QRG 7 MHZ"
+    assert optimized("RUNNING 100 WATTS") == "RUNNING 100W"
+
+
+def test_thousands_separators_are_kept():
+    assert optimized("Power 1,000 watts") == "PWR 1,000w"
+    assert optimized("NET AT 2,000 UTC") == "NET AT 2,000 UTC"
+    assert optimized("SSTV 1.000 QSO") == "SSTV 1.000 QSO"
+
+
+def test_numbers_inside_numbers_are_left_alone():
+    assert optimized("VERSION 1.0.0") == "VERSION 1.0.0"
+    assert not any(original.startswith("0") for original, _ in substitutions("VERSION 1.0.0 AT 1,000 UTC"))
+
+
+def test_no_telegraphic_contractions():
+    for word in ("ARE", "FOR", "YOU", "YOUR", "AND"):
+        assert word not in JS8_ABBREVIATIONS
+    assert substitutions("ARE YOU READY FOR THE NET AND") == set()
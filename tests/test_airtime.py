@@ -0,0 +1,40 @@
+import time
+
+from js8call_bbs_core import AirtimeGovernor
+
+
+def test_ledger_survives_restart(tmp_path):
+    path = str(tmp_path / "airtime.json")
+    now = time.time()
+    governor = AirtimeGovernor(day_cap=600, path=path)
+    governor.reserve(120, now=now - 200)
+    governor.reserve(60, now=now - 100, source="40m")
+    restarted = AirtimeGovernor(day_cap=600, path=path)
+    assert restarted.used(AirtimeGovernor.DAY, now=now) == 180
+    assert restarted.wait_for(500, now=now) == AirtimeGovernor.DAY - 200
+
+
+def test_released_entry_is_not_saved(tmp_path):
+    path = str(tmp_path / "airtime.json")
+    governor = AirtimeGovernor(path=path)
+    governor.release(governor.reserve(120))
+    assert AirtimeGovernor(path=path).used(AirtimeGovernor.DAY) == 0
+
+
+def test_unreadable_ledger_starts_empty(tmp_path):
+    path = tmp_path / "airtime.json"
+    path.write_text("[[1, 2]]", encoding="utf-8")
+    assert AirtimeGovernor(path=str(path)).used(AirtimeGovernor.DAY) == 0
+
+
+def test_ptt_time_goes_to_the_same_instance():
+    """Le PTT de l'instance principale ne remplace pas l'estimation d'une instance supplémentaire"""
+    governor = AirtimeGovernor()
+    governor.reserve(50, now=1000, source="40m")
+    governor.reserve(50, now=1001)
+    governor.add_actual(30, now=1060)
+    governor.settle(now=1061)
+    assert governor.used(AirtimeGovernor.HOUR, now=1062) == 50 + 30
+    # Sans PTT mesuré, l'instance supplémentaire reste comptée pour son estimation
+    governor.settle(now=1000 + 50 * 2 + 61)
+    assert governor.used(AirtimeGovernor.HOUR, now=1200) == 50 + 30
@@ -0,0 +1,49 @@
+from js8call_bbs_core import JS8FrameCounter, bulletin_fits, split_bulletin, tk_chars
+
+
+def test_fits_counts_header_and_numbering():
+    # 1600 caractères à 160 par partie: la numérotation «n/11 » en demande une onzième
+    text = ("ABCDEFGHI " * 160).strip()
+    assert len(text) <= 160 * 10
+    assert len(split_bulletin(text, 160)) == 11
+    assert not bulletin_fits(text, 160, 10)
+    assert bulletin_fits(text, 160, 11)
+    assert bulletin_fits("", 160, 1)
+    # Découpage impossible (pas de place après la numérotation): ne tient pas
+    assert not bulletin_fits("ABCDEFGH", 4, 99)
+
+
+def test_tk_chars_uses_surrogate_pairs():
+    assert tk_chars("A\U0001F600B") == "A\ud83d\ude00B"
+    assert len(tk_chars("é€\U0001F4E1")) == 4
+
+
+def test_counter_keeps_text_length():
+    # ß ou ﬁ changent de longueur avec upper(): les positions de splice() en dépendent
+    counter = JS8FrameCounter("straße ﬁn")
+    assert len(counter.text) == len("straße ﬁn")
+    counter.splice(6, 1, "x")
+    assert counter.text == "STRAßEXﬁN"
+    assert counter.frames == JS8FrameCounter("STRAßEXﬁN").frames
+
+
+def test_split_cuts_long_words_between_parts():
+    # Place par partie: 14 - len("n/5 ") = 10 caractères
+    assert split_bulletin("AB " + "X" * 25 + " CD EF", 14) == [
+        "1/5 AB", "2/5 XXXXXXXXXX", "3/5 XXXXXXXXXX", "4/5 XXXXX CD", "5/5 EF",
+    ]
+    # Blancs multiples et retours à la ligne réduits à une espace, en-tête répété
+    assert split_bulletin("@ALLCALL " + "HELLO  WORLD\n" * 3, 24) == [
+        "@ALLCALL 1/3 HELLO WORLD", "@ALLCALL 2/3 HELLO WORLD", "@ALLCALL 3/3 HELLO WORLD",
+    ]
+
+
+def test_counter_tracks_margins():
+    # Blancs de début et de fin tenus à jour sans relire le texte: comparés à strip()
+    counter = JS8FrameCounter()
+    text = ''
+    for offset, removed, inserted in [(0, 0, "  "), (2, 0, "AB"), (4, 0, " \n"), (1, 0, "C"),
+                                      (0, 1, ""), (0, 3, " "), (3, 3, ""), (0, 2, "\t")]:
+        counter.splice(offset, removed, inserted)
+        text = text[:offset] + inserted + text[offset + removed:]
+        assert counter.blanks == len(text) - len(text.strip()), repr(text)
@@ -0,0 +1,16 @@
+import math
+
+from js8call_bbs_core import config_number
+
+
+def test_config_number_keeps_valid_values():
+    assert config_number(12, 30) == 12
+    assert config_number(2.5, 30, lambda v: v > 0) == 2.5
+    assert config_number(0, 30, lambda v: v == 0 or v >= 5) == 0
+
+
+def test_config_number_rejects_hand_edited_values():
+    for value in (None, "60", True, [], math.nan, math.inf):
+        assert config_number(value, 30) == 30
+    assert config_number(3, 30, lambda v: v == 0 or v >= 5) == 30
+    assert config_number(-1, 300, lambda v: v >= 0) == 300
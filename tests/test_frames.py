@@ -0,0 +1,89 @@
+import json
+import os
+import random
+
+import pytest
+
+from js8call_bbs_core import (
+    JS8_CHAR_BITS,
+    JS8_FRAME_BLOCK,
+    JS8_FRAME_DATA_BITS,
+    JS8_HUFFMAN_CODES,
+    JS8_SPEEDS,
+    JS8FrameCounter,
+    count_js8_frames,
+)
+
+
+# Comptes relevés dans JS8Call par benchmarks/js8call_frames.py
+JS8CALL_FRAMES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'js8call_frames.json')
+
+
+def test_captured_js8call_frames():
+    if not os.path.exists(JS8CALL_FRAMES):
+        pytest.skip("no JS8Call capture: run benchmarks/js8call_frames.py against JS8Call")
+    with open(JS8CALL_FRAMES, encoding='utf-8') as f:
+        captured = json.load(f)
+    for message in captured['messages']:
+        assert count_js8_frames(message['text']) == message['frames'], message['text']
+
+
+def test_frame_capacity_per_character():
+    """Une trame contient 68 // bits caractères identiques; un de plus ouvre une trame"""
+    for char, bits in JS8_CHAR_BITS.items():
+        fitting = JS8_FRAME_DATA_BITS // bits
+        assert count_js8_frames(char * fitting) == 1, char
+        assert count_js8_frames(char * (fitting + 1)) == 2, char
+        assert count_js8_frames(char.lower() * (fitting + 1) + "é€") == 2, char
+
+
+def test_directed_header_is_one_frame():
+    assert count_js8_frames("") == 0
+    assert count_js8_frames("@ALLCALL ") == 1
+    assert count_js8_frames("@ALLCALL " + "E" * 22) == 2
+    assert count_js8_frames("F4ABC: " + "E" * 23) == 3
+
+
+def test_repack_stops_when_frames_realign():
+    """Une frappe au début d'un long texte ne relit que le bloc modifié"""
+    counter = JS8FrameCounter("HELLO WORLD " * 400)
+    assert counter.splice(5, 0, "X") == count_js8_frames("HELLOX WORLD " + "HELLO WORLD " * 399)
+    assert counter.repacked <= 2 * JS8_FRAME_BLOCK
+    assert counter.update("HELLO WORLD " * 400) == count_js8_frames("HELLO WORLD " * 400)
+    assert counter.repacked <= 2 * JS8_FRAME_BLOCK
+
+
+def test_incremental_matches_full_count():
+    """Insertions, suppressions et collages aléatoires: update() et splice() comparés à un comptage complet"""
+    rng = random.Random(20)
+    alphabet = list(JS8_HUFFMAN_CODES) + ['a', 'é', '@', ':']
+    counter = JS8FrameCounter()
+    spliced = JS8FrameCounter()
+    text = ''
+    for _ in range(20000):
+        position = rng.randint(0, len(text))
+        action = rng.random()
+        if action < 0.6 or not text:
+            text = text + rng.choice(alphabet) if action < 0.3 else text[:position] + rng.choice(alphabet) + text[position:]
+        elif action < 0.9:
+            text = text[:position] + text[position + 1:]
+        else:
+            text = text[:position] + ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 20))) + text[position:]
+        if len(text) > 500:
+            text = text[:rng.randint(0, 500)]
+        if rng.random() < 0.01:
+            text = rng.choice(["@ALLCALL ", "F4ABC: ", ""]) + text
+        # Même modification décrite par position (comme le fait l'éditeur)
+        old = spliced.text
+        start = len(os.path.commonprefix([old, text.upper()]))
+        tail = len(os.path.commonprefix([old[start:][::-1], text.upper()[start:][::-1]]))
+        assert spliced.splice(start, len(old) - start - tail, text[start:len(text) - tail]) == count_js8_frames(text), text
+        assert counter.update(text) == count_js8_frames(text), text
+
+
+def test_frames_and_estimate_are_separate():
+    speed = JS8_SPEEDS['normal']
+    assert speed.frames("7" * 17) == 3
+    assert speed.estimate_frames(17) == 2
+    assert speed.tx_seconds("7" * 17) == 45
+    assert speed.estimate_tx_seconds(17) == 30
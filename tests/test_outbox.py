@@ -0,0 +1,186 @@
+from concurrent.futures import Future
+from datetime import datetime, timezone
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def outbox(frontend):
+    return frontend.Outbox()
+
+
+def routine(item):
+    return item['priority'] == 2  # Outbox.ROUTINE
+
+
+def test_bulletin_parts_are_linked(outbox):
+    items = outbox.put_bulletin(["1/3 A", "2/3 B", "3/3 C"], planned_slot=60, source='schedule')
+    assert [item['bulletin'] for item in items] == [items[0]['id']] * 3
+    assert [item['parts'] for item in items] == [3] * 3
+    assert [item['planned_slot'] for item in items] == [60, None, None]
+    assert [item['text'] for item in outbox.items()] == ["1/3 A", "2/3 B", "3/3 C"]
+
+
+def test_waiting_bulletin_is_cancelled_whole(outbox):
+    outbox.put_bulletin(["1/2 A", "2/2 B"])
+    outbox.put_bulletin(["SINGLE"])
+    removed = outbox.cancel(routine, whole_bulletins=True)
+    assert [item['text'] for item in removed] == ["1/2 A", "2/2 B", "SINGLE"]
+    assert len(outbox) == 0
+
+
+def test_started_bulletin_is_kept_whole(outbox):
+    outbox.put_bulletin(["1/3 A", "2/3 B", "3/3 C"])
+    outbox.put_bulletin(["1/2 D", "2/2 E"])
+    assert outbox.pop()['text'] == "1/3 A"
+    removed = outbox.cancel(routine, whole_bulletins=True)
+    assert [item['text'] for item in removed] == ["1/2 D", "2/2 E"]
+    assert [item['text'] for item in outbox.items()] == ["2/3 B", "3/3 C"]
+
+
+def test_partly_selected_bulletin_is_kept(outbox):
+    outbox.put_bulletin(["1/2 A", "2/2 B"])
+    assert outbox.cancel(lambda item: item['text'] == "1/2 A", whole_bulletins=True) == []
+    # Sans whole_bulletins, cancel() reste message par message
+    assert [item['text'] for item in outbox.cancel(lambda item: item['text'] == "1/2 A")] == ["1/2 A"]
+
+
+def test_message_stays_until_every_target_has_it(outbox):
+    item = outbox.put("HELLO", targets=[None, "20m"])
+    assert outbox.head() is item
+    assert not outbox.done(item, None)
+    assert outbox.head() is item
+    assert outbox.done(item, "20m")
+    assert outbox.head() is None
+
+
+def test_started_message_is_not_cancelled(outbox):
+    item = outbox.put("ROUTINE")
+    outbox.mark_started(item)
+    assert outbox.cancel(routine, whole_bulletins=True) == []
+
+
+class FakeRoot:
+    def after(self, ms, func=None):
+        pass
+
+
+@pytest.fixture
+def board(frontend, tmp_path):
+    """Tableau réduit à la file d'envoi: la remise est remplacée par des Future préparés"""
+    board = object.__new__(frontend.JS8BulletinBoard)
+    board.root = FakeRoot()
+    board.outbox = frontend.Outbox(str(tmp_path / "outbox.json"))
+    board.js8_client = object()
+    board.js8_connected = True
+    board.js8_endpoints = []
+    board.js8_speed = 'normal'
+    board._templates = {}
+    board.results = []
+    board._deliver_to = lambda target, text, speed, planned_slot=None: board.results.pop(0)
+    return board
+
+
+def delivery(error=None):
+    future = Future()
+    if error:
+        future.set_exception(error)
+    else:
+        future.set_result(True)
+    return future
+
+
+def test_failed_delivery_keeps_message(frontend, board):
+    item = board.outbox.put("URGENT", frontend.Outbox.EMERGENCY)
+    board.results = [delivery(ConnectionError("JS8Call closed the connection"))]
+    assert not board._deliver_item(item)
+    # Toujours en file, y compris dans le fichier relu au démarrage suivant
+    assert [queued['text'] for queued in frontend.Outbox(board.outbox.path).items()] == ["URGENT"]
+    board.results = [delivery()]
+    assert board._deliver_item(board.outbox.head())
+    assert len(board.outbox) == 0
+    assert frontend.Outbox(board.outbox.path).items() == []
+
+
+def test_disconnected_target_keeps_manual_message(board):
+    item = board.outbox.put("MANUAL", source='manual')
+    board.js8_connected = False
+    assert not board._deliver_item(item)
+    assert board.outbox.head() is item
+    assert not item.get('started')
+
+
+def test_disconnected_target_skips_scheduled_broadcast(board):
+    item = board.outbox.put("WX", source='schedule')
+    board.js8_connected = False
+    board.js8_client = type('Client', (), {'auto_reconnecting': True})()
+    assert board._deliver_item(item)
+    assert len(board.outbox) == 0
+
+
+def test_next_is_fixed_when_queued(board):
+    board._outbox_event = threading.Event()
+    board.update_outbox_status = lambda: None
+    board.sequence = 0
+    board.station_grid = ""
+    board.emission_active = True
+    board.next_emission = datetime(2026, 3, 1, 14, 45, tzinfo=timezone.utc)
+    board.queue_bulletin(["NEXT {NEXT}"])
+    # Le planning avance avant la remise: {NEXT} reste celui de la mise en file
+    board.next_emission = datetime(2026, 3, 1, 15, 0, tzinfo=timezone.utc)
+    sent = []
+    board._deliver_to = lambda target, text, speed, planned_slot=None: sent.append(text) or delivery()
+    assert board._deliver_item(board.outbox.head())
+    # Émissions arrêtées: aucune émission suivante à annoncer
+    board.emission_active = False
+    board.queue_bulletin(["NEXT {NEXT}"])
+    assert board._deliver_item(board.outbox.head())
+    assert sent == ["NEXT 1445Z", "NEXT NONE"]
+
+
+class FakeTxState:
+    def __init__(self, busy=False):
+        self.busy = busy
+        self.depth = 0
+
+    def idle_in(self):
+        return 15 if self.busy else 0
+
+
+class FakeClient:
+    connected = True
+
+    def __init__(self, busy=False):
+        self.tx_state = FakeTxState(busy)
+
+
+def test_busy_instance_does_not_hold_back_the_others(frontend, board):
+    board.tx_max_queue = 1
+    board.js8_client = FakeClient(busy=True)
+    endpoint = frontend.JS8Endpoint("20m")
+    endpoint.client = FakeClient()
+    board.js8_endpoints = [endpoint]
+    item = board.outbox.put("HELLO", targets=[None, "20m"])
+    assert not board.tx_busy()
+    # Seule l'instance libre reçoit le message; il attend l'instance principale
+    assert board._outbox_batch() == [(item, ["20m"])]
+    board.results = [delivery()]
+    assert not board._deliver_item(item, ["20m"])
+    assert board.outbox.next_for("20m") is None
+    assert board.outbox.next_for(None) is item
+    board.js8_client.tx_state.busy = False
+    assert board._outbox_batch() == [(item, [None])]
+
+
+def test_each_instance_gets_its_own_next_message(frontend, board):
+    board.tx_max_queue = 1
+    board.js8_client = FakeClient()
+    endpoint = frontend.JS8Endpoint("20m")
+    endpoint.client = FakeClient()
+    board.js8_endpoints = [endpoint]
+    first = board.outbox.put("FIRST", targets=[None, "20m"])
+    second = board.outbox.put("SECOND", targets=[None, "20m"])
+    board.outbox.done(first, "20m")
+    assert board._outbox_batch() == [(first, [None]), (second, ["20m"])]
+    assert board._outbox_batch(excluded={None}) == [(second, ["20m"])]
@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+import random
+import time
+
+from js8call_bbs_core import EmissionSchedule, load_timezone
+
+
+PERIODS = [600, 900, 1800, 3600, 7200, 10800, 14400, 21600, 43200, 86400, 7, 13 * 60 + 17]
+
+
+def test_next_timestamp_random():
+    """Prochaine émission postérieure, à moins d'une période et alignée sur la grille de l'époque"""
+    rng = random.Random(11)
+    for _ in range(1000000):
+        period = rng.choice(PERIODS)
+        offset = rng.randrange(-period, 2 * period)
+        timestamp = rng.uniform(0, 4102444800)
+        nxt = EmissionSchedule(period, offset).next_timestamp(timestamp)
+        assert timestamp < nxt <= timestamp + period, (period, offset, timestamp)
+        assert (nxt - offset) % period == 0, (period, offset, timestamp)
+
+
+def test_next_timestamp_reference():
+    """Comparaison avec un calcul pas à pas depuis l'époque"""
+    rng = random.Random(12)
+    for _ in range(2000):
+        period = rng.choice(PERIODS)
+        offset = rng.randrange(-period, 2 * period)
+        timestamp = rng.uniform(0, 4102444800)
+        schedule = EmissionSchedule(period, offset)
+        reference = offset % period + (int(timestamp) // period - 1) * period
+        while reference <= timestamp:
+            reference += period
+        following = schedule.next_timestamps(timestamp, 5)
+        assert following[0] == reference == schedule.next_timestamp(timestamp)
+        assert all(b - a == period for a, b in zip(following, following[1:]))
+
+
+def test_year_of_broadcasts():
+    """Un an d'émissions toutes les 10 minutes, sans énumérer la période"""
+    schedule = EmissionSchedule(600)
+    start = time.time()
+    year = schedule.timestamps_between(start, start + 365 * 86400)
+    assert len(year) == 365 * 144
+    assert list(year) == schedule.next_timestamps(start, len(year))
+
+
+def calendar_zones():
+    """Fuseaux à décalage fixe, plus trois fuseaux IANA si zoneinfo/tzdata est disponible"""
+    zones = [timezone.utc, timezone(timedelta(hours=5, minutes=30)), timezone(timedelta(hours=-3))]
+    for name in ('Europe/Paris', 'America/New_York', 'Australia/Sydney'):
+        zone = load_timezone(name)
+        if zone is not None:
+            zones.append(zone)
+    return zones
+
+
+def test_daylight_saving_and_year_boundaries():
+    """Autour des changements d'heure 2026 et des 31 décembre: espacement exact en UTC,
+    heures paires/impaires en UTC, autant d'émissions par 24 h, next_after() indépendant du fuseau"""
+    zones = calendar_zones()
+    moments = [datetime(2026, 12, 31, 12, tzinfo=timezone.utc), datetime(2027, 12, 31, 12, tzinfo=timezone.utc),
+               datetime(2028, 2, 28, 12, tzinfo=timezone.utc)]
+    year_start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for zone in zones:
+        previous = year_start.astimezone(zone).utcoffset()
+        for hour in range(1, 366 * 24):
+            moment = year_start + timedelta(hours=hour)
+            offset = moment.astimezone(zone).utcoffset()
+            if offset != previous:
+                moments.append(moment)
+                previous = offset
+    
+    failures = []
+    for moment in moments:
+        start = (moment - timedelta(days=1)).timestamp()
+        for interval in ['10', '15', '60', '180', 'even', 'odd', '1440']:
+            for offset in (0, 300):
+                schedule = EmissionSchedule.from_interval(interval, offset)
+                times = schedule.timestamps_between(start, start + 2 * 86400)
+                instants = [datetime.fromtimestamp(t, timezone.utc) for t in times]
+                label = f"{moment:%Y-%m-%d %H:%M} UTC interval={interval} offset={offset}"
+                if any(b - a != timedelta(seconds=schedule.period) for a, b in zip(instants, instants[1:])):
+                    failures.append(f"{label}: uneven spacing")
+                if interval in ('even', 'odd') and offset == 0:
+                    parity = 0 if interval == 'even' else 1
+                    if any(i.hour % 2 != parity or i.minute for i in instants):
+                        failures.append(f"{label}: {interval} hours not {interval} in UTC")
+                first_day = sum(1 for t in times if t <= start + 86400)
+                if first_day != len(times) - first_day:
+                    failures.append(f"{label}: {first_day} then {len(times) - first_day} broadcasts per 24 h")
+                for zone in zones:
+                    if schedule.next_after(moment.astimezone(zone)).timestamp() != schedule.next_after(moment).timestamp():
+                        failures.append(f"{label}: next_after differs in {zone}")
+                        break
+    assert not failures, failures[:10]
+
+
+def test_new_year_is_on_the_grid():
+    """Minuit UTC le 1er janvier est une émission"""
+    for year in (2027, 2028):
+        midnight = datetime(year, 1, 1, tzinfo=timezone.utc)
+        for interval in ('10', '60', 'even', '1440'):
+            schedule = EmissionSchedule.from_interval(interval)
+            assert schedule.next_after(midnight - timedelta(seconds=1)) == midnight, (year, interval)
@@ -0,0 +1,26 @@
+from js8call_bbs_core import TEMPLATE_FIELDS, BulletinTemplate
+
+
+def test_fields_are_rendered_in_place():
+    template = BulletinTemplate("@ALLCALL WX {SEQ} {UTC} DE {GRID}")
+    assert template.fields == {'SEQ', 'UTC', 'GRID'}
+    assert template.unknown == template.miscased == []
+    values = {'SEQ': 42, 'UTC': '1430Z', 'GRID': 'JN18EUXX'}
+    assert template.render(values) == "@ALLCALL WX 42 1430Z DE JN18EU"
+    assert template.max_length >= len(template.render(values))
+
+
+def test_miscased_fields_are_reported():
+    template = BulletinTemplate("WX {utc} DE {Grid} {NEXT}")
+    assert template.miscased == ["{utc}", "{Grid}"]
+    assert template.unknown == []
+    assert template.fields == {'NEXT'}
+    # Laissés tels quels: jamais remplacés à moitié
+    assert template.render({'NEXT': '1445Z'}) == "WX {utc} DE {Grid} 1445Z"
+
+
+def test_unknown_fields_any_case():
+    template = BulletinTemplate("{FOO} {bar} {SEQ}")
+    assert template.unknown == ["{FOO}", "{bar}"]
+    assert template.miscased == []
+    assert set(TEMPLATE_FIELDS) >= template.fields
@@ -0,0 +1,141 @@
+"""Suivi des modifications du widget texte sur un vrai widget Tk.
+
+Nécessite un affichage: ignoré sinon (lancer par exemple sous xvfb-run).
+"""
+
+import tkinter as tk
+
+import pytest
+
+from js8call_bbs_core import JS8FrameCounter, count_js8_frames, split_bulletin
+
+
+@pytest.fixture
+def board(frontend):
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("pas d'affichage (lancer sous xvfb-run)")
+    root.withdraw()
+    # Seul l'éditeur est construit: pas de fenêtre complète ni de connexion
+    app = object.__new__(frontend.JS8BulletinBoard)
+    app.root = root
+    app.max_chars = 160
+    app.max_parts = 10
+    app.text_length = 0
+    app.char_count = 0
+    app.frame_counter = JS8FrameCounter()
+    app._split = (None, None, None)
+    app._part_frames = {}
+    app.text_area = tk.Text(root, undo=True)
+    app.text_area.tag_configure('unsupported')
+    app._hook_text_edits()
+    yield app
+    root.destroy()
+
+
+def unsupported(widget):
+    ranges = widget.tag_ranges('unsupported')
+    return [widget.get(ranges[i], ranges[i + 1]) for i in range(0, len(ranges), 2)]
+
+
+def test_emoji_highlight_uses_tk_ranges(board):
+    widget = board.text_area
+    widget.insert("1.0", "AB\U0001F600CD")
+    widget.insert("end-1c", " EéF")
+    assert unsupported(widget) == ["\U0001F600", "é"]
+    widget.delete("1.0")
+    assert unsupported(widget) == ["\U0001F600", "é"]
+
+
+def assert_counts(board):
+    text = board.text_area.get("1.0", "end-1c")
+    assert board.text_length == len(text)
+    assert board.char_count == len(text.strip())
+    assert board.frame_counter.frames == count_js8_frames(text)
+
+
+def test_counts_follow_edits(board):
+    widget = board.text_area
+    widget.insert("1.0", "HELLO WORLD")
+    widget.insert("1.5", " THERE")
+    widget.delete("1.0", "1.6")
+    widget.replace("1.0", "1.5", "BIG")
+    assert_counts(board)
+    widget.edit_undo()
+    assert_counts(board)
+
+
+def test_counts_after_emoji_and_margins(board):
+    widget = board.text_area
+    widget.insert("1.0", "  \U0001F600 CQ CQ\n")
+    widget.insert("1.5", "straße ")
+    widget.insert("end-1c", "DE F4ABC  ")
+    assert_counts(board)
+    # Positions Tk après l'emoji: la suppression touche le bon caractère
+    widget.delete("1.4")
+    assert_counts(board)
+    assert widget.get("1.0", "end-1c").strip().startswith("\U0001F600 traße")
+
+
+def test_tcl_errors_reach_the_caller(board):
+    widget = board.text_area
+    widget.insert("1.0", "HELLO")
+    # Sans sélection, sel.first n'existe pas: l'erreur remonte comme sans le hook
+    with pytest.raises(tk.TclError):
+        widget.delete("sel.first", "sel.last")
+    assert board.root.tk.eval(f"catch {{{widget._w} delete sel.first sel.last}}") == '1'
+    assert widget.get("1.0", "end-1c") == "HELLO"
+
+
+def test_guard_truncates_insertions(board):
+    board.max_chars = 10
+    board.max_parts = 1
+    widget = board.text_area
+    widget.insert("1.0", "0123456789ABCDEF")
+    assert widget.get("1.0", "end-1c") == "0123456789"
+    assert board.char_count == 10
+
+
+def test_loaded_message_warns_when_truncated(frontend, board, monkeypatch):
+    warnings = []
+    monkeypatch.setattr(frontend.messagebox, 'showwarning', lambda title, text: warnings.append(text))
+    board.max_chars = 10
+    board.max_parts = 1
+    board._load_message("0123456789ABCDEF")
+    assert board.text_area.get("1.0", "end-1c") == "0123456789"
+    assert len(warnings) == 1 and "(16 → 10)" in warnings[0]
+    board._load_message("SHORT")
+    assert len(warnings) == 1
+
+
+def test_guard_counts_parts_like_the_splitter(board):
+    board.max_chars = 20
+    board.max_parts = 3
+    widget = board.text_area
+    widget.insert("1.0", "@ALLCALL " + "WORD " * 30)
+    text = widget.get("1.0", "end-1c")
+    assert len(split_bulletin(text, 20)) == 3
+    widget.insert("end-1c", "X")
+    assert len(split_bulletin(widget.get("1.0", "end-1c"), 20)) == 3
+
+
+def test_disabled_widget_keeps_counts(board):
+    widget = board.text_area
+    widget.insert("1.0", "HELLO")
+    widget.config(state=tk.DISABLED)
+    widget.insert("end-1c", " WORLD")
+    widget.delete("1.0", "1.2")
+    assert widget.get("1.0", "end-1c") == "HELLO"
+    assert_counts(board)
+    widget.config(state=tk.NORMAL)
+    widget.insert("end-1c", "!")
+    assert_counts(board)
+
+
+def test_python_offsets_map_to_tk_indices(board):
+    widget = board.text_area
+    text = "\U0001F600 PLEASE QSL"
+    widget.insert("1.0", text)
+    start = text.index("PLEASE")
+    assert widget.get(board._tk_index(text, start), board._tk_index(text, start + 6)) == "PLEASE"
@@ -0,0 +1,203 @@
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import json
+import queue
+import socket
+import threading
+import time
+
+import pytest
+
+from js8call_bbs_core import JS8LineParser, decode_js8_event
+
+
+def test_line_split_across_reads():
+    parser = JS8LineParser()
+    assert parser.feed(b'{"type":"RIG.FREQ",') == []
+    assert parser.feed(b'"params":{"DIAL":7078000}}\n{"type":"RIG') == [
+        {'type': 'RIG.FREQ', 'params': {'DIAL': 7078000}}
+    ]
+    assert parser.feed(b'.PTT","value":"on"}\n') == [{'type': 'RIG.PTT', 'value': 'on'}]
+
+
+def test_oversized_line_is_discarded_until_newline():
+    parser = JS8LineParser(max_line=32)
+    assert parser.feed(b'{"type":"RX.ACTIVITY","value":"' + b'X' * 40) == []
+    assert parser.dropped == 1
+    # Suite de la ligne abandonnée ignorée, la ligne suivante est lue normalement
+    assert parser.feed(b'X' * 40 + b'"}\n{"type":"OK"}\n') == [{'type': 'OK'}]
+    # Ligne trop longue arrivée d'un seul bloc
+    assert parser.feed(b'{"value":"' + b'X' * 40 + b'"}\n{"type":"OK"}\n') == [{'type': 'OK'}]
+    assert parser.dropped == 2
+
+
+def test_buffer_stays_bounded_without_newline():
+    parser = JS8LineParser(max_line=64)
+    for _ in range(100):
+        assert parser.feed(b'X' * 48) == []
+        assert len(parser._buffer) <= parser.max_line
+    assert parser.feed(b'\n{"type":"OK"}\n') == [{'type': 'OK'}]
+
+
+def test_invalid_json_is_dropped():
+    parser = JS8LineParser()
+    assert parser.feed(b'not json\n[1, 2]\n\n{"type":"OK"}\n') == [{'type': 'OK'}]
+    assert parser.dropped == 1
+
+
+class FakeTransport:
+    """Transport sans socket: receive() rend les lots préparés, send() les enregistre"""
+
+    def __init__(self):
+        self.incoming = queue.Queue()
+        self.sent = []
+
+    def receive(self):
+        try:
+            messages = self.incoming.get(timeout=0.05)
+        except queue.Empty:
+            return []
+        if isinstance(messages, Exception):
+            raise messages
+        return messages
+
+    def send(self, payloads, on_sent, deadline):
+        for index, payload in enumerate(payloads):
+            self.sent.append(json.loads(payload))
+            on_sent(index)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client(frontend):
+    """Client relié à un FakeTransport, sans thread de connexion ni ping"""
+    client = frontend.JS8CallClient()
+    transport = FakeTransport()
+    client.transport = transport
+    client.connected = True
+    yield client
+    client.disconnect()
+
+
+def test_reader_thread_dispatches_events(client):
+    received = []
+    seen = threading.Event()
+    client.subscribe(lambda event: received.append(event) or seen.set(), types=['RIG.'])
+    client._start_reader(client.transport)
+    client.transport.incoming.put([
+        {'type': 'RX.ACTIVITY', 'value': 'CQ'},
+        {'type': 'RIG.PTT', 'value': 'on', 'params': {'PTT': True}},
+    ])
+    assert seen.wait(2)
+    assert [(event.type, event.ptt) for event in received] == [('RIG.PTT', True)]
+    assert client.tx_state.busy
+
+
+def test_reader_thread_reports_lost_connection(client):
+    lost = threading.Event()
+    client.on_connection_lost = lambda c: lost.set()
+    request = client.request('STATION.GET_CALLSIGN', response_type='STATION.CALLSIGN')
+    client._start_reader(client.transport)
+    client.transport.incoming.put(ConnectionError('EOF'))
+    assert lost.wait(2)
+    assert not client.connected
+    # Requête en attente: échoue tout de suite au lieu d'attendre son délai
+    with pytest.raises(ConnectionError):
+        request.result(2)
+
+
+def test_response_is_matched_by_id_and_type(client):
+    threading.Thread(target=client._writer_loop, args=(client.transport,), daemon=True).start()
+    first = client.request('STATION.GET_CALLSIGN', response_type='STATION.CALLSIGN')
+    second = client.request('RIG.GET_FREQ', response_type='RIG.FREQ')
+    with pytest.raises(FutureTimeoutError):
+        first.result(0.2)
+    first_id, second_id = (command['params']['_ID'] for command in client.transport.sent)
+    assert first_id != second_id
+    # Événement spontané, puis réponse d'un autre type portant le même _ID: ignorés
+    for message in [
+        {'type': 'STATION.CALLSIGN', 'value': 'F4XYZ'},
+        {'type': 'RIG.FREQ', 'params': {'_ID': first_id, 'DIAL': 14078000}},
+    ]:
+        client._dispatch(decode_js8_event(message))
+    assert not first.done()
+    for message in [
+        {'type': 'RIG.FREQ', 'params': {'_ID': second_id, 'DIAL': 7078000}},
+        {'type': 'STATION.CALLSIGN', 'value': 'F4ABC', 'params': {'_ID': first_id}},
+    ]:
+        client._dispatch(decode_js8_event(message))
+    assert first.result(1).value == 'F4ABC'
+    assert second.result(1).dial == 7078000
+    assert client._requests == {}
+
+
+def test_unanswered_request_times_out(client):
+    threading.Thread(target=client._writer_loop, args=(client.transport,), daemon=True).start()
+    request = client.request('TX.GET_TEXT', response_type='TX.TEXT', timeout=0.01)
+    with pytest.raises(FutureTimeoutError):
+        request.result(0.1)
+    client._expire_requests()
+    assert request.done()
+    assert isinstance(request.exception(), TimeoutError)
+    assert client._requests == {}
+
+
+class PartialSocket:
+    """Socket dont send() n'écrit que quelques octets, avec un EAGAIN de temps en temps"""
+
+    def __init__(self, chunk=5, stall_every=3):
+        self.chunk = chunk
+        self.stall_every = stall_every
+        self.calls = 0
+        self.data = bytearray()
+
+    def send(self, data):
+        self.calls += 1
+        if self.stall_every and self.calls % self.stall_every == 0:
+            raise BlockingIOError
+        written = bytes(data[:self.chunk])
+        self.data += written
+        return len(written)
+
+    def close(self):
+        pass
+
+
+def test_partial_send_writes_every_byte_in_order(frontend):
+    transport = frontend.TcpTransport('127.0.0.1', 2442)
+    transport.sock = PartialSocket()
+    payloads = [b'{"type":"MODE.SET_SPEED"}\n', b'{"type":"TX.SEND_MESSAGE","value":"CQ"}\n']
+    written_at = []
+    transport.send(payloads, lambda index: written_at.append((index, len(transport.sock.data))), time.monotonic() + 5)
+    assert bytes(transport.sock.data) == b''.join(payloads)
+    # Chaque commande n'est signalée qu'une fois entièrement écrite
+    assert [index for index, _ in written_at] == [0, 1]
+    assert written_at[0][1] >= len(payloads[0])
+    assert written_at[1][1] == len(payloads[0]) + len(payloads[1])
+
+
+def test_stalled_send_times_out(frontend):
+    transport = frontend.TcpTransport('127.0.0.1', 2442)
+    transport.sock = PartialSocket(stall_every=1)
+    with pytest.raises(socket.timeout):
+        transport.send([b'{"type":"PING"}\n'], lambda index: None, time.monotonic() + 0.05)
+
+
+def test_writer_loop_delivers_commands_over_partial_sends(frontend):
+    client = frontend.JS8CallClient()
+    transport = frontend.TcpTransport('127.0.0.1', 2442)
+    transport.sock = sock = PartialSocket(chunk=7)
+    client.transport = transport
+    client.connected = True
+    threading.Thread(target=client._writer_loop, args=(transport,), daemon=True).start()
+    try:
+        futures = client.send_commands([client.speed_command('fast'), client.message_command("CQ CQ DE F4ABC")])
+        futures += client.send_commands([client.frequency_command(7078000)])
+        assert [future.result(2) for future in futures] == [True, True, True]
+    finally:
+        client.disconnect()
+    commands = [json.loads(line) for line in bytes(sock.data).splitlines()]
+    assert [command['type'] for command in commands] == ['MODE.SET_SPEED', 'TX.SEND_MESSAGE', 'RIG.SET_FREQ']
+    assert commands[1]['value'] == "CQ CQ DE F4ABC"
+    assert len({command['params']['_ID'] for command in commands}) == 3